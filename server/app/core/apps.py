@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """데이터 버전 공유 캐시 확인 (프로세스 로컬 캐시면 기동 실패)"""
+        from .data_version import ensure_shared_cache
+        ensure_shared_cache()
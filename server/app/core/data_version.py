@@ -0,0 +1,91 @@
+"""
+공유 캐시 기반 데이터 버전 토큰
+
+데이터가 변경될 때마다 버전 토큰을 갱신하여 모든 워커/파드가
+인메모리 인덱스 재구축, ETag 변경 시점을 판단할 수 있도록 함
+(레시피 데이터, 광고 설정 등 리소스마다 캐시 키 하나)
+
+- 토큰은 공유 캐시(CACHES['default'])에 저장 (프로세스 로컬 캐시면 기동 시 오류)
+- 프로세스는 읽은 토큰을 DATA_VERSION_CHECK_INTERVAL초 동안 기억 (요청마다 캐시를 조회하지 않음)
+  → 다른 워커의 변경은 최대 그 시간만큼 늦게 반영, 자신의 변경은 즉시 반영
+"""
+
+import threading
+import time
+import uuid
+from typing import Optional, Tuple
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+
+# 워커 간 공유되지 않는 캐시 백엔드
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.filebased.FileBasedCache',
+)
+
+
+def ensure_shared_cache():
+    """기본 캐시가 프로세스 로컬 백엔드면 ImproperlyConfigured (워커마다 데이터 버전이 달라짐)"""
+    backend = settings.CACHES['default']['BACKEND']
+    if backend in PROCESS_LOCAL_CACHE_BACKENDS:
+        raise ImproperlyConfigured(
+            f'CACHES["default"]가 프로세스 로컬 백엔드({backend})입니다. '
+            '데이터 버전을 워커/파드 간 공유하려면 DatabaseCache 또는 RedisCache를 사용하세요.'
+        )
+
+
+def _new_version() -> str:
+    """새 버전 토큰 생성 (비교는 동일성만 사용)"""
+    return uuid.uuid4().hex
+
+
+class DataVersion:
+    """캐시 키 하나에 저장되는 데이터 버전 토큰"""
+
+    def __init__(self, cache_key: str):
+        self.cache_key = cache_key
+        # (토큰, 확인 시각) - 프로세스별
+        self._local: Optional[Tuple[str, float]] = None
+        self._lock = threading.Lock()
+
+    def _remember(self, version: str):
+        self._local = (version, time.monotonic())
+
+    def get(self) -> str:
+        """
+        현재 버전 조회
+
+        캐시에 버전이 없으면(최초 기동, 캐시 eviction) 새 토큰을 등록
+        """
+        local = self._local
+        interval = getattr(settings, 'DATA_VERSION_CHECK_INTERVAL', 1.0)
+        if local is not None and time.monotonic() - local[1] < interval:
+            return local[0]
+
+        with self._lock:
+            version = cache.get(self.cache_key)
+            if version is None:
+                version = _new_version()
+                if not cache.add(self.cache_key, version, timeout=None):
+                    version = cache.get(self.cache_key, version)
+            self._remember(version)
+            return version
+
+    def _set_new_version(self):
+        """버전 토큰 교체"""
+        version = _new_version()
+        cache.set(self.cache_key, version, timeout=None)
+        self._remember(version)
+
+    def bump(self):
+        """
+        버전 갱신
+
+        즉시 한 번, 트랜잭션 커밋 후 한 번 더 갱신
+        (커밋 전에 다른 프로세스가 이전 데이터로 인덱스를 재구축하는 경우 방지)
+        """
+        self._set_new_version()
+        transaction.on_commit(self._set_new_version)
@@ -0,0 +1,50 @@
+"""
+HTTP 조건부 요청 (ETag / If-None-Match) 처리
+
+자주 바뀌지 않는 카탈로그 응답(카테고리, 재료 목록, 레시피 상세, 광고 설정)에
+리소스별 데이터 버전으로 만든 강한 ETag와 Cache-Control 헤더를 붙이고,
+If-None-Match가 현재 ETag와 일치하면 ORM 조회/직렬화 없이 304 응답
+
+ETag는 데이터 버전 토큰(캐시 조회)과 요청 조건으로만 계산하므로 304 경로에서는 DB를 조회하지 않음
+"""
+
+import hashlib
+from typing import Optional
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+
+def make_etag(resource: str, version: str, *params) -> str:
+    """리소스 이름/데이터 버전/요청 조건으로 강한 ETag 생성 (따옴표 포함)"""
+    key = '\x1f'.join([resource, version, *(str(param) for param in params)])
+    return '"%s"' % hashlib.sha1(key.encode()).hexdigest()
+
+
+def cache_control() -> str:
+    """카탈로그 응답 Cache-Control 헤더 값"""
+    max_age = getattr(settings, 'CATALOG_CACHE_MAX_AGE', 60)
+    return f'public, max-age={max_age}'
+
+
+def set_cache_headers(response: HttpResponse, etag: str):
+    """응답에 ETag/Cache-Control 헤더 설정"""
+    response['ETag'] = etag
+    response['Cache-Control'] = cache_control()
+
+
+def not_modified(request, etag: str) -> Optional[HttpResponse]:
+    """
+    If-None-Match가 ETag와 일치하면 304 응답 (아니면 None)
+
+    If-None-Match는 약한 비교 (W/ 접두사 무시, "*"는 항상 일치)
+    """
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return None
+    etags = parse_etags(header)
+    if '*' in etags or etag in (tag.removeprefix('W/') for tag in etags):
+        response = HttpResponseNotModified()
+        set_cache_headers(response, etag)
+        return response
+    return None
@@ -0,0 +1,45 @@
+"""
+공유 캐시 데이터 버전 테스트
+"""
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+from core.data_version import DataVersion, ensure_shared_cache
+
+
+class DataVersionTest(TestCase):
+    """워커 간 데이터 버전 공유 테스트 (DataVersion 인스턴스 = 워커 하나)"""
+
+    def test_bump_visible_to_other_workers(self):
+        worker1 = DataVersion('test:data_version')
+        worker2 = DataVersion('test:data_version')
+        with override_settings(DATA_VERSION_CHECK_INTERVAL=0):
+            version = worker1.get()
+            self.assertEqual(worker2.get(), version)
+
+            worker1.bump()
+            self.assertNotEqual(worker1.get(), version)
+            self.assertEqual(worker2.get(), worker1.get())
+
+    def test_remembered_within_interval(self):
+        """확인 간격 안에서는 공유 캐시를 다시 조회하지 않음, 자신의 변경은 즉시 반영"""
+        worker1 = DataVersion('test:data_version')
+        worker2 = DataVersion('test:data_version')
+        with override_settings(DATA_VERSION_CHECK_INTERVAL=3600):
+            version = worker2.get()
+            worker1.bump()
+            with self.assertNumQueries(0):
+                self.assertEqual(worker2.get(), version)
+                self.assertNotEqual(worker1.get(), version)
+
+
+class SharedCacheCheckTest(TestCase):
+    """공유 캐시 백엔드 확인 테스트"""
+
+    def test_database_cache_allowed(self):
+        ensure_shared_cache()
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            ensure_shared_cache()
@@ -9,8 +9,12 @@ from django.utils.html import format_html
 from django.urls import path
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from .models import Recipe, Ingredient, NormalizedIngredient, Fridge, FridgeIngredient, IngredientCategory, RecommendationSettings
+from .models import Recipe, Ingredient, IngredientAlias, NormalizedIngredient, Fridge, FridgeIngredient, IngredientCategory, RecommendationSettings
+from .text_search import ngram_query
 from .services.csv_import import import_csv_file
+from .services.data_version import bump_data_version
+from .services.recipe_signature import refresh_signatures_containing
+from .services.result_cache import recommendation_cache
 
 
 class IngredientInline(admin.TabularInline):
@@ -82,7 +86,7 @@ class RecipeAdmin(admin.ModelAdmin):
     list_filter = ('difficulty', 'method', 'situation', 'recipe_type', HasAllNormalizedIngredientsFilter, LowIngredientCountFilter, 'created_at')
     search_fields = ('name', 'title', 'introduction', 'recipe_sno')
     ordering = ('-created_at',)
-    readonly_fields = ('created_at', 'updated_at', 'views', 'recommendations', 'scraps', 'image_preview', 'recipe_sno', 'get_recipe_link', 'get_ingredient_count', 'get_essential_count', 'get_seasoning_count')
+    readonly_fields = ('created_at', 'updated_at', 'views', 'recommendations', 'scraps', 'image_preview', 'recipe_sno', 'get_recipe_link', 'get_ingredient_count', 'get_essential_count', 'get_seasoning_count', 'cooking_minutes', 'servings_count', 'difficulty_level')
 
     actions = ['validate_recipe_ingredients', 'export_recipe_with_ingredients']
 
@@ -91,7 +95,8 @@ class RecipeAdmin(admin.ModelAdmin):
             'fields': ('recipe_sno', 'name', 'title', 'introduction', 'image_url', 'image_preview', 'recipe_url', 'get_recipe_link')
         }),
         ('조리 정보', {
-            'fields': ('servings', 'difficulty', 'cooking_time', 'method', 'situation')
+            'fields': ('servings', 'difficulty', 'cooking_time', 'method', 'situation',
+                       'servings_count', 'difficulty_level', 'cooking_minutes')
         }),
         ('분류', {
             'fields': ('ingredient_type', 'recipe_type')
@@ -120,6 +125,16 @@ class RecipeAdmin(admin.ModelAdmin):
             essential_count=Count('ingredients', filter=models.Q(ingredients__is_essential=True), distinct=True)
         )
 
+    def get_search_results(self, request, queryset, search_term):
+        """제목/이름/소개는 n-gram 전문 검색(GIN 인덱스), 레시피 번호는 정확히 일치"""
+        search_query = ngram_query(search_term)
+        if search_query is None:
+            return super().get_search_results(request, queryset, search_term)
+        queryset = queryset.filter(
+            models.Q(search_vector=search_query) | models.Q(recipe_sno=search_term.strip())
+        )
+        return queryset, False
+
     def get_ingredient_count(self, obj):
         """전체 재료 수"""
         if hasattr(obj, 'ingredient_count'):
@@ -497,6 +512,7 @@ class IngredientAdmin(admin.ModelAdmin):
             else:
                 # 자동 연결 없이 normalized_name만 업데이트
                 updated_count = queryset.update(normalized_name=new_normalized_name)
+                bump_data_version()
 
                 self.message_user(
                     request,
@@ -595,6 +611,7 @@ class IngredientAdmin(admin.ModelAdmin):
     def mark_as_essential(self, request, queryset):
         """선택한 재료를 필수 재료로 표시"""
         updated = queryset.update(is_essential=True)
+        bump_data_version()
         self.message_user(
             request,
             f'{updated}개 재료를 필수 재료로 표시했습니다.',
@@ -605,6 +622,7 @@ class IngredientAdmin(admin.ModelAdmin):
     def mark_as_optional(self, request, queryset):
         """선택한 재료를 선택 재료로 표시"""
         updated = queryset.update(is_essential=False)
+        bump_data_version()
         self.message_user(
             request,
             f'{updated}개 재료를 선택 재료로 표시했습니다.',
@@ -617,6 +635,7 @@ class IngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='essential', category_type='ingredient').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 필수 재료로 변경했습니다.',
@@ -631,6 +650,7 @@ class IngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='seasoning', category_type='ingredient').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 조미료로 변경했습니다.',
@@ -645,6 +665,7 @@ class IngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='optional', category_type='ingredient').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 선택 재료로 변경했습니다.',
@@ -669,6 +690,16 @@ class NormalizedIngredientInline(admin.TabularInline):
     verbose_name_plural = "관련 재료 목록"
 
 
+class IngredientAliasInline(admin.TabularInline):
+    """NormalizedIngredient에서 별칭 관리"""
+
+    model = IngredientAlias
+    extra = 0
+    fields = ('alias',)
+    verbose_name = "별칭"
+    verbose_name_plural = "별칭 목록"
+
+
 class HasIngredientsFilter(admin.SimpleListFilter):
     """Ingredient가 연결된 항목만 필터링"""
     title = '관련 재료 여부'
@@ -756,7 +787,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         }),
     )
 
-    inlines = [NormalizedIngredientInline]
+    inlines = [IngredientAliasInline, NormalizedIngredientInline]
 
     def get_queryset(self, request):
         """관련 Ingredient 개수 및 사용 횟수 최적화"""
@@ -833,8 +864,13 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         for ingredient in to_merge:
             # 관련 Ingredient들의 normalized_ingredient를 primary로 변경
             ingredient.ingredients.all().update(normalized_ingredient=primary)
+            # 별칭도 primary로 옮기고, 병합 대상 이름은 primary의 별칭으로 유지
+            ingredient.aliases.all().update(normalized_ingredient=primary)
             # 병합 대상 삭제
             ingredient.delete()
+            IngredientAlias.objects.update_or_create(
+                alias=ingredient.name, defaults={'normalized_ingredient': primary}
+            )
 
         self.message_user(
             request,
@@ -845,7 +881,10 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
     @admin.action(description='범용 조미료로 표시')
     def mark_as_common_seasoning(self, request, queryset):
         """선택한 재료를 범용 조미료로 표시"""
+        normalized_ids = list(queryset.values_list('id', flat=True))
         updated = queryset.update(is_common_seasoning=True)
+        bump_data_version()
+        refresh_signatures_containing(normalized_ids)
         self.message_user(
             request,
             f'{updated}개 재료를 범용 조미료로 표시했습니다.',
@@ -855,7 +894,10 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
     @admin.action(description='범용 조미료 표시 해제')
     def unmark_as_common_seasoning(self, request, queryset):
         """범용 조미료 표시 해제"""
+        normalized_ids = list(queryset.values_list('id', flat=True))
         updated = queryset.update(is_common_seasoning=False)
+        bump_data_version()
+        refresh_signatures_containing(normalized_ids)
         self.message_user(
             request,
             f'{updated}개 재료의 범용 조미료 표시를 해제했습니다.',
@@ -893,6 +935,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='meat', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 육류로 변경했습니다.',
@@ -907,6 +950,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='vegetable', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 채소류로 변경했습니다.',
@@ -921,6 +965,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='seafood', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 해산물로 변경했습니다.',
@@ -935,6 +980,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='seasoning', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 조미료로 변경했습니다.',
@@ -949,6 +995,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='grain', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 곡물로 변경했습니다.',
@@ -963,6 +1010,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='dairy', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 유제품로 변경했습니다.',
@@ -977,6 +1025,7 @@ class NormalizedIngredientAdmin(admin.ModelAdmin):
         category = IngredientCategory.objects.filter(code='etc', category_type='normalized').first()
         if category:
             updated = queryset.update(category=category)
+            bump_data_version()
             self.message_user(
                 request,
                 f'{updated}개 재료의 카테고리를 기타로 변경했습니다.',
@@ -1002,6 +1051,27 @@ class FridgeIngredientInline(admin.TabularInline):
     verbose_name_plural = "냉장고 재료 목록"
 
 
+@admin.register(IngredientAlias)
+class IngredientAliasAdmin(admin.ModelAdmin):
+    """IngredientAlias Admin"""
+
+    list_display = ('alias', 'normalized_ingredient', 'updated_at')
+    search_fields = ('alias', 'normalized_ingredient__name')
+    ordering = ('alias',)
+    readonly_fields = ('created_at', 'updated_at')
+    autocomplete_fields = ['normalized_ingredient']
+
+    fieldsets = (
+        ('별칭 정보', {
+            'fields': ('alias', 'normalized_ingredient')
+        }),
+        ('시스템 정보', {
+            'fields': ('created_at', 'updated_at'),
+            'classes': ('collapse',)
+        }),
+    )
+
+
 @admin.register(Fridge)
 class FridgeAdmin(admin.ModelAdmin):
     """Fridge Admin"""
@@ -1211,15 +1281,16 @@ class IngredientCategoryAdmin(admin.ModelAdmin):
 class RecommendationSettingsAdmin(admin.ModelAdmin):
     """RecommendationSettings Admin - 레시피 추천 설정 관리"""
 
-    list_display = ('get_limit_display', 'min_match_rate', 'default_algorithm', 'exclude_seasonings_default', 'updated_at')
-    readonly_fields = ('updated_at', 'get_algorithm_explanation')
+    list_display = ('get_limit_display', 'min_match_rate', 'default_algorithm', 'scoring_mode', 'exclude_seasonings_default', 'updated_at')
+    readonly_fields = ('updated_at', 'get_algorithm_explanation', 'get_cache_stats')
 
     fieldsets = (
         ('📊 추천 알고리즘 설정', {
-            'fields': ('default_algorithm', 'get_algorithm_explanation', 'min_match_rate'),
+            'fields': ('default_algorithm', 'get_algorithm_explanation', 'min_match_rate', 'scoring_mode'),
             'description': (
                 '<strong>레시피 추천 API의 기본 알고리즘 및 최소 매칭률 설정</strong><br>'
-                '사용자가 API 호출 시 알고리즘을 지정하지 않으면 여기 설정된 값을 사용합니다.'
+                '사용자가 API 호출 시 알고리즘을 지정하지 않으면 여기 설정된 값을 사용합니다.<br>'
+                '• <strong>점수 계산 방식</strong>: 인메모리 인덱스(빠름) 또는 DB 집계(워커 메모리 절약)'
             )
         }),
         ('🎯 기본 추천 옵션', {
@@ -1231,11 +1302,21 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
             )
         }),
         ('🕐 시스템 정보', {
-            'fields': ('updated_at',),
+            'fields': ('updated_at', 'get_cache_stats'),
             'classes': ('collapse',)
         }),
     )
 
+    def get_cache_stats(self, obj):
+        """추천 결과 캐시 통계 표시 (현재 관리자 요청을 처리한 프로세스 기준)"""
+        stats = recommendation_cache.stats()
+        return format_html(
+            '항목 {} / {}개 · 적중 {}회 · 미스 {}회 · 적중률 {}% · 제거 {}회',
+            stats['entries'], stats['max_entries'], stats['hits'], stats['misses'],
+            round(stats['hit_rate'] * 100, 1), stats['evictions']
+        )
+    get_cache_stats.short_description = '추천 결과 캐시'
+
     def get_algorithm_explanation(self, obj):
         """알고리즘 설명 표시 (두 알고리즘 모두 표시)"""
         return format_html(
@@ -1244,7 +1325,7 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
 
             # Jaccard 설명
             '<div style="background: #f0f8ff; padding: 15px; border-left: 4px solid #2196F3; margin: 15px 0; border-radius: 4px;">'
-            '<h3 style="margin-top: 0; color: #1976D2;">🔵 Jaccard (자카드 유사도) - 현재 권장</h3>'
+            '<h3 style="margin-top: 0; color: #1976D2;">🔵 Jaccard (자카드 유사도)</h3>'
             '<p><strong>📐 계산 방식:</strong> 교집합 / 합집합</p>'
             '<p><strong>📝 수식:</strong> <code>|매칭된 재료| / |전체 재료(사용자 + 레시피 - 중복)|</code></p>'
             '<p><strong>📊 예시:</strong></p>'
@@ -1255,7 +1336,7 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
             '<li><strong>→ 유사도: 2 / 5 = 0.4 (40%)</strong></li>'
             '</ul>'
             '<p><strong>✅ 장점:</strong> 직관적이고 이해하기 쉬움. 재료가 얼마나 겹치는지 명확하게 표현</p>'
-            '<p><strong>⚠️ 단점:</strong> 레시피 재료가 많을수록 유사도가 낮아지는 경향</p>'
+            '<p><strong>⚠️ 단점:</strong> 레시피 재료나 사용자 재료가 많을수록 유사도가 낮아지는 경향 (냉장고 재료가 많으면 최소 매칭률에 걸러짐)</p>'
             '<p><strong>💡 권장 상황:</strong> 간단한 레시피 위주 추천, 재료 낭비 최소화, 직관적인 매칭</p>'
             '</div>'
 
@@ -1276,6 +1357,15 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
             '<p><strong>💡 권장 상황:</strong> 다양한 복잡도의 레시피 균형있게 추천, 공평한 평가</p>'
             '</div>'
 
+            # 기타 알고리즘 설명
+            '<div style="background: #f1f8e9; padding: 15px; border-left: 4px solid #8BC34A; margin: 15px 0; border-radius: 4px;">'
+            '<h3 style="margin-top: 0; color: #558B2F;">🟢 레시피 기준 매칭률 (coverage, 기본값 권장) / 조미료 보너스 (seasoning_bonus)</h3>'
+            '<p><strong>📝 coverage:</strong> <code>|매칭된 재료| / |레시피 재료|</code> '
+            '- 사용자 재료가 많아도 점수가 낮아지지 않음 (위 예시: 2 / 4 = 0.5)</p>'
+            '<p><strong>📝 seasoning_bonus:</strong> <code>필수 재료 매칭률 + 조미료 매칭률 × 0.05</code> '
+            '- 조미료까지 갖춘 레시피를 최대 5% 우대</p>'
+            '</div>'
+
             # 비교 표
             '<div style="background: white; padding: 15px; border: 1px solid #ddd; margin: 15px 0; border-radius: 4px;">'
             '<h3 style="margin-top: 0; color: #333;">⚖️ 비교 요약</h3>'
@@ -1300,7 +1390,7 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
             '</tr>'
             '<tr>'
             '<td style="padding: 10px; border: 1px solid #ddd;"><strong>기본값 권장</strong></td>'
-            '<td style="padding: 10px; border: 1px solid #ddd; text-align: center;">⭐⭐⭐ 권장</td>'
+            '<td style="padding: 10px; border: 1px solid #ddd; text-align: center;">⭐⭐ 선택 가능</td>'
             '<td style="padding: 10px; border: 1px solid #ddd; text-align: center;">⭐⭐ 선택 가능</td>'
             '</tr>'
             '</tbody>'
@@ -1308,7 +1398,7 @@ class RecommendationSettingsAdmin(admin.ModelAdmin):
             '</div>'
 
             '<p style="margin-top: 15px; padding: 10px; background: #e3f2fd; border-left: 4px solid #1976D2; border-radius: 4px;">'
-            '<strong>💬 참고:</strong> 위 드롭다운에서 알고리즘을 선택하면 API 기본값으로 사용됩니다. '
+            '<strong>💬 참고:</strong> 위 드롭다운에서 알고리즘을 선택하면 API 기본값으로 사용됩니다 (기본값 권장: coverage). '
             '사용자가 API 호출 시 직접 알고리즘을 지정할 수도 있습니다.'
             '</p>'
             '</div>'
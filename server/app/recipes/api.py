@@ -4,19 +4,22 @@
 
 from ninja import Router
 from typing import List, Optional
-from django.db.models import Q, Count
-from django.http import JsonResponse
+from django.db.models import F
+from django.contrib.postgres.search import SearchRank
+from django.http import HttpResponse, JsonResponse
+from django.conf import settings as django_settings
 from django.contrib.auth import get_user_model
 from asgiref.sync import sync_to_async
-from .models import Recipe, Ingredient, NormalizedIngredient, Fridge, FridgeIngredient, IngredientCategory, RecommendationSettings
+from core.http_cache import make_etag, not_modified, set_cache_headers
+from .text_search import ngram_query
+from .models import Recipe, NormalizedIngredient, Fridge, FridgeIngredient, IngredientCategory, RecommendationSettings
 from .schemas import (
     RecipeSearchResponseSchema,
     RecipeRecommendRequestSchema,
     RecipeRecommendResponseSchema,
+    RecipeBatchRecommendRequestSchema,
+    RecipeBatchRecommendResponseSchema,
     IngredientAutocompleteResponseSchema,
-    RecipeSchema,
-    RecipeWithMatchRateSchema,
-    IngredientSuggestionSchema,
     RecipeListItemSchema,
     RecipeDetailSchema,
     PaginatedRecipesSchema,
@@ -28,8 +31,43 @@ from .schemas import (
     NormalizedIngredientSchema,
     IngredientCategorySchema,
     CategoryListResponseSchema,
-    RecommendedRecipeSchema,
     RecipeRecommendationsResponseSchema,
+    NearMissResponseSchema,
+)
+from .services.recipe_index import get_recipe_index, normalize_facets
+from .services.database_scoring import match_in_database
+from .services.scoring import SCORERS
+from .services.result_cache import recommendation_cache
+from .services.data_version import get_data_version
+from .services.fridge_scores import update_fridge_scores, clear_fridge_scores
+from .services.near_miss import find_near_misses, find_near_misses_in_database
+from .services.ingredient_matching import resolve_similar_ingredients
+from .services.ingredient_usage import used_ingredient_ids
+from .services.ingredient_aliases import get_alias_table
+from .services.ingredient_autocomplete import get_autocomplete_index
+from .services.recipe_cards import (
+    CARD_FIELDS,
+    LIST_ITEM_FIELDS,
+    json_response,
+    recipe_card_cache,
+    recipe_list_item_cache,
+    render_list,
+    stitch_card,
+)
+from .services.recipe_search import (
+    decode_search_cursor,
+    encode_search_cursor,
+    search_queryset,
+    search_recipes_by_ingredients,
+)
+from .services.recipe_export import ndjson_response, wants_ndjson
+from .services.recommendation_snapshot import (
+    CursorState,
+    decode_cursor,
+    encode_cursor,
+    get_snapshot_max_results,
+    load_snapshot,
+    save_snapshot,
 )
 from users.auth import OptionalJWTAuth, decode_access_token
 from math import ceil, sqrt
@@ -38,6 +76,11 @@ User = get_user_model()
 router = Router()
 
 
+def _uses_database_scoring() -> bool:
+    """점수 계산 방식이 DB 집계인지 여부 (scoring_mode='database'이면 추천 인덱스를 만들지 않음)"""
+    return RecommendationSettings.get_settings().scoring_mode == 'database'
+
+
 async def get_user_from_request(request):
     """요청에서 사용자 추출 (Optional)"""
     auth_header = request.headers.get('Authorization', '')
@@ -54,81 +97,105 @@ async def get_user_from_request(request):
     return None
 
 
-def _search_recipes_sync(ingredients: Optional[str], exclude_seasonings: bool):
-    """레시피 검색 동기 로직"""
+def _search_recipes_sync(
+    ingredients: Optional[str],
+    exclude_seasonings: bool,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    stream: bool = False,
+    fuzzy: bool = False
+):
+    """레시피 검색 동기 로직 (stream=True이면 limit 없이 전체 결과를 NDJSON으로 스트리밍)"""
+    empty = {
+        'recipes': [],
+        'total': 0,
+        'matched_ingredients': [],
+        'next_cursor': None
+    }
     if not ingredients:
-        return {
-            'recipes': [],
-            'total': 0,
-            'matched_ingredients': []
-        }
+        return ndjson_response(None, CARD_FIELDS) if stream else empty
 
     # 재료명 파싱
     ingredient_names = [name.strip() for name in ingredients.split(',')]
 
-    # 정규화된 재료로 검색
-    recipe_ids = set()
-    matched_ingredients = []
-
-    for ingredient_name in ingredient_names:
-        # QuerySet 시작
-        queryset = Ingredient.objects.search_normalized(ingredient_name)
+    # 레시피에 실제로 쓰이는 정규화 재료만 검색 조건으로 사용
+    # (범용 조미료 제외 시 조미료도 제외, 별칭 테이블/추천 인덱스로 조회, DB 집계 모드면 recipe_count 조회)
+    used_ids = used_ingredient_ids if _uses_database_scoring() else get_recipe_index().used_ids
+    id_by_name = get_alias_table().resolve_many(ingredient_names)
+    used = used_ids(id_by_name.values(), exclude_seasonings)
+    id_by_name = {name: normalized_id for name, normalized_id in id_by_name.items() if normalized_id in used}
 
-        # 범용 조미료 제외
-        if exclude_seasonings:
-            queryset = queryset.exclude_seasonings()
+    # 정확히 일치하지 않는 재료명은 가장 유사한 재료로 (fuzzy, 모든 재료명을 쿼리 1회로 조회)
+    unresolved = [name for name in ingredient_names if name not in id_by_name]
+    if fuzzy and unresolved:
+        id_by_name.update(resolve_similar_ingredients(used_ids, unresolved, exclude_seasonings))
+    matched_ingredients = [name for name in ingredient_names if name in id_by_name]
 
-        # 레시피 ID 수집
-        ingredient_recipe_ids = list(queryset.values_list('recipe_id', flat=True))
+    if not matched_ingredients:
+        return ndjson_response(None, CARD_FIELDS) if stream else empty
 
-        if ingredient_recipe_ids:
-            if not recipe_ids:
-                recipe_ids = set(ingredient_recipe_ids)
-            else:
-                # 교집합 (AND 조건)
-                recipe_ids &= set(ingredient_recipe_ids)
+    required_ids = sorted(set(id_by_name.values()))
+    limit = max(1, min(limit, 100))
+    try:
+        after = decode_search_cursor(cursor, required_ids) if cursor else None
+    except ValueError:
+        return JsonResponse(
+            {'error': 'InvalidCursor', 'message': 'cursor is malformed or belongs to another search'},
+            status=400
+        )
 
-            matched_ingredients.append(ingredient_name)
+    if stream:
+        return ndjson_response(search_queryset(required_ids, after), CARD_FIELDS)
 
-    # 레시피 조회
-    recipes = Recipe.objects.filter(id__in=recipe_ids)
+    # 모든 재료를 포함한 레시피 (AND 조건) 한 페이지 + 전체 개수: 쿼리 1회
+    page = search_recipes_by_ingredients(required_ids, limit, after)
+    cards = recipe_card_cache.get_many(page.recipe_ids)
 
-    return {
-        'recipes': [RecipeSchema.from_orm(recipe) for recipe in recipes],
-        'total': recipes.count(),
-        'matched_ingredients': matched_ingredients
-    }
+    return json_response(render_list('recipes', [
+        cards[recipe_id] for recipe_id in page.recipe_ids if recipe_id in cards
+    ], {
+        'total': page.total,
+        'matched_ingredients': matched_ingredients,
+        'next_cursor': encode_search_cursor(page.next_cursor) if page.next_cursor else None
+    }))
 
 
 @router.get("/search", response=RecipeSearchResponseSchema)
 async def search_recipes(
     request,
     ingredients: Optional[str] = None,
-    exclude_seasonings: bool = False
+    exclude_seasonings: bool = False,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    fuzzy: bool = False
 ):
     """
     재료명으로 레시피 검색
 
+    모든 재료를 포함한 레시피를 최신순(-created_at)으로 반환
+
     Args:
         ingredients: 쉼표로 구분된 재료명 (예: "돼지고기,배추")
         exclude_seasonings: 범용 조미료 제외 여부
+        limit: 페이지 크기 (범위: 1-100)
+        cursor: 이전 응답의 next_cursor (다음 페이지 조회, 같은 재료 조건에서만 유효)
+        fuzzy: 정확히 일치하는 재료가 없으면 가장 유사한 재료명으로 검색 (오타/띄어쓰기 허용)
+
+    Accept: application/x-ndjson 요청이면 cursor 이후 전체 결과를 한 줄에 레시피 하나씩 스트리밍
+    (limit 무시, 서버 사이드 커서 사용)
     """
-    return await sync_to_async(_search_recipes_sync)(ingredients, exclude_seasonings)
+    return await sync_to_async(_search_recipes_sync)(
+        ingredients, exclude_seasonings, limit, cursor, wants_ndjson(request), fuzzy
+    )
 
 
 def _recommend_recipes_sync(data: RecipeRecommendRequestSchema):
     """레시피 추천 동기 로직"""
-    from django.db.models import Prefetch
-
     user_ingredients = data.ingredients
     exclude_seasonings = data.exclude_seasonings
 
-    # 사용자가 가진 정규화 재료 찾기 (인덱스 활용)
-    user_normalized_ids = set(
-        NormalizedIngredient.objects
-        .filter(name__in=user_ingredients)
-        .values_list('id', flat=True)
-    )
+    # 사용자가 가진 정규화 재료 찾기 (별칭 테이블)
+    user_normalized_ids = set(get_alias_table().resolve_many(user_ingredients).values())
 
     if not user_normalized_ids:
         return {
@@ -136,71 +203,48 @@ def _recommend_recipes_sync(data: RecipeRecommendRequestSchema):
             'match_rate': '매칭 불가'
         }
 
-    # Ingredient queryset 생성 (조미료 제외 옵션 적용)
-    ingredient_qs = Ingredient.objects.select_related(
-        'normalized_ingredient',
-        'normalized_ingredient__category'
-    )
-
-    if exclude_seasonings:
-        ingredient_qs = ingredient_qs.exclude(
-            normalized_ingredient__is_common_seasoning=True
+    # 같은 재료 조합의 결과 캐시 조회 (데이터 버전 포함 키)
+    cache_key = recommendation_cache.make_key('recommend', user_normalized_ids, exclude_seasonings)
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
+    # 희소 행렬 인덱스(또는 DB 집계)로 매칭률 계산 (최소 30% 이상, 매칭률 순 상위 20개)
+    # 전체 개수는 응답에 없으므로 점수 상한으로 가지치기
+    if _uses_database_scoring():
+        result = match_in_database(
+            user_normalized_ids, exclude_seasonings, 0.3, limit=20, rank_by_matched_count=False
         )
+    else:
+        result = get_recipe_index().match(
+            user_normalized_ids, exclude_seasonings, 0.3,
+            limit=20, rank_by_matched_count=False, exact_total=False
+        )
+    cards = recipe_card_cache.get_many(match.recipe_id for match in result.matches)
 
-    # 모든 레시피 조회 (N+1 방지: Prefetch 객체로 최적화된 prefetch)
-    recipes = list(Recipe.objects.prefetch_related(
-        Prefetch('ingredients', queryset=ingredient_qs)
-    ).all())
-
-    recipe_matches = []
-
-    for recipe in recipes:
-        # prefetch된 재료들 (이미 필터링됨)
-        essential_ingredients = list(recipe.ingredients.all())
+    content = _build_recommend_response(result.matches, cards)
+    recommendation_cache.set(cache_key, content)
+    return json_response(content)
 
-        # 정규화 재료 ID 추출 (추가 쿼리 없이 메모리에서 처리)
-        recipe_ingredient_ids = set()
-        for ing in essential_ingredients:
-            if ing.normalized_ingredient_id:
-                recipe_ingredient_ids.add(ing.normalized_ingredient_id)
 
-        if not recipe_ingredient_ids:
+def _build_recommend_response(matches, cards) -> bytes:
+    """매칭 목록으로 /recommend 응답 본문 생성 (레시피는 미리 조회한 카드 조각 사용)"""
+    recommended_recipes, match_rates = [], []
+    for match in matches:
+        card = cards.get(match.recipe_id)
+        if card is None:
             continue
-
-        # 매칭된 재료 수
-        matched_ids = user_normalized_ids & recipe_ingredient_ids
-        matched_count = len(matched_ids)
-        total_count = len(recipe_ingredient_ids)
-
-        # 매칭률 계산
-        match_rate = matched_count / total_count if total_count > 0 else 0
-
-        # 최소 30% 이상 매칭된 레시피만 포함
-        if match_rate >= 0.3:
-            recipe_matches.append({
-                'recipe': recipe,
-                'match_rate': match_rate,
-                'matched_count': matched_count,
-                'total_count': total_count
-            })
-
-    # 매칭률 순으로 정렬
-    recipe_matches.sort(key=lambda x: x['match_rate'], reverse=True)
-
-    # 응답 생성
-    recommended_recipes = []
-    for match in recipe_matches[:20]:  # 상위 20개
-        recipe_data = RecipeSchema.from_orm(match['recipe']).dict()
-        recipe_data.update({
-            'match_rate': round(match['match_rate'], 2),
-            'matched_count': match['matched_count'],
-            'total_count': match['total_count']
-        })
-        recommended_recipes.append(RecipeWithMatchRateSchema(**recipe_data))
+        match_rate = round(match.match_score, 2)
+        recommended_recipes.append(stitch_card(card, {
+            'match_rate': match_rate,
+            'matched_count': match.matched_count,
+            'total_count': match.total_count
+        }))
+        match_rates.append(match_rate)
 
     # 매칭률 설명
-    if recommended_recipes:
-        top_match_rate = recommended_recipes[0].match_rate
+    if match_rates:
+        top_match_rate = match_rates[0]
         if top_match_rate >= 0.8:
             match_rate_text = "80% 이상 매칭"
         elif top_match_rate >= 0.5:
@@ -210,10 +254,7 @@ def _recommend_recipes_sync(data: RecipeRecommendRequestSchema):
     else:
         match_rate_text = "매칭 불가"
 
-    return {
-        'recipes': recommended_recipes,
-        'match_rate': match_rate_text
-    }
+    return render_list('recipes', recommended_recipes, {'match_rate': match_rate_text})
 
 
 @router.post("/recommend", response=RecipeRecommendResponseSchema)
@@ -224,22 +265,196 @@ async def recommend_recipes(request, data: RecipeRecommendRequestSchema):
     사용자의 냉장고 재료로 만들 수 있는 레시피를 매칭률 순으로 추천
 
     최적화:
-    - prefetch_related로 N+1 쿼리 해결
-    - 인덱스 활용한 빠른 검색
-    - Prefetch 객체로 조건부 prefetch (exclude_seasonings)
+    - 인메모리 레시피×재료 희소 행렬로 매칭 수 일괄 계산
+    - argpartition으로 상위 20개만 정렬
+    - 상위 레시피의 직렬화된 카드 조각만 조회 (레시피 카드 캐시, 항목별 스키마 검증 없음)
     """
     return await sync_to_async(_recommend_recipes_sync)(data)
 
 
+def _recommend_batch_sync(data: RecipeBatchRecommendRequestSchema):
+    """일괄 레시피 추천 동기 로직"""
+    max_sets = getattr(django_settings, 'RECOMMENDATION_BATCH_MAX_SETS', 50)
+    if len(data.ingredient_sets) > max_sets:
+        return JsonResponse(
+            {'error': 'TooManyIngredientSets', 'message': f'ingredient_sets는 최대 {max_sets}개까지 요청할 수 있습니다.'},
+            status=400
+        )
+    limit = max(1, min(data.limit, 100))
+
+    # 모든 조합의 재료명을 한 번에 변환 (별칭 테이블)
+    all_names = {name for names in data.ingredient_sets for name in names}
+    id_by_name = get_alias_table().resolve_many(all_names)
+    user_id_sets = [
+        {id_by_name[name] for name in names if name in id_by_name}
+        for names in data.ingredient_sets
+    ]
+
+    # 모든 조합을 한 번의 희소 행렬 곱으로 점수 계산 (/recommend와 같은 기준)
+    # DB 집계 모드면 조합마다 집계 쿼리
+    if _uses_database_scoring():
+        results = [
+            match_in_database(user_ids, data.exclude_seasonings, 0.3, limit=limit, rank_by_matched_count=False)
+            for user_ids in user_id_sets
+        ]
+    else:
+        results = get_recipe_index().match_batch(
+            user_id_sets, data.exclude_seasonings, 0.3,
+            limit=limit, rank_by_matched_count=False
+        )
+    cards = recipe_card_cache.get_many(
+        match.recipe_id for result in results for match in result.matches
+    )
+
+    return json_response(render_list('results', [
+        _build_recommend_response(result.matches if user_ids else [], cards)
+        for user_ids, result in zip(user_id_sets, results)
+    ], {}))
+
+
+@router.post("/recommend/batch", response=RecipeBatchRecommendResponseSchema)
+async def recommend_recipes_batch(request, data: RecipeBatchRecommendRequestSchema):
+    """
+    여러 재료 조합의 레시피 일괄 추천
+
+    조합마다 /recommend와 같은 기준(매칭률 30% 이상, 매칭률 순)으로 상위 limit개 반환
+    (최대 RECOMMENDATION_BATCH_MAX_SETS개 조합)
+
+    최적화:
+    - 모든 조합의 재료명을 한 번에 조회
+    - 조합×재료 희소 행렬과 역색인의 곱으로 전체 조합 점수를 한 번에 계산
+    - 모든 조합의 상위 레시피 카드를 한 번에 조회
+
+    Returns:
+        RecipeBatchRecommendResponseSchema: {results: ingredient_sets 순서의 /recommend 응답 목록}
+    """
+    return await sync_to_async(_recommend_batch_sync)(data)
+
+
+def _match_recommendations(
+    settings: RecommendationSettings,
+    user_normalized_ids,
+    exclude_seasonings: bool,
+    min_match_rate: float,
+    limit: int,
+    algorithm: str,
+    exact_total: bool,
+    facets: Optional[dict] = None,
+    count_facets: bool = False
+):
+    """
+    선택한 알고리즘의 점수 계산 후 상위 limit개 선택
+
+    점수 계산 방식: DB 집계 쿼리 또는 희소 행렬 인덱스
+    (DB 집계를 지원하지 않는 알고리즘은 인덱스 사용)
+    인덱스는 exact_total=False이면 점수 상한으로 가지치기 (total은 추정값)
+    """
+    match_args = (user_normalized_ids, exclude_seasonings, min_match_rate)
+    match_kwargs = {'limit': limit, 'algorithm': algorithm, 'facets': facets, 'count_facets': count_facets}
+    if settings.scoring_mode == 'database':
+        try:
+            return match_in_database(*match_args, **match_kwargs)
+        except NotImplementedError:
+            pass
+    return get_recipe_index().match(*match_args, exact_total=exact_total, **match_kwargs)
+
+
+def _parse_facets(**values: Optional[str]) -> Optional[dict]:
+    """패싯 파라미터(쉼표로 구분된 값) → {필드: 정렬된 값 목록} (조건이 없으면 None, 커서와 같은 검증/정규화)"""
+    return normalize_facets({field: value.split(',') for field, value in values.items() if value})
+
+
+def _build_recommendations_response(matches, result, algorithm: str, next_cursor: Optional[str]) -> bytes:
+    """매칭 목록의 레시피 카드만 조회하여 추천 응답 본문 생성"""
+    cards = recipe_card_cache.get_many(match.recipe_id for match in matches)
+
+    recommended_recipes = []
+    for match in matches:
+        card = cards.get(match.recipe_id)
+        if card is None:
+            continue
+        recommended_recipes.append(stitch_card(card, {
+            'match_score': round(match.match_score, 3),
+            'matched_count': match.matched_count,
+            'total_count': match.total_count,
+            'algorithm': algorithm
+        }))
+
+    # 매칭률 요약 (전체 결과의 최고 점수 기준)
+    if result.matches:
+        top_score = round(result.matches[0].match_score, 3)
+        if top_score >= 0.8:
+            summary = "80% 이상 매칭"
+        elif top_score >= 0.5:
+            summary = "50% 이상 매칭"
+        else:
+            summary = "30% 이상 매칭"
+    else:
+        summary = "매칭 불가"
+
+    return render_list('recipes', recommended_recipes, {
+        'total': result.total,
+        'total_is_exact': result.total_is_exact,
+        'algorithm': algorithm,
+        'summary': summary,
+        'next_cursor': next_cursor,
+        'facets': result.facet_counts
+    })
+
+
+def _get_recommendations_page_sync(cursor: str, limit: Optional[int]):
+    """
+    커서 이후 페이지 동기 로직
+
+    스냅샷이 있으면 잘라서 응답, 없으면(첫 커서 요청/만료) 같은 데이터 버전일 때만
+    상위 RECOMMENDATION_SNAPSHOT_MAX_RESULTS개 순위를 한 번 계산하여 저장
+    """
+    try:
+        state = decode_cursor(cursor)
+    except ValueError:
+        return JsonResponse(
+            {'error': 'InvalidCursor', 'message': 'cursor is malformed'},
+            status=400
+        )
+
+    settings = RecommendationSettings.get_settings()
+    limit = max(1, min(limit if limit is not None else settings.default_limit, 100))
+
+    snapshot = load_snapshot(state)
+    if snapshot is None:
+        if state.version != get_data_version() or state.algorithm not in SCORERS:
+            return JsonResponse(
+                {'error': 'InvalidCursor', 'message': 'cursor has expired, request the first page again'},
+                status=400
+            )
+        snapshot = _match_recommendations(
+            settings, state.ingredient_ids, state.exclude_seasonings, state.min_match_rate,
+            get_snapshot_max_results(), state.algorithm, state.exact_total, state.facets
+        )
+        save_snapshot(state, snapshot)
+
+    end = state.offset + limit
+    next_cursor = encode_cursor(state._replace(offset=end)) if end < len(snapshot.matches) else None
+    return json_response(_build_recommendations_response(
+        snapshot.matches[state.offset:end], snapshot, state.algorithm, next_cursor
+    ))
+
+
 def _get_recipe_recommendations_sync(
     ingredients: str,
     limit: Optional[int],
     algorithm: Optional[str],
     exclude_seasonings: Optional[bool],
-    min_match_rate: Optional[float]
+    min_match_rate: Optional[float],
+    exact_total: bool = False,
+    cursor: Optional[str] = None,
+    facets: Optional[dict] = None,
+    facet_counts: bool = False
 ):
     """레시피 추천 동기 로직"""
-    from django.db.models import Prefetch
+    # 다음 페이지: 커서의 조건으로 스냅샷에서 조회
+    if cursor:
+        return _get_recommendations_page_sync(cursor, limit)
 
     # 관리자 설정 조회
     settings = RecommendationSettings.get_settings()
@@ -254,9 +469,12 @@ def _get_recipe_recommendations_sync(
     limit = max(1, min(limit, 100))
     min_match_rate = max(0.0, min(min_match_rate, 1.0))
 
-    if algorithm not in ['jaccard', 'cosine']:
+    if algorithm not in SCORERS:
         return JsonResponse(
-            {'error': 'InvalidAlgorithm', 'message': 'algorithm must be "jaccard" or "cosine"'},
+            {
+                'error': 'InvalidAlgorithm',
+                'message': f'algorithm must be one of: {", ".join(SCORERS)}'
+            },
             status=400
         )
 
@@ -267,110 +485,55 @@ def _get_recipe_recommendations_sync(
         return {
             'recipes': [],
             'total': 0,
+            'total_is_exact': True,
             'algorithm': algorithm,
             'summary': '재료 없음'
         }
 
-    # 사용자가 가진 정규화 재료 찾기
-    user_normalized_ingredients = list(NormalizedIngredient.objects.filter(
-        name__in=ingredient_names
-    ))
-    user_normalized_ids = set(ing.id for ing in user_normalized_ingredients)
+    # 사용자가 가진 정규화 재료 찾기 (별칭 테이블)
+    user_normalized_ids = set(get_alias_table().resolve_many(ingredient_names).values())
 
     if not user_normalized_ids:
         return {
             'recipes': [],
             'total': 0,
+            'total_is_exact': True,
             'algorithm': algorithm,
             'summary': '재료 없음'
         }
 
-    # Ingredient queryset 생성 (조미료 제외 옵션 적용)
-    ingredient_qs = Ingredient.objects.select_related(
-        'normalized_ingredient',
-        'normalized_ingredient__category'
+    # 같은 재료 조합/옵션의 결과 캐시 조회 (데이터 버전 포함 키)
+    # 결과 캐시 키와 커서에 같은 데이터 버전 사용 (한 번만 조회)
+    data_version = get_data_version()
+    cache_key = recommendation_cache.make_key(
+        'recommendations', user_normalized_ids,
+        limit, algorithm, exclude_seasonings, min_match_rate, exact_total,
+        tuple((field, tuple(values)) for field, values in (facets or {}).items()), facet_counts,
+        version=data_version
+    )
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
+    # 정렬: 1차 점수, 2차 매칭 재료 수 (내림차순), 상위 limit개만 계산
+    result = _match_recommendations(
+        settings, user_normalized_ids, exclude_seasonings, min_match_rate,
+        limit, algorithm, exact_total, facets, facet_counts
     )
 
-    if exclude_seasonings:
-        ingredient_qs = ingredient_qs.exclude(
-            normalized_ingredient__is_common_seasoning=True
-        )
-
-    # 모든 레시피 조회
-    recipes = list(Recipe.objects.prefetch_related(
-        Prefetch('ingredients', queryset=ingredient_qs)
-    ).all())
-
-    recipe_matches = []
-
-    for recipe in recipes:
-        # prefetch된 재료들
-        essential_ingredients = list(recipe.ingredients.all())
-
-        # 정규화 재료 ID 추출
-        recipe_ingredient_ids = set()
-        for ing in essential_ingredients:
-            if ing.normalized_ingredient_id:
-                recipe_ingredient_ids.add(ing.normalized_ingredient_id)
-
-        if not recipe_ingredient_ids:
-            continue
-
-        # 매칭된 재료 ID
-        matched_ids = user_normalized_ids & recipe_ingredient_ids
-        matched_count = len(matched_ids)
-        total_count = len(recipe_ingredient_ids)
-
-        # 레시피 기준 매칭률 계산
-        # 사용자가 레시피에 필요한 재료를 얼마나 가지고 있는가?
-        # match_score = 보유 재료 수 / 레시피 전체 재료 수
-        match_score = matched_count / total_count if total_count > 0 else 0
-
-        # 최소 매칭률 필터링
-        if match_score >= min_match_rate:
-            recipe_matches.append({
-                'recipe': recipe,
-                'match_score': match_score,
-                'matched_count': matched_count,
-                'total_count': total_count
-            })
-
-    # 매칭률 내림차순 정렬 (1차: 매칭률, 2차: 매칭 재료 수)
-    recipe_matches.sort(key=lambda x: (x['match_score'], x['matched_count']), reverse=True)
-
-    # limit 적용
-    limited_matches = recipe_matches[:limit]
-
-    # 응답 생성
-    recommended_recipes = []
-    for match in limited_matches:
-        recipe_data = RecipeSchema.from_orm(match['recipe']).dict()
-        recipe_data.update({
-            'match_score': round(match['match_score'], 3),
-            'matched_count': match['matched_count'],
-            'total_count': match['total_count'],
-            'algorithm': algorithm
-        })
-        recommended_recipes.append(RecommendedRecipeSchema(**recipe_data))
-
-    # 매칭률 요약
-    if recommended_recipes:
-        top_score = recommended_recipes[0].match_score
-        if top_score >= 0.8:
-            summary = "80% 이상 매칭"
-        elif top_score >= 0.5:
-            summary = "50% 이상 매칭"
-        else:
-            summary = "30% 이상 매칭"
-    else:
-        summary = "매칭 불가"
+    # 다음 페이지가 있으면 커서 발급 (스냅샷은 다음 페이지 첫 요청 시 생성)
+    # 가지치기한 total은 추정값(실제보다 작을 수 있음)이므로 한 페이지가 꽉 찼으면 발급
+    next_cursor = None
+    has_more = result.total > limit if result.total_is_exact else len(result.matches) == limit
+    if has_more:
+        next_cursor = encode_cursor(CursorState(
+            data_version, sorted(user_normalized_ids), algorithm,
+            exclude_seasonings, min_match_rate, exact_total, limit, facets
+        ))
 
-    return {
-        'recipes': recommended_recipes,
-        'total': len(recipe_matches),
-        'algorithm': algorithm,
-        'summary': summary
-    }
+    content = _build_recommendations_response(result.matches, result, algorithm, next_cursor)
+    recommendation_cache.set(cache_key, content)
+    return json_response(content)
 
 
 @router.get("/recommendations", response=RecipeRecommendationsResponseSchema)
@@ -380,7 +543,15 @@ async def get_recipe_recommendations(
     limit: Optional[int] = None,
     algorithm: Optional[str] = None,
     exclude_seasonings: Optional[bool] = None,
-    min_match_rate: Optional[float] = None
+    min_match_rate: Optional[float] = None,
+    exact_total: bool = False,
+    cursor: Optional[str] = None,
+    method: Optional[str] = None,
+    situation: Optional[str] = None,
+    ingredient_type: Optional[str] = None,
+    recipe_type: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    facet_counts: bool = False
 ):
     """
     레시피 추천 (GET 방식)
@@ -388,65 +559,144 @@ async def get_recipe_recommendations(
     Args:
         ingredients: 쉼표로 구분된 정규화 재료명 (예: "돼지고기,배추,두부")
         limit: 추천 레시피 최대 개수 (미지정 시 관리자 설정값 사용, 범위: 1-100)
-        algorithm: 알고리즘 선택 (미지정 시 관리자 설정값 사용, "jaccard" or "cosine") - 호환성 유지용
+        algorithm: 알고리즘 선택 (미지정 시 관리자 설정값 사용)
+            - "jaccard": 교집합 / 합집합
+            - "cosine": 교집합 / (√사용자 재료 수 × √레시피 재료 수)
+            - "coverage": 보유 재료 수 / 레시피 전체 재료 수
+            - "seasoning_bonus": 필수 재료 매칭률 + 조미료 보너스 (최대 0.05)
         exclude_seasonings: 범용 조미료 제외 여부 (미지정 시 관리자 설정값 사용)
-        min_match_rate: 최소 매칭률 (미지정 시 관리자 설정값 사용, 범위: 0.0-1.0)
-
-    매칭률 계산:
+        min_match_rate: 최소 점수 (미지정 시 관리자 설정값 사용, 범위: 0.0-1.0)
+        exact_total: total을 정확히 계산할지 여부 (기본 False: 상위 limit개에 들 수 없는
+            레시피는 점수 계산을 건너뛰고 total은 추정값으로 반환)
+        cursor: 이전 응답의 next_cursor (다음 페이지 조회, limit 외 다른 파라미터는 무시)
+        method, situation, ingredient_type, recipe_type, difficulty: 패싯 필터
+            (쉼표로 구분된 값, 같은 필드는 OR, 필드 간은 AND, 예: recipe_type="국/탕,찌개")
+        facet_counts: 조건을 만족한 전체 레시피의 패싯 값별 개수 반환 여부 (첫 페이지만)
+
+    매칭률 계산 (coverage 예시):
         match_score = 보유 재료 수 / 레시피 전체 재료 수
         예) 레시피 재료 [대패삼겹살, 배추]를 모두 보유 → 100%
 
     정렬 우선순위:
-        1차: 매칭률 (높은 순)
+        1차: 점수 (높은 순)
         2차: 매칭된 재료 수 (많은 순)
 
     Returns:
         RecipeRecommendationsResponseSchema: {
             recipes: 추천 레시피 목록,
             total: 전체 추천 개수,
-            algorithm: 사용된 알고리즘 (호환성),
-            summary: 매칭률 요약
+            total_is_exact: total이 정확한 값인지 여부 (False이면 추정값),
+            algorithm: 사용된 알고리즘,
+            summary: 매칭률 요약,
+            next_cursor: 다음 페이지 커서 (마지막 페이지이면 null),
+            facets: 패싯 필드별 {값: 레시피 수} (facet_counts=true일 때)
         }
     """
+    facets = _parse_facets(
+        method=method, situation=situation, ingredient_type=ingredient_type,
+        recipe_type=recipe_type, difficulty=difficulty
+    )
     return await sync_to_async(_get_recipe_recommendations_sync)(
-        ingredients, limit, algorithm, exclude_seasonings, min_match_rate
+        ingredients, limit, algorithm, exclude_seasonings, min_match_rate, exact_total, cursor,
+        facets, facet_counts
     )
 
 
-def _autocomplete_ingredients_sync(q: str):
-    """재료 자동완성 동기 로직"""
-    if not q or len(q) < 1:
-        return {'suggestions': []}
-
-    # 정규화 재료에서 검색 (N+1 방지: select_related, 인덱스 활용)
-    # startswith 우선 검색 후 contains 검색
-    normalized_ingredients = list(
-        NormalizedIngredient.objects
-        .select_related('category')
-        .filter(name__istartswith=q)
-        .order_by('name')[:10]
-    )
-
-    # startswith로 결과가 부족하면 contains로 추가 검색
-    if len(normalized_ingredients) < 10:
-        contains_results = list(
+def _ingredient_names(ingredient_ids) -> dict:
+    """정규화 재료 ID → (이름, 카테고리명) (RecipeIndex.ingredient_names와 같은 형식, 쿼리 1회)"""
+    if not ingredient_ids:
+        return {}
+    return {
+        normalized_id: (name, category_name or '기타')
+        for normalized_id, name, category_name in (
             NormalizedIngredient.objects
-            .select_related('category')
-            .filter(name__icontains=q)
-            .exclude(name__istartswith=q)
-            .order_by('name')[:(10 - len(normalized_ingredients))]
+            .filter(id__in=ingredient_ids)
+            .order_by()
+            .values_list('id', 'name', 'category__name')
         )
-        normalized_ingredients = normalized_ingredients + contains_results
+    }
 
-    suggestions = []
-    for ingredient in normalized_ingredients:
-        suggestions.append(IngredientSuggestionSchema(
-            name=ingredient.name,
-            category=ingredient.category.name,
-            is_common_seasoning=ingredient.is_common_seasoning
-        ))
 
-    return {'suggestions': suggestions}
+def _get_near_misses_sync(ingredients: str, max_missing: int, limit: int):
+    """거의 만들 수 있는 레시피 동기 로직"""
+    max_missing = max(1, min(max_missing, 2))
+    limit = max(1, min(limit, 100))
+
+    ingredient_names = [name.strip() for name in ingredients.split(',') if name.strip()]
+    user_normalized_ids = set(get_alias_table().resolve_many(ingredient_names).values())
+
+    if not user_normalized_ids:
+        return {'recipes': [], 'shopping_list': [], 'total': 0}
+
+    cache_key = recommendation_cache.make_key('near_misses', user_normalized_ids, max_missing, limit)
+    cached = recommendation_cache.get(cache_key)
+    if cached is not None:
+        return json_response(cached)
+
+    # DB 집계 모드면 필수 재료 시그니처 조회 + 재료 이름 조회 (추천 인덱스를 만들지 않음)
+    if _uses_database_scoring():
+        result = find_near_misses_in_database(user_normalized_ids, max_missing=max_missing, limit=limit)
+        ingredient_names = _ingredient_names(
+            {i for near_miss in result.recipes for i in near_miss.missing_ids}
+            | {item.ingredient_id for item in result.shopping_list}
+        )
+    else:
+        index = get_recipe_index()
+        result = find_near_misses(index, user_normalized_ids, max_missing=max_missing, limit=limit)
+        ingredient_names = index.ingredient_names
+    cards = recipe_card_cache.get_many(near_miss.recipe_id for near_miss in result.recipes)
+
+    def ingredient_data(ingredient_id):
+        name, category = ingredient_names.get(ingredient_id, ('', '기타'))
+        return {'id': ingredient_id, 'name': name, 'category': category}
+
+    recipes = []
+    for near_miss in result.recipes:
+        card = cards.get(near_miss.recipe_id)
+        if card is None:
+            continue
+        recipes.append(stitch_card(card, {
+            'missing_ingredients': [ingredient_data(i) for i in near_miss.missing_ids],
+            'missing_count': len(near_miss.missing_ids),
+            'matched_count': near_miss.matched_count,
+            'total_count': near_miss.total_count
+        }))
+
+    shopping_list = [
+        dict(ingredient_data(item.ingredient_id), unlocks=item.unlocks, near_miss_count=item.near_miss_count)
+        for item in result.shopping_list
+    ]
+
+    content = render_list('recipes', recipes, {'shopping_list': shopping_list, 'total': result.total})
+    recommendation_cache.set(cache_key, content)
+    return json_response(content)
+
+
+@router.get("/near-misses", response=NearMissResponseSchema)
+async def get_near_misses(request, ingredients: str, max_missing: int = 2, limit: int = 20):
+    """
+    거의 만들 수 있는 레시피 + 장보기 목록
+
+    보유 재료로 필수(비조미료) 재료가 1~2개만 부족한 레시피와,
+    부족한 재료를 사면 바로 만들 수 있게 되는 레시피 수 순의 장보기 목록
+    (예: "두부 구매 → 레시피 14개")
+
+    Args:
+        ingredients: 쉼표로 구분된 정규화 재료명 (예: "돼지고기,양파")
+        max_missing: 허용할 최대 부족 재료 수 (범위: 1-2)
+        limit: 레시피 최대 개수 (범위: 1-100)
+
+    정렬:
+        recipes: 부족한 재료 수 (적은 순) → 부족한 재료들의 unlocks 합 (많은 순)
+        shopping_list: unlocks → near_miss_count (많은 순)
+    """
+    return await sync_to_async(_get_near_misses_sync)(ingredients, max_missing, limit)
+
+
+def _autocomplete_ingredients_sync(q: str):
+    """재료 자동완성 동기 로직 (인메모리 인덱스, 데이터 버전이 같으면 DB 조회 없음)"""
+    suggestions = get_autocomplete_index().suggest(q, limit=10)
+    return json_response(render_list('suggestions', suggestions, {}))
 
 
 @router.get("/ingredients/autocomplete", response=IngredientAutocompleteResponseSchema)
@@ -455,12 +705,10 @@ async def autocomplete_ingredients(request, q: str):
     재료 자동완성
 
     Args:
-        q: 검색 쿼리
+        q: 검색 쿼리 (재료명 일부 또는 초성, 예: "ㄷㅈㄱㄱ" → 돼지고기)
 
-    최적화:
-    - select_related로 N+1 쿼리 방지
-    - name 인덱스 활용한 빠른 검색
-    - ILIKE 대신 startswith 우선 (더 빠름)
+    접두사 일치 → 중간 일치 순, 각각 많이 쓰이는 재료 먼저 최대 10개
+    프로세스별 인메모리 인덱스에서 조회 (데이터 버전이 바뀌면 재구축)
     """
     return await sync_to_async(_autocomplete_ingredients_sync)(q)
 
@@ -498,6 +746,7 @@ def _get_categories_sync(category_type: str):
 @router.get("/categories", response=CategoryListResponseSchema)
 async def get_categories(
     request,
+    response: HttpResponse,
     category_type: str = "normalized"
 ):
     """
@@ -511,7 +760,14 @@ async def get_categories(
             categories: 카테고리 목록,
             total: 전체 개수
         }
+
+    ETag(데이터 버전 기반)가 If-None-Match와 일치하면 DB 조회 없이 304
     """
+    etag = make_etag('recipes:categories', await sync_to_async(get_data_version)(), category_type)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_cache_headers(response, etag)
     return await sync_to_async(_get_categories_sync)(category_type)
 
 
@@ -537,8 +793,8 @@ def _get_normalized_ingredients_sync(
     if search:
         queryset = queryset.filter(name__icontains=search)
 
-    # 정렬: 카테고리 순서 → 재료명
-    queryset = queryset.order_by('category__display_order', 'name')[:limit]
+    # 정렬: 사용 레시피 수 (많은 순, 미리 계산된 값) → 재료명
+    queryset = queryset.order_by('-recipe_count', 'name')[:limit]
 
     # 전체 개수 (필터링 적용된) - QuerySet 평가 강제
     ingredient_list = list(queryset)
@@ -561,7 +817,8 @@ def _get_normalized_ingredients_sync(
             id=ingredient.id,
             name=ingredient.name,
             category=category_data,
-            is_common_seasoning=ingredient.is_common_seasoning
+            is_common_seasoning=ingredient.is_common_seasoning,
+            recipe_count=ingredient.recipe_count
         ))
 
     # 사용 가능한 카테고리 목록 (정규화 재료용)
@@ -591,6 +848,7 @@ def _get_normalized_ingredients_sync(
 @router.get("/ingredients", response=NormalizedIngredientListResponseSchema)
 async def get_normalized_ingredients(
     request,
+    response: HttpResponse,
     category: Optional[str] = None,
     exclude_seasonings: bool = False,
     search: Optional[str] = None,
@@ -611,7 +869,16 @@ async def get_normalized_ingredients(
             total: 전체 개수,
             categories: 사용 가능한 카테고리 목록
         }
+
+    ETag(데이터 버전 + 조회 조건 기반)가 If-None-Match와 일치하면 DB 조회 없이 304
     """
+    etag = make_etag(
+        'recipes:ingredients', await sync_to_async(get_data_version)(), category, exclude_seasonings, search, limit
+    )
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_cache_headers(response, etag)
     return await sync_to_async(_get_normalized_ingredients_sync)(
         category, exclude_seasonings, search, limit
     )
@@ -623,9 +890,10 @@ def _list_recipes_sync(
     page: int,
     limit: int,
     difficulty: Optional[str],
-    search: Optional[str]
+    search: Optional[str],
+    stream: bool = False
 ):
-    """레시피 목록 조회 동기 로직"""
+    """레시피 목록 조회 동기 로직 (stream=True이면 페이지 없이 전체 목록을 NDJSON으로 스트리밍)"""
     # Limit 제한
     limit = min(limit, 100)
 
@@ -636,39 +904,40 @@ def _list_recipes_sync(
     if difficulty:
         queryset = queryset.filter(difficulty__icontains=difficulty)
 
-    if search:
-        queryset = queryset.filter(
-            Q(name__icontains=search) | Q(title__icontains=search)
-        )
+    # 검색어: 제목/이름/소개 n-gram 전문 검색 (GIN 인덱스), 관련도 순 정렬
+    # 검색어에 단어가 없으면(예: "!!!") 일치하는 레시피 없음
+    search = (search or '').strip()
+    search_query = ngram_query(search) if search else None
+    if search_query is not None:
+        queryset = queryset.filter(search_vector=search_query)
+    elif search:
+        queryset = queryset.none()
 
-    # 페이지네이션
+    if stream:
+        return ndjson_response(queryset.order_by('-created_at', '-id'), LIST_ITEM_FIELDS)
+
+    if search_query is not None:
+        queryset = queryset.annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', '-created_at', '-id')
+
+    # 페이지네이션: 페이지의 레시피 ID만 조회하고 항목은 직렬화된 목록 카드 사용 (항목별 스키마 검증 없음)
     offset = (page - 1) * limit
-    recipe_list = list(queryset[offset:offset + limit])
+    recipe_ids = list(queryset.values_list('id', flat=True)[offset:offset + limit])
+    cards = recipe_list_item_cache.get_many(recipe_ids)
 
     # 총 개수 (필터링 적용된 전체 쿼리셋의 개수)
     total = queryset.count()
     total_pages = ceil(total / limit) if total > 0 else 0
 
-    return {
-        'recipes': [
-            {
-                'id': recipe.id,
-                'recipe_sno': recipe.recipe_sno,
-                'name': recipe.name,
-                'title': recipe.title,
-                'image_url': recipe.image_url,
-                'recipe_url': recipe.recipe_url,
-                'difficulty': recipe.difficulty,
-                'cooking_time': recipe.cooking_time,
-                'servings': recipe.servings,
-            }
-            for recipe in recipe_list
-        ],
+    return json_response(render_list('recipes', [
+        cards[recipe_id] for recipe_id in recipe_ids if recipe_id in cards
+    ], {
         'total': total,
         'page': page,
         'page_size': limit,
         'total_pages': total_pages
-    }
+    }))
 
 
 @router.get("", response=PaginatedRecipesSchema)
@@ -687,8 +956,11 @@ async def list_recipes(
         limit: 페이지 크기 (기본: 20, 최대: 100)
         difficulty: 난이도 필터
         search: 검색어 (name, title)
+
+    Accept: application/x-ndjson 요청이면 필터를 적용한 전체 목록을 한 줄에 레시피 하나씩 스트리밍
+    (page/limit 무시, 서버 사이드 커서 사용)
     """
-    return await sync_to_async(_list_recipes_sync)(page, limit, difficulty, search)
+    return await sync_to_async(_list_recipes_sync)(page, limit, difficulty, search, wants_ndjson(request))
 
 
 # ==================== 냉장고 관리 API ====================
@@ -773,10 +1045,9 @@ async def get_fridge(request):
 
 def _add_ingredient_to_fridge_sync(fridge, ingredient_name: str):
     """냉장고에 재료 추가 동기 로직"""
-    # 정규화 재료 찾기
-    try:
-        normalized_ingredient = NormalizedIngredient.objects.get(name=ingredient_name)
-    except NormalizedIngredient.DoesNotExist:
+    # 정규화 재료 찾기 (별칭 테이블)
+    normalized_id = get_alias_table().resolve(ingredient_name)
+    if normalized_id is None:
         return JsonResponse(
             {'error': 'IngredientNotFound', 'message': f'재료를 찾을 수 없습니다: {ingredient_name}'},
             status=404
@@ -785,8 +1056,10 @@ def _add_ingredient_to_fridge_sync(fridge, ingredient_name: str):
     # 중복 체크 및 추가 (중복이어도 성공 처리)
     fi, created = FridgeIngredient.objects.get_or_create(
         fridge=fridge,
-        normalized_ingredient=normalized_ingredient
+        normalized_ingredient_id=normalized_id
     )
+    if created:
+        update_fridge_scores(fridge.id, added=[normalized_id])
 
     # 중복이든 신규든 성공으로 처리 (idempotent)
     return None
@@ -828,6 +1101,7 @@ def _remove_ingredient_from_fridge_sync(fridge, ingredient_id: int):
     try:
         fi = FridgeIngredient.objects.get(id=ingredient_id, fridge=fridge)
         fi.delete()
+        update_fridge_scores(fridge.id, removed=[fi.normalized_ingredient_id])
         return {'message': '재료가 제거되었습니다.'}
     except FridgeIngredient.DoesNotExist:
         return JsonResponse(
@@ -848,6 +1122,7 @@ async def remove_ingredient_from_fridge(request, ingredient_id: int):
 def _clear_fridge_sync(fridge):
     """냉장고 비우기 동기 로직"""
     FridgeIngredient.objects.filter(fridge=fridge).delete()
+    clear_fridge_scores(fridge.id)
     return {'message': '냉장고가 비워졌습니다.'}
 
 
@@ -899,11 +1174,19 @@ def _get_recipe_detail_sync(recipe_id: int):
 
 
 @router.get("/{recipe_id}", response=RecipeDetailSchema)
-async def get_recipe_detail(request, recipe_id: int):
+async def get_recipe_detail(request, response: HttpResponse, recipe_id: int):
     """
     레시피 상세 조회
 
     Args:
         recipe_id: 레시피 ID
+
+    ETag(데이터 버전 기반)가 If-None-Match와 일치하면 DB 조회 없이 304
+    (없는 레시피의 404 응답에는 ETag를 붙이지 않음)
     """
+    etag = make_etag('recipes:detail', await sync_to_async(get_data_version)(), recipe_id)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_cache_headers(response, etag)
     return await sync_to_async(_get_recipe_detail_sync)(recipe_id)
@@ -0,0 +1,10 @@
+"""
+레시피 API 벤치마크 (합성 카탈로그 생성 + 엔드포인트 측정)
+
+실행: python manage.py benchmark_recipes --size 10k --output report.json
+"""
+
+from .catalog import CATALOG_SIZES, CatalogSpec, catalog_exists, generate_catalog
+from .runner import ENDPOINTS, run_benchmarks
+
+__all__ = ['CATALOG_SIZES', 'CatalogSpec', 'catalog_exists', 'generate_catalog', 'ENDPOINTS', 'run_benchmarks']
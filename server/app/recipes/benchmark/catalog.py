@@ -0,0 +1,190 @@
+"""
+벤치마크용 합성 레시피 카탈로그
+
+같은 (레시피 수, seed)이면 항상 같은 카탈로그를 생성
+
+- 재료 사용 빈도: Zipf 분포 (소수의 재료가 대부분의 레시피에 등장)
+- 범용 조미료: 빈도 상위 재료 중 일부 (실제 데이터처럼 조미료가 가장 흔함)
+- 레시피 재료 수: 3 + Poisson(7), 최대 30개 (평균 약 10개)
+- 정규화되지 않은 재료 행: 약 5%
+"""
+
+from typing import Iterator, List, NamedTuple, Tuple
+import numpy as np
+from recipes.models import Recipe, Ingredient, NormalizedIngredient, IngredientCategory
+from recipes.services.data_version import bump_data_version
+from recipes.services.recipe_signature import refresh_recipe_signatures
+
+# 프리셋 카탈로그 크기
+CATALOG_SIZES = {
+    '10k': 10_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+# 생성 레시피 recipe_sno 접두사
+RECIPE_SNO_PREFIX = 'BENCH'
+
+ZIPF_EXPONENT = 1.1
+SEASONING_TOP_RATIO = 0.05  # 빈도 상위 5% 재료 중
+SEASONING_EVERY = 2  # 2개 중 1개를 범용 조미료로 지정
+UNNORMALIZED_RATIO = 0.05
+BATCH_SIZE = 5_000
+
+SYLLABLES = (
+    '가고구기나노누다도두라로리마모무미바보부비사소수시아오우이자조주지'
+    '차초추카코타토파포하호후김배파양당감고춧깨콩팥쌀떡면국탕찜볶전'
+)
+CATEGORY_CODES = (
+    ('meat', '육류'), ('vegetable', '채소류'), ('seafood', '해산물'),
+    ('grain', '곡물'), ('dairy', '유제품'), ('etc', '기타'),
+)
+DIFFICULTIES = ('아무나', '초보환영', '중급', '고급')
+COOKING_TIMES = ('5.0', '10.0', '15.0', '20.0', '30.0', '60.0', '90.0', '120.0')
+SERVINGS = ('1.0', '2.0', '3.0', '4.0', '6.0')
+
+
+class CatalogSpec(NamedTuple):
+    """카탈로그 생성 조건"""
+    recipes: int
+    seed: int = 42
+
+    @property
+    def ingredients(self) -> int:
+        """정규화 재료 종류 수 (레시피 수에 따라 500 ~ 5,000종)"""
+        return min(5_000, max(500, self.recipes // 20))
+
+    @property
+    def sno_prefix(self) -> str:
+        return f'{RECIPE_SNO_PREFIX}{self.seed}-'
+
+
+def ingredient_weights(n_ingredients: int) -> np.ndarray:
+    """빈도 순위별 재료 선택 확률 (Zipf)"""
+    weights = 1.0 / np.arange(1, n_ingredients + 1) ** ZIPF_EXPONENT
+    return weights / weights.sum()
+
+
+def is_seasoning_rank(rank: int, n_ingredients: int) -> bool:
+    """빈도 순위로 범용 조미료 여부 결정"""
+    return rank < n_ingredients * SEASONING_TOP_RATIO and rank % SEASONING_EVERY == 0
+
+
+def ingredient_names(spec: CatalogSpec) -> List[str]:
+    """빈도 순위별 재료명 (2~3음절, 중복 시 번호 추가)"""
+    rng = np.random.default_rng(spec.seed)
+    names, seen = [], set()
+    for rank in range(spec.ingredients):
+        length = 2 if rank % 3 else 3
+        name = ''.join(SYLLABLES[i] for i in rng.integers(0, len(SYLLABLES), size=length))
+        if name in seen:
+            name = f'{name}{rank}'
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def recipe_ingredient_ranks(spec: CatalogSpec) -> Iterator[List[Tuple[int, List[int]]]]:
+    """
+    BATCH_SIZE개 단위의 [(레시피 번호, 재료 빈도 순위 목록)]
+
+    재료는 Zipf 분포에서 복원 추출 후 레시피 안의 중복만 제거
+    """
+    rng = np.random.default_rng(spec.seed + 1)
+    weights = ingredient_weights(spec.ingredients)
+    for start in range(0, spec.recipes, BATCH_SIZE):
+        count = min(BATCH_SIZE, spec.recipes - start)
+        sizes = np.minimum(3 + rng.poisson(7, size=count), 30)
+        ranks = rng.choice(spec.ingredients, size=int(sizes.sum()), p=weights)
+        bounds = np.concatenate(([0], np.cumsum(sizes)))
+        yield [
+            (start + i, list(dict.fromkeys(ranks[bounds[i]:bounds[i + 1]].tolist())))
+            for i in range(count)
+        ]
+
+
+def catalog_exists(spec: CatalogSpec) -> bool:
+    """같은 조건의 카탈로그가 이미 DB에 있는지 여부"""
+    return Recipe.objects.filter(recipe_sno__startswith=spec.sno_prefix).count() == spec.recipes
+
+
+def generate_catalog(spec: CatalogSpec, stdout=None) -> dict:
+    """
+    합성 카탈로그를 DB에 생성 (bulk_create)
+
+    bulk_create는 시그널을 발생시키지 않으므로 마지막에
+    데이터 버전/재료 시그니처를 직접 갱신
+
+    Returns:
+        생성 통계 {'recipes', 'ingredients', 'ingredient_rows', 'seasonings'}
+    """
+    categories = [
+        IngredientCategory.objects.get_or_create(
+            code=code, category_type='normalized',
+            defaults={'name': name, 'display_order': order, 'is_active': True}
+        )[0]
+        for order, (code, name) in enumerate(CATEGORY_CODES, start=1)
+    ]
+    seasoning_category = IngredientCategory.objects.get_or_create(
+        code='seasoning', category_type='normalized',
+        defaults={'name': '조미료', 'display_order': len(categories) + 1, 'is_active': True}
+    )[0]
+
+    names = ingredient_names(spec)
+    existing = set(NormalizedIngredient.objects.filter(name__in=names).values_list('name', flat=True))
+    NormalizedIngredient.objects.bulk_create([
+        NormalizedIngredient(
+            name=name,
+            category=(
+                seasoning_category if is_seasoning_rank(rank, spec.ingredients)
+                else categories[rank % len(categories)]
+            ),
+            is_common_seasoning=is_seasoning_rank(rank, spec.ingredients)
+        )
+        for rank, name in enumerate(names)
+        if name not in existing
+    ], batch_size=BATCH_SIZE)
+    id_by_name = dict(NormalizedIngredient.objects.filter(name__in=names).values_list('name', 'id'))
+    ingredient_ids = [id_by_name[name] for name in names]
+
+    rng = np.random.default_rng(spec.seed + 2)
+    ingredient_rows = 0
+    for batch in recipe_ingredient_ranks(spec):
+        recipes = [
+            Recipe(
+                recipe_sno=f'{spec.sno_prefix}{number:07d}',
+                name=f'{names[ranks[0]]} {names[ranks[-1]]} 요리 {number}',
+                title=f'{names[ranks[0]]}{"와" if number % 2 else "로"} 만드는 요리 {number}',
+                servings=SERVINGS[number % len(SERVINGS)],
+                difficulty=DIFFICULTIES[number % len(DIFFICULTIES)],
+                cooking_time=COOKING_TIMES[number % len(COOKING_TIMES)],
+            )
+            for number, ranks in batch
+        ]
+        for recipe in recipes:
+            recipe.fill_derived_fields()
+        recipes = Recipe.objects.bulk_create(recipes)
+        ingredients = []
+        for recipe, (_, ranks) in zip(recipes, batch):
+            unnormalized = rng.random(len(ranks)) < UNNORMALIZED_RATIO
+            for rank, skip in zip(ranks, unnormalized):
+                ingredients.append(Ingredient(
+                    recipe=recipe,
+                    original_name=f'{names[rank]} 약간',
+                    normalized_name=names[rank],
+                    normalized_ingredient_id=None if skip else ingredient_ids[rank],
+                ))
+        Ingredient.objects.bulk_create(ingredients, batch_size=BATCH_SIZE)
+        ingredient_rows += len(ingredients)
+        if stdout is not None:
+            stdout.write(f'  레시피 {batch[-1][0] + 1:,} / {spec.recipes:,}')
+
+    bump_data_version()
+    refresh_recipe_signatures(Recipe.objects.filter(recipe_sno__startswith=spec.sno_prefix).values('id'))
+
+    return {
+        'recipes': spec.recipes,
+        'ingredients': spec.ingredients,
+        'ingredient_rows': ingredient_rows,
+        'seasonings': sum(is_seasoning_rank(rank, spec.ingredients) for rank in range(spec.ingredients)),
+    }
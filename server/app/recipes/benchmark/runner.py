@@ -0,0 +1,202 @@
+"""
+레시피 API 벤치마크 실행
+
+엔드포인트별로 같은 seed의 요청 목록을 Django 테스트 클라이언트로 실행하고
+지연 시간 백분위수(p50/p95/p99), 요청당 쿼리 수, 최대 RSS를 JSON 보고서로 반환
+
+첫 요청(cold)은 추천 인덱스 구축 등 초기화 비용이 포함되므로 백분위수와 별도로 기록
+추천 결과 캐시는 요청마다 비워 엔진 자체의 비용을 측정 (warm_cache=True이면 유지)
+"""
+
+import json
+import platform
+import resource
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+import django
+import numpy as np
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from recipes.models import (
+    Recipe, Ingredient, NormalizedIngredient, Fridge, FridgeIngredient, RecommendationSettings
+)
+from recipes.services.result_cache import recommendation_cache
+from .catalog import CatalogSpec, ingredient_names, ingredient_weights
+
+REPORT_SCHEMA_VERSION = 1
+API_PREFIX = '/fridge2fork/v1/recipes'
+FRIDGE_SESSIONS = 20
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, Linux는 KB 단위, macOS는 byte 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class Workload:
+    """엔드포인트 공통 요청 입력 (같은 seed이면 동일)"""
+
+    def __init__(self, spec: CatalogSpec, requests: int):
+        rng = np.random.default_rng(spec.seed + 3)
+        names = ingredient_names(spec)
+        weights = ingredient_weights(spec.ingredients)
+        # 사용자 재료: 인기 재료 위주 3~15개
+        self.ingredient_sets = [
+            [names[rank] for rank in dict.fromkeys(rng.choice(spec.ingredients, size=int(size), p=weights).tolist())]
+            for size in rng.integers(3, 16, size=requests)
+        ]
+        # 자동완성 검색어: 무작위 재료명의 앞 1~2글자
+        self.prefixes = [
+            names[int(rank)][:1 + i % 2]
+            for i, rank in enumerate(rng.integers(0, spec.ingredients, size=requests))
+        ]
+        self.pages = rng.integers(1, max(2, spec.recipes // 20), size=requests).tolist()
+
+
+def _session(i: int) -> Dict[str, str]:
+    return {'HTTP_X_SESSION_ID': f'benchmark-{i % FRIDGE_SESSIONS}'}
+
+
+def _endpoints(client: Client, workload: Workload) -> Dict[str, Callable[[int], object]]:
+    """엔드포인트 이름 → i번째 요청 함수"""
+
+    def fridge_remove(i):
+        # 삭제할 재료가 없으면 측정 전에 추가
+        fridge, _ = Fridge.objects.get_or_create(session_key=f'benchmark-{i % FRIDGE_SESSIONS}')
+        fridge_ingredient = FridgeIngredient.objects.filter(fridge=fridge).first()
+        if fridge_ingredient is None:
+            fridge_ingredient = FridgeIngredient.objects.create(
+                fridge=fridge,
+                normalized_ingredient=NormalizedIngredient.objects.get(name=workload.ingredient_sets[i][0])
+            )
+        return lambda: client.delete(f'{API_PREFIX}/fridge/ingredients/{fridge_ingredient.id}', **_session(i))
+
+    return {
+        'recommendations': lambda i: lambda: client.get(
+            f'{API_PREFIX}/recommendations', {'ingredients': ','.join(workload.ingredient_sets[i])}
+        ),
+        'recommend': lambda i: lambda: client.post(
+            f'{API_PREFIX}/recommend',
+            data=json.dumps({'ingredients': workload.ingredient_sets[i]}),
+            content_type='application/json'
+        ),
+        'search': lambda i: lambda: client.get(
+            f'{API_PREFIX}/search', {'ingredients': ','.join(workload.ingredient_sets[i][:2])}
+        ),
+        'autocomplete': lambda i: lambda: client.get(
+            f'{API_PREFIX}/ingredients/autocomplete', {'q': workload.prefixes[i]}
+        ),
+        'recipe_list': lambda i: lambda: client.get(API_PREFIX, {'page': workload.pages[i], 'limit': 20}),
+        'fridge_add': lambda i: lambda: client.post(
+            f'{API_PREFIX}/fridge/ingredients',
+            data=json.dumps({'ingredient_name': workload.ingredient_sets[i][0]}),
+            content_type='application/json',
+            **_session(i)
+        ),
+        'fridge_get': lambda i: lambda: client.get(f'{API_PREFIX}/fridge', **_session(i)),
+        'fridge_remove': fridge_remove,
+    }
+
+
+ENDPOINTS = (
+    'recommendations', 'recommend', 'search', 'autocomplete',
+    'recipe_list', 'fridge_add', 'fridge_get', 'fridge_remove',
+)
+
+
+def _measure(prepare: Callable[[int], Callable], requests: int, warm_cache: bool) -> dict:
+    """요청 requests+1회 실행 (첫 요청은 cold로 별도 기록)"""
+    latencies, queries, errors = [], [], 0
+    rss_before = peak_rss_mb()
+    for i in range(requests + 1):
+        call = prepare(i % requests)
+        if not warm_cache:
+            recommendation_cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            start = time.perf_counter()
+            response = call()
+            elapsed = (time.perf_counter() - start) * 1000
+        if response.status_code >= 400:
+            errors += 1
+        latencies.append(elapsed)
+        queries.append(len(captured.captured_queries))
+
+    cold_ms, latencies = latencies[0], np.array(latencies[1:])
+    queries = np.array(queries[1:])
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        'requests': requests,
+        'errors': errors,
+        'cold_ms': round(cold_ms, 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(latencies.mean()), 3),
+        'max_ms': round(float(latencies.max()), 3),
+        'queries_mean': round(float(queries.mean()), 2),
+        'queries_max': int(queries.max()),
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'rss_growth_mb': round(peak_rss_mb() - rss_before, 1),
+    }
+
+
+def run_benchmarks(
+    spec: CatalogSpec,
+    requests: int = 200,
+    endpoints: Optional[List[str]] = None,
+    warm_cache: bool = False,
+    generation_seconds: Optional[float] = None,
+    stdout=None
+) -> dict:
+    """
+    생성된 카탈로그에 대해 엔드포인트별 벤치마크 실행
+
+    Args:
+        spec: 카탈로그 생성 조건 (요청 입력 생성에 사용)
+        requests: 엔드포인트별 측정 요청 수 (cold 요청 제외)
+        endpoints: 측정할 엔드포인트 (None이면 ENDPOINTS 전체)
+        warm_cache: 추천 결과 캐시 유지 여부
+
+    Returns:
+        JSON 직렬화 가능한 보고서
+    """
+    workload = Workload(spec, requests)
+    prepared = _endpoints(Client(), workload)
+    settings = RecommendationSettings.get_settings()
+
+    results = {}
+    for name in endpoints or ENDPOINTS:
+        if stdout is not None:
+            stdout.write(f'  {name} ...')
+        results[name] = _measure(prepared[name], requests, warm_cache)
+
+    return {
+        'schema_version': REPORT_SCHEMA_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'catalog': {
+            'seed': spec.seed,
+            'recipes': Recipe.objects.count(),
+            'normalized_ingredients': NormalizedIngredient.objects.count(),
+            'ingredient_rows': Ingredient.objects.count(),
+            'seasonings': NormalizedIngredient.objects.filter(is_common_seasoning=True).count(),
+            'generation_seconds': generation_seconds,
+        },
+        'config': {
+            'requests': requests,
+            'warm_cache': warm_cache,
+            'scoring_mode': settings.scoring_mode,
+            'default_algorithm': settings.default_algorithm,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'numpy': np.__version__,
+            'database': connection.vendor,
+            'platform': platform.platform(),
+        },
+        'endpoints': results,
+    }
@@ -0,0 +1,93 @@
+"""
+레시피 API 벤치마크 Management Command
+
+별도의 테스트 데이터베이스(test_<DB명>)에 합성 카탈로그를 생성하고
+엔드포인트별 지연 시간/쿼리 수/최대 RSS를 JSON 보고서로 출력
+
+예:
+    python manage.py benchmark_recipes --size 100k --output bench-100k.json
+    python manage.py benchmark_recipes --size 1m --keepdb   # 생성한 카탈로그 재사용
+"""
+
+import json
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    setup_databases, teardown_databases, setup_test_environment, teardown_test_environment
+)
+from recipes.benchmark import (
+    CATALOG_SIZES, CatalogSpec, ENDPOINTS, catalog_exists, generate_catalog, run_benchmarks
+)
+
+
+class Command(BaseCommand):
+    """레시피 API 벤치마크 커맨드"""
+
+    help = '합성 레시피 카탈로그로 추천/검색/자동완성/목록/냉장고 API 성능을 측정합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--size', choices=sorted(CATALOG_SIZES), default='10k',
+            help='카탈로그 크기 프리셋 (기본: 10k)'
+        )
+        parser.add_argument('--recipes', type=int, help='레시피 수 직접 지정 (--size 대신 사용)')
+        parser.add_argument('--seed', type=int, default=42, help='데이터/요청 생성 seed (기본: 42)')
+        parser.add_argument('--requests', type=int, default=200, help='엔드포인트별 측정 요청 수 (기본: 200)')
+        parser.add_argument(
+            '--endpoints', type=str,
+            help=f'쉼표로 구분된 측정 엔드포인트 (기본: 전체 = {",".join(ENDPOINTS)})'
+        )
+        parser.add_argument('--output', type=str, help='JSON 보고서 저장 경로 (기본: 표준 출력)')
+        parser.add_argument('--keepdb', action='store_true', help='테스트 DB와 카탈로그를 유지하여 다음 실행에 재사용')
+        parser.add_argument('--warm-cache', action='store_true', help='추천 결과 캐시를 요청마다 비우지 않음')
+
+    def handle(self, *args, **options):
+        endpoints = None
+        if options['endpoints']:
+            endpoints = [name.strip() for name in options['endpoints'].split(',') if name.strip()]
+            unknown = set(endpoints) - set(ENDPOINTS)
+            if unknown:
+                raise CommandError(f'알 수 없는 엔드포인트: {", ".join(sorted(unknown))}')
+        if options['requests'] < 1:
+            raise CommandError('--requests는 1 이상이어야 합니다')
+
+        spec = CatalogSpec(options['recipes'] or CATALOG_SIZES[options['size']], options['seed'])
+
+        setup_test_environment()
+        old_config = setup_databases(
+            verbosity=0, interactive=False, keepdb=options['keepdb'], serialized_aliases=set()
+        )
+        try:
+            generation_seconds = None
+            if catalog_exists(spec):
+                self.stdout.write(self.style.SUCCESS(f'기존 카탈로그 사용 (레시피 {spec.recipes:,}개)'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'카탈로그 생성 시작 (레시피 {spec.recipes:,}개, seed {spec.seed})'))
+                start = time.perf_counter()
+                generate_catalog(spec, stdout=self.stdout)
+                generation_seconds = round(time.perf_counter() - start, 1)
+                self.stdout.write(self.style.SUCCESS(f'카탈로그 생성 완료 ({generation_seconds}초)'))
+
+            self.stdout.write(self.style.SUCCESS('벤치마크 시작'))
+            report = run_benchmarks(
+                spec, options['requests'], endpoints, options['warm_cache'],
+                generation_seconds, stdout=self.stdout
+            )
+        finally:
+            teardown_databases(old_config, verbosity=0, keepdb=options['keepdb'])
+            teardown_test_environment()
+
+        output = json.dumps(report, ensure_ascii=False, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(output)
+            self.stdout.write(self.style.SUCCESS(f'보고서 저장: {options["output"]}'))
+        else:
+            self.stdout.write(output)
+
+        for name, result in report['endpoints'].items():
+            self.stdout.write(
+                f'{name:16} p50 {result["p50_ms"]:9.2f}ms  p95 {result["p95_ms"]:9.2f}ms  '
+                f'p99 {result["p99_ms"]:9.2f}ms  queries {result["queries_mean"]:6.2f}  '
+                f'rss {result["peak_rss_mb"]:8.1f}MB  errors {result["errors"]}'
+            )
@@ -8,6 +8,8 @@ import csv
 import re
 from django.core.management.base import BaseCommand
 from recipes.models import Recipe, Ingredient, IngredientCategory
+from recipes.services.data_version import bump_data_version
+from recipes.services.recipe_signature import refresh_recipe_signatures
 
 
 class Command(BaseCommand):
@@ -90,8 +92,10 @@ class Command(BaseCommand):
 
                 imported_count += 1
 
-        # Recipe bulk create
+        # Recipe bulk create (bulk_create는 save()를 호출하지 않으므로 해석 필드 직접 채움)
         if recipes_to_create:
+            for recipe in recipes_to_create:
+                recipe.fill_derived_fields()
             Recipe.objects.bulk_create(recipes_to_create)
             self.stdout.write(self.style.SUCCESS(f'{len(recipes_to_create)}개 레시피 생성 완료'))
 
@@ -113,6 +117,13 @@ class Command(BaseCommand):
             Ingredient.objects.bulk_create(ingredients_to_create)
             self.stdout.write(self.style.SUCCESS(f'{len(ingredients_to_create)}개 재료 생성 완료'))
 
+        # bulk_create는 시그널을 발생시키지 않으므로 직접 데이터 버전/재료 시그니처 갱신
+        if recipes_to_create or ingredients_to_create:
+            bump_data_version()
+            refresh_recipe_signatures(
+                Recipe.objects.filter(recipe_sno__in=[recipe.recipe_sno for recipe in recipes_to_create]).values('id')
+            )
+
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nImport 완료! (생성: {imported_count}, 스킵: {skipped_count})'
@@ -0,0 +1,79 @@
+"""
+추천 인덱스 스냅샷 생성 Management Command
+
+현재 데이터 버전으로 추천 인덱스를 구축하여 바이너리 스냅샷으로 저장
+워커는 데이터 버전이 스냅샷과 같으면 DB 조회 없이 스냅샷을 mmap으로 공유
+
+--watch로 실행하면 공유 캐시의 데이터 버전을 주기적으로 확인하여 바뀔 때마다 스냅샷을 다시 생성
+(컨테이너마다 빌더 프로세스 1개, entrypoint.sh가 RECIPE_INDEX_SNAPSHOT_PATH 설정 시 백그라운드로 실행)
+워커는 버전이 바뀌면 새 스냅샷을 잠시 기다리고, 그래도 없으면 DB에서 구축한 뒤 스냅샷이 생기면 교체
+"""
+
+import os
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DatabaseError, close_old_connections
+from recipes.services.index_snapshot import get_snapshot_path
+from recipes.services.recipe_index import refresh_snapshot
+
+
+class Command(BaseCommand):
+    """추천 인덱스 스냅샷 생성 커맨드"""
+
+    help = '추천 인덱스를 워커 간 공유용 mmap 스냅샷 파일로 저장합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path', type=str,
+            help='스냅샷 파일 경로 (기본: RECIPE_INDEX_SNAPSHOT_PATH 설정)'
+        )
+        parser.add_argument(
+            '--watch', action='store_true',
+            help='데이터 버전이 바뀔 때마다 스냅샷을 다시 생성 (종료하지 않음)'
+        )
+        parser.add_argument(
+            '--interval', type=float,
+            default=getattr(settings, 'RECIPE_INDEX_SNAPSHOT_INTERVAL', 1.0),
+            help='--watch 데이터 버전 확인 주기 (초, 기본: RECIPE_INDEX_SNAPSHOT_INTERVAL 설정)'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path'] or get_snapshot_path()
+        if not path:
+            raise CommandError('--path 또는 RECIPE_INDEX_SNAPSHOT_PATH 설정이 필요합니다')
+
+        self._watching = options['watch']
+        if not self._watching:
+            self._refresh(path)
+            return
+
+        self.stdout.write(f'데이터 버전 감시 시작: {path} ({options["interval"]}초 간격)')
+        try:
+            while True:
+                try:
+                    self._refresh(path)
+                except (DatabaseError, OSError) as e:
+                    # 일시적 DB/파일 오류는 다음 주기에 재시도 (워커는 DB에서 직접 구축)
+                    self.stderr.write(f'스냅샷 생성 실패: {e}')
+                time.sleep(options['interval'])
+                # 대기 중 끊긴 DB 연결 정리 (CONN_MAX_AGE)
+                close_old_connections()
+        except KeyboardInterrupt:
+            pass
+
+    def _refresh(self, path: str):
+        """스냅샷이 현재 데이터 버전이 아니면 다시 생성"""
+        start = time.perf_counter()
+        index = refresh_snapshot(path)
+        if index is None:
+            if not self._watching:
+                self.stdout.write(f'스냅샷이 이미 현재 데이터 버전입니다: {path}')
+            return
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'스냅샷 저장 완료: {path} (레시피 {len(index.recipe_ids):,}개, '
+            f'재료 {len(index.ingredient_ids):,}종, {size / 1024 / 1024:.1f}MB, {elapsed:.1f}초, 버전 {index.version})'
+        ))
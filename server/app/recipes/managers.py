@@ -2,23 +2,51 @@
 Ingredient QuerySet 및 Manager
 """
 
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db import models
 
 
 class IngredientQuerySet(models.QuerySet):
     """Ingredient 커스텀 QuerySet"""
 
-    def search_normalized(self, name):
+    def search_normalized(self, name, fuzzy=False, threshold=None):
         """
         정규화된 재료명으로 검색
 
         Args:
             name: 검색할 정규화 재료명
+            fuzzy: True이면 유사한 재료명도 검색 (pg_trgm 확장 필요, 없으면 정확히 일치하는 재료만)
+            threshold: 유사도 최솟값 (기본값: settings.INGREDIENT_FUZZY_THRESHOLD)
 
         Returns:
             QuerySet: 해당 정규화 재료와 연결된 Ingredient들
+            (fuzzy=True이면 similarity 주석 포함, 유사도 내림차순)
         """
-        return self.filter(normalized_ingredient__name=name)
+        if not fuzzy:
+            return self.filter(normalized_ingredient__name=name)
+
+        from recipes.services.ingredient_matching import PG_TRGM_DEFAULT_THRESHOLD, trigram_available
+        if not trigram_available():
+            return (
+                self.filter(normalized_ingredient__name=name)
+                .annotate(similarity=models.Value(1.0, output_field=models.FloatField()))
+                .order_by('id')
+            )
+
+        if threshold is None:
+            threshold = getattr(settings, 'INGREDIENT_FUZZY_THRESHOLD', 0.3)
+        queryset = self
+        # trigram GIN 인덱스 조건(%)은 pg_trgm.similarity_threshold 이상만 찾으므로
+        # 그보다 낮은 최솟값이면 인덱스 조건 없이 유사도로만 필터
+        if threshold >= PG_TRGM_DEFAULT_THRESHOLD:
+            queryset = queryset.filter(normalized_ingredient__name__trigram_similar=name)
+        return (
+            queryset
+            .annotate(similarity=TrigramSimilarity('normalized_ingredient__name', name))
+            .filter(similarity__gte=threshold)
+            .order_by('-similarity', 'id')
+        )
 
     def exclude_seasonings(self):
         """
@@ -58,9 +86,9 @@ class IngredientManager(models.Manager):
         """커스텀 QuerySet 반환"""
         return IngredientQuerySet(self.model, using=self._db)
 
-    def search_normalized(self, name):
-        """정규화된 재료명으로 검색"""
-        return self.get_queryset().search_normalized(name)
+    def search_normalized(self, name, fuzzy=False, threshold=None):
+        """정규화된 재료명으로 검색 (fuzzy=True이면 유사도 검색)"""
+        return self.get_queryset().search_normalized(name, fuzzy=fuzzy, threshold=threshold)
 
     def exclude_seasonings(self):
         """범용 조미료 제외"""
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0011_alter_recommendationsettings_default_algorithm_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='recommendationsettings',
+            name='default_algorithm',
+            field=models.CharField(choices=[('jaccard', 'Jaccard (자카드) - 교집합/합집합 방식, 직관적이고 간단함 (권장)'), ('cosine', 'Cosine (코사인) - 벡터 각도 방식, 재료 개수 차이에 덜 민감함'), ('coverage', '레시피 기준 매칭률 - 보유 재료 수/레시피 재료 수, 사용자 재료가 많아도 점수가 낮아지지 않음'), ('seasoning_bonus', '조미료 보너스 - 필수 재료 매칭률 + 조미료 매칭 시 최대 5% 가산')], default='jaccard', help_text='추천에 사용할 유사도 알고리즘. 사용자가 지정하지 않으면 이 값을 사용', max_length=20, verbose_name='기본 알고리즘'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0012_recommendationsettings_scorer_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendationsettings',
+            name='scoring_mode',
+            field=models.CharField(choices=[('memory', '인메모리 인덱스 - 프로세스별 희소 행렬로 계산, 가장 빠름 (권장)'), ('database', 'DB 집계 - 레시피별 GROUP BY 쿼리로 계산, 워커 메모리 절약')], default='memory', help_text='인메모리 인덱스 또는 DB 집계 쿼리. DB 집계는 레시피 데이터가 커서 워커 메모리가 부족할 때 사용', max_length=10, verbose_name='점수 계산 방식'),
+        ),
+    ]
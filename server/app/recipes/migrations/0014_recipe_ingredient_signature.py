@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 01:41
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0013_recommendationsettings_scoring_mode'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='essential_signature',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, editable=False, help_text='범용 조미료를 제외한 정규화 재료 ID 목록 (오름차순)', size=None, verbose_name='필수 재료 시그니처'),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='ingredient_signature',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.IntegerField(), blank=True, default=list, editable=False, help_text='레시피의 정규화 재료 ID 목록 (오름차순)', size=None, verbose_name='재료 시그니처'),
+        ),
+        migrations.AddIndex(
+            model_name='recipe',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['ingredient_signature'], name='recipe_signature_gin_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recipe',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['essential_signature'], name='recipe_essential_sig_gin_idx'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:10
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_recipe_signatures(apps, schema_editor):
+    """
+    기존 레시피의 재료 시그니처 채우기
+
+    services.recipe_signature.refresh_recipe_signatures()와 같은 UPDATE 1회
+    """
+    Recipe = apps.get_model('recipes', 'Recipe')
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+
+    def signature(exclude_seasonings):
+        ingredients = Ingredient.objects.filter(recipe=OuterRef('pk'), normalized_ingredient__isnull=False)
+        if exclude_seasonings:
+            ingredients = ingredients.exclude(normalized_ingredient__is_common_seasoning=True)
+        ids = (
+            ingredients
+            .order_by()
+            .values('recipe')
+            .annotate(ids=ArrayAgg('normalized_ingredient_id', distinct=True, order_by='normalized_ingredient_id'))
+            .values('ids')
+        )
+        return Coalesce(Subquery(ids), Value([]), output_field=ArrayField(models.IntegerField()))
+
+    Recipe.objects.update(
+        ingredient_signature=signature(False),
+        essential_signature=signature(True),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0014_recipe_ingredient_signature'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_recipe_signatures, migrations.RunPython.noop),
+    ]
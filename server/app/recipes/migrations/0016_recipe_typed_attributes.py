@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0015_backfill_recipe_signatures'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='cooking_minutes',
+            field=models.PositiveIntegerField(blank=True, editable=False, help_text='cooking_time에서 해석한 분 단위 조리시간', null=True, verbose_name='조리시간(분)'),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='difficulty_level',
+            field=models.PositiveSmallIntegerField(blank=True, choices=[(1, '아무나'), (2, '초급'), (3, '중급'), (4, '고급'), (5, '신의경지')], editable=False, help_text='difficulty에서 해석한 난이도 단계', null=True, verbose_name='난이도 단계'),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='servings_count',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='servings에서 해석한 인분 수', null=True, verbose_name='인분 수'),
+        ),
+        migrations.AddIndex(
+            model_name='recipe',
+            index=models.Index(fields=['cooking_minutes'], name='recipe_cooking_minutes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='recipe',
+            index=models.Index(fields=['difficulty_level', 'cooking_minutes'], name='recipe_level_minutes_idx'),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:08
+
+from django.db import migrations
+
+from recipes.models import parse_cooking_minutes, parse_difficulty_level, parse_servings_count
+
+BATCH_SIZE = 2000
+
+
+def backfill_recipe_typed_attributes(apps, schema_editor):
+    """
+    기존 레시피의 조리시간(분)/인분 수/난이도 단계 채우기
+
+    Recipe.fill_typed_fields()와 같은 해석, ID 순 BATCH_SIZE개씩 bulk_update
+    """
+    Recipe = apps.get_model('recipes', 'Recipe')
+
+    last_id = 0
+    while True:
+        recipes = list(
+            Recipe.objects
+            .filter(id__gt=last_id)
+            .order_by('id')
+            .only('id', 'cooking_time', 'servings', 'difficulty')[:BATCH_SIZE]
+        )
+        if not recipes:
+            break
+        for recipe in recipes:
+            recipe.cooking_minutes = parse_cooking_minutes(recipe.cooking_time)
+            recipe.servings_count = parse_servings_count(recipe.servings)
+            recipe.difficulty_level = parse_difficulty_level(recipe.difficulty)
+        Recipe.objects.bulk_update(recipes, ['cooking_minutes', 'servings_count', 'difficulty_level'])
+        last_id = recipes[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0016_recipe_typed_attributes'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_recipe_typed_attributes, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:20
+
+import django.contrib.postgres.search
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0017_backfill_recipe_typed_attributes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recipe',
+            name='search_tokens',
+            field=models.TextField(blank=True, default='', editable=False, help_text='title/name/introduction의 음절 unigram + bigram 토큰 (tsvector 리터럴)', verbose_name='검색 토큰'),
+        ),
+        migrations.AddField(
+            model_name='recipe',
+            name='search_vector',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Cast('search_tokens', django.contrib.postgres.search.SearchVectorField()), output_field=django.contrib.postgres.search.SearchVectorField(), verbose_name='검색 벡터'),
+        ),
+    ]
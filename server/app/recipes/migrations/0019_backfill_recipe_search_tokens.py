@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:24
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from recipes.text_search import ngram_tokens
+
+BATCH_SIZE = 2000
+
+
+def backfill_recipe_search_tokens(apps, schema_editor):
+    """
+    기존 레시피의 검색 토큰 채우기 (search_vector는 DB가 계산)
+
+    Recipe.fill_search_tokens()와 같은 토큰, ID 순 BATCH_SIZE개씩 bulk_update
+    """
+    Recipe = apps.get_model('recipes', 'Recipe')
+
+    last_id = 0
+    while True:
+        recipes = list(
+            Recipe.objects
+            .filter(id__gt=last_id)
+            .order_by('id')
+            .only('id', 'title', 'name', 'introduction')[:BATCH_SIZE]
+        )
+        if not recipes:
+            break
+        for recipe in recipes:
+            recipe.search_tokens = ngram_tokens(recipe.title, recipe.name, recipe.introduction)
+        Recipe.objects.bulk_update(recipes, ['search_tokens'])
+        last_id = recipes[-1].id
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0018_recipe_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_recipe_search_tokens, migrations.RunPython.noop),
+        # 토큰을 채운 뒤 인덱스 생성
+        migrations.AddIndex(
+            model_name='recipe',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='recipe_search_vector_gin_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+TRGM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['name'], name='normalized_name_trgm_idx', opclasses=['gin_trgm_ops']
+)
+
+
+def _trigram_extension_available(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm')")
+        return cursor.fetchone()[0]
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    pg_trgm 확장과 정규화 재료명 trigram GIN 인덱스 생성
+
+    확장을 설치할 수 없는 DB에서는 건너뜀 (재료명 유사도 매칭 비활성화)
+    """
+    if not _trigram_extension_available(schema_editor):
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.add_index(apps.get_model('recipes', 'NormalizedIngredient'), TRGM_INDEX)
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f'DROP INDEX IF EXISTS {schema_editor.quote_name(TRGM_INDEX.name)}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0019_backfill_recipe_search_tokens'),
+    ]
+
+    # 인덱스는 DB에 따라 생성되지 않을 수 있으므로 마이그레이션 상태(모델 Meta.indexes)에는 기록하지 않음
+    operations = [
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0020_normalized_name_trgm_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngredientAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, help_text='레코드가 생성된 시각', verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='레코드가 마지막으로 수정된 시각', verbose_name='수정일시')),
+                ('alias', models.CharField(help_text='사용자가 입력하는 재료명 (예: 쇠고기)', max_length=100, unique=True, verbose_name='별칭')),
+                ('normalized_ingredient', models.ForeignKey(help_text='별칭이 가리키는 정규화 재료', on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='recipes.normalizedingredient', verbose_name='정규화 재료')),
+            ],
+            options={
+                'verbose_name': '재료 별칭',
+                'verbose_name_plural': '재료 별칭',
+                'ordering': ['alias'],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0021_ingredient_alias'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='normalizedingredient',
+            name='recipe_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='이 재료를 쓰는 레시피 수 (자동완성/재료 목록 정렬)', verbose_name='사용 레시피 수'),
+        ),
+        migrations.AddIndex(
+            model_name='normalizedingredient',
+            index=models.Index(fields=['-recipe_count', 'name'], name='normalized_recipe_count_idx'),
+        ),
+    ]
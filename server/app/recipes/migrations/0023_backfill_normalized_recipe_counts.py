@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:38
+
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_recipe_counts(apps, schema_editor):
+    """
+    기존 정규화 재료의 사용 레시피 수 채우기
+
+    services.ingredient_usage.refresh_recipe_counts()와 같은 UPDATE 1회
+    """
+    NormalizedIngredient = apps.get_model('recipes', 'NormalizedIngredient')
+    Ingredient = apps.get_model('recipes', 'Ingredient')
+
+    counts = (
+        Ingredient.objects
+        .filter(normalized_ingredient=OuterRef('pk'))
+        .order_by()
+        .values('normalized_ingredient')
+        .annotate(recipes=Count('recipe', distinct=True))
+        .values('recipes')
+    )
+    NormalizedIngredient.objects.update(recipe_count=Coalesce(Subquery(counts), Value(0)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipes', '0022_normalizedingredient_recipe_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_recipe_counts, migrations.RunPython.noop),
+    ]
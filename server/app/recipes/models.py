@@ -4,10 +4,16 @@ Recipe 모델 정의
 레시피 데이터를 저장하는 모델
 """
 
+import re
 from django.db import models
+from django.db.models.functions import Cast
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
 from core.models import CommonModel
+from .text_search import ngram_tokens
 
 User = get_user_model()
 
@@ -78,13 +84,71 @@ class IngredientCategory(CommonModel):
         return f"{self.name} ({self.get_category_type_display()})"
 
 
+# 원본 난이도 문자열 → 난이도 단계 (Recipe.difficulty_level)
+DIFFICULTY_LEVELS = {
+    '아무나': 1,
+    '초급': 2,
+    '초보환영': 2,
+    '쉬움': 2,
+    '중급': 3,
+    '보통': 3,
+    '고급': 4,
+    '어려움': 4,
+    '신의경지': 5,
+}
+
+_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+
+def parse_cooking_minutes(value: str):
+    """
+    조리시간 문자열 → 분 (해석할 수 없으면 None)
+
+    예: "30.0" → 30, "30분이내" → 30, "2시간이상" → 120, "1시간 30분" → 90
+    """
+    value = (value or '').strip()
+    hours = re.search(r'(\d+(?:\.\d+)?)\s*시간', value)
+    minutes = re.search(r'(\d+(?:\.\d+)?)\s*분', value)
+    if hours or minutes:
+        total = (float(hours.group(1)) * 60 if hours else 0) + (float(minutes.group(1)) if minutes else 0)
+        return round(total)
+    number = _NUMBER_PATTERN.fullmatch(value)
+    return round(float(number.group())) if number else None
+
+
+def parse_servings_count(value: str):
+    """
+    인분 문자열 → 인분 수 (해석할 수 없으면 None)
+
+    예: "2.0" → 2, "6인분이상" → 6
+    """
+    number = _NUMBER_PATTERN.search(value or '')
+    return round(float(number.group())) if number else None
+
+
+def parse_difficulty_level(value: str):
+    """난이도 문자열 → 난이도 단계 (DIFFICULTY_LEVELS에 없으면 None)"""
+    return DIFFICULTY_LEVELS.get((value or '').replace(' ', ''))
+
+
 class Recipe(CommonModel):
     """
     레시피 모델
 
     원본 CSV 데이터의 필드명을 유지하면서 한글 verbose_name 제공
+    cooking_minutes/servings_count/difficulty_level은 원본 문자열에서 해석한 값
+    search_tokens/search_vector는 title/name/introduction의 n-gram 검색 토큰과 tsvector
+    (save() 또는 fill_derived_fields()로 채움, bulk_create 시 직접 호출)
     """
 
+    DIFFICULTY_LEVEL_CHOICES = [
+        (1, '아무나'),
+        (2, '초급'),
+        (3, '중급'),
+        (4, '고급'),
+        (5, '신의경지'),
+    ]
+
     recipe_sno = models.CharField(
         max_length=50,
         unique=True,
@@ -170,6 +234,59 @@ class Recipe(CommonModel):
         verbose_name="스크랩수",
         help_text="SRAP_CNT"
     )
+    cooking_minutes = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="조리시간(분)",
+        help_text="cooking_time에서 해석한 분 단위 조리시간"
+    )
+    servings_count = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="인분 수",
+        help_text="servings에서 해석한 인분 수"
+    )
+    difficulty_level = models.PositiveSmallIntegerField(
+        choices=DIFFICULTY_LEVEL_CHOICES,
+        null=True,
+        blank=True,
+        editable=False,
+        verbose_name="난이도 단계",
+        help_text="difficulty에서 해석한 난이도 단계"
+    )
+    # 재료 시그니처 (services.recipe_signature가 관리, 직접 수정 금지)
+    ingredient_signature = ArrayField(
+        models.IntegerField(),
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="재료 시그니처",
+        help_text="레시피의 정규화 재료 ID 목록 (오름차순)"
+    )
+    essential_signature = ArrayField(
+        models.IntegerField(),
+        default=list,
+        blank=True,
+        editable=False,
+        verbose_name="필수 재료 시그니처",
+        help_text="범용 조미료를 제외한 정규화 재료 ID 목록 (오름차순)"
+    )
+    # 전문 검색 (text_search.ngram_tokens, search_vector는 DB 생성 컬럼)
+    search_tokens = models.TextField(
+        blank=True,
+        default='',
+        editable=False,
+        verbose_name="검색 토큰",
+        help_text="title/name/introduction의 음절 unigram + bigram 토큰 (tsvector 리터럴)"
+    )
+    search_vector = models.GeneratedField(
+        expression=Cast('search_tokens', SearchVectorField()),
+        output_field=SearchVectorField(),
+        db_persist=True,
+        verbose_name="검색 벡터"
+    )
 
     class Meta:
         verbose_name = "레시피"
@@ -183,8 +300,38 @@ class Recipe(CommonModel):
             models.Index(fields=['recipe_type'], name='recipe_type_idx'),
             models.Index(fields=['difficulty', 'cooking_time'], name='recipe_difficulty_time_idx'),
             models.Index(fields=['-created_at'], name='recipe_created_idx'),
+            models.Index(fields=['cooking_minutes'], name='recipe_cooking_minutes_idx'),
+            models.Index(fields=['difficulty_level', 'cooking_minutes'], name='recipe_level_minutes_idx'),
+            GinIndex(fields=['ingredient_signature'], name='recipe_signature_gin_idx'),
+            GinIndex(fields=['essential_signature'], name='recipe_essential_sig_gin_idx'),
+            GinIndex(fields=['search_vector'], name='recipe_search_vector_gin_idx'),
         ]
 
+    def fill_typed_fields(self):
+        """원본 문자열에서 조리시간(분)/인분 수/난이도 단계 채우기"""
+        self.cooking_minutes = parse_cooking_minutes(self.cooking_time)
+        self.servings_count = parse_servings_count(self.servings)
+        self.difficulty_level = parse_difficulty_level(self.difficulty)
+
+    def fill_search_tokens(self):
+        """제목/이름/소개에서 검색 토큰 채우기"""
+        self.search_tokens = ngram_tokens(self.title, self.name, self.introduction)
+
+    def fill_derived_fields(self):
+        """원본 필드에서 계산하는 필드 전체 채우기 (bulk_create 전 호출)"""
+        self.fill_typed_fields()
+        self.fill_search_tokens()
+
+    def save(self, *args, **kwargs):
+        """저장 시 해석 필드/검색 토큰 갱신"""
+        self.fill_derived_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = set(update_fields) | {
+                'cooking_minutes', 'servings_count', 'difficulty_level', 'search_tokens'
+            }
+        super().save(*args, **kwargs)
+
     def __str__(self):
         """레시피 문자열 표현"""
         return self.name
@@ -233,6 +380,13 @@ class NormalizedIngredient(CommonModel):
         verbose_name="설명",
         help_text="관리자용 메모"
     )
+    # 레시피 시그니처 재계산 시 함께 갱신 (services.ingredient_usage)
+    recipe_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name="사용 레시피 수",
+        help_text="이 재료를 쓰는 레시피 수 (자동완성/재료 목록 정렬)"
+    )
 
     class Meta:
         verbose_name = "정규화 재료"
@@ -242,7 +396,10 @@ class NormalizedIngredient(CommonModel):
             models.Index(fields=['category'], name='normalized_category_idx'),
             models.Index(fields=['is_common_seasoning'], name='normalized_seasoning_idx'),
             models.Index(fields=['category', 'is_common_seasoning'], name='normalized_cat_season_idx'),
+            models.Index(fields=['-recipe_count', 'name'], name='normalized_recipe_count_idx'),
         ]
+        # 재료명 유사도 검색용 trigram GIN 인덱스(normalized_name_trgm_idx)는 마이그레이션 0020이
+        # pg_trgm 확장을 설치할 수 있는 DB에서만 생성 (DB마다 다르므로 모델 상태에는 포함하지 않음)
 
     def __str__(self):
         """정규화 재료 문자열 표현"""
@@ -340,6 +497,38 @@ class Ingredient(CommonModel):
         return self.original_name
 
 
+class IngredientAlias(CommonModel):
+    """
+    재료 별칭 모델
+
+    사용자가 입력하는 다른 이름(예: 쇠고기 → 소고기)을 정규화 재료에 연결 (관리자 등록)
+    Ingredient.original_name 연결보다 우선 적용 (services.ingredient_aliases)
+    """
+
+    alias = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name="별칭",
+        help_text="사용자가 입력하는 재료명 (예: 쇠고기)"
+    )
+    normalized_ingredient = models.ForeignKey(
+        NormalizedIngredient,
+        on_delete=models.CASCADE,
+        related_name='aliases',
+        verbose_name="정규화 재료",
+        help_text="별칭이 가리키는 정규화 재료"
+    )
+
+    class Meta:
+        verbose_name = "재료 별칭"
+        verbose_name_plural = "재료 별칭"
+        ordering = ['alias']
+
+    def __str__(self):
+        """별칭 문자열 표현"""
+        return f"{self.alias} → {self.normalized_ingredient.name}"
+
+
 class Fridge(CommonModel):
     """
     냉장고 모델
@@ -438,9 +627,16 @@ class RecommendationSettings(models.Model):
     관리자가 추천 API의 기본값을 설정할 수 있음
     """
 
+    # services.scoring 레지스트리에 같은 이름의 알고리즘이 등록되어 있어야 함
     ALGORITHM_CHOICES = [
-        ('jaccard', 'Jaccard (자카드) - 교집합/합집합 방식, 직관적이고 간단함 (권장)'),
+        ('jaccard', 'Jaccard (자카드) - 교집합/합집합 방식, 사용자 재료가 많을수록 점수가 낮아짐'),
         ('cosine', 'Cosine (코사인) - 벡터 각도 방식, 재료 개수 차이에 덜 민감함'),
+        ('coverage', '레시피 기준 매칭률 - 보유 재료 수/레시피 재료 수, 사용자 재료가 많아도 점수가 낮아지지 않음 (권장)'),
+        ('seasoning_bonus', '조미료 보너스 - 필수 재료 매칭률 + 조미료 매칭 시 최대 5% 가산'),
+    ]
+    SCORING_MODE_CHOICES = [
+        ('memory', '인메모리 인덱스 - 프로세스별 희소 행렬로 계산, 가장 빠름 (권장)'),
+        ('database', 'DB 집계 - 레시피별 GROUP BY 쿼리로 계산, 워커 메모리 절약'),
     ]
 
     min_match_rate = models.FloatField(
@@ -452,10 +648,17 @@ class RecommendationSettings(models.Model):
     default_algorithm = models.CharField(
         max_length=20,
         choices=ALGORITHM_CHOICES,
-        default='jaccard',
+        default='coverage',
         verbose_name="기본 알고리즘",
         help_text="추천에 사용할 유사도 알고리즘. 사용자가 지정하지 않으면 이 값을 사용"
     )
+    scoring_mode = models.CharField(
+        max_length=10,
+        choices=SCORING_MODE_CHOICES,
+        default='memory',
+        verbose_name="점수 계산 방식",
+        help_text="인메모리 인덱스 또는 DB 집계 쿼리. DB 집계는 레시피 데이터가 커서 워커 메모리가 부족할 때 사용"
+    )
     default_limit = models.IntegerField(
         default=20,
         validators=[MinValueValidator(1), MaxValueValidator(100)],
@@ -493,7 +696,7 @@ class RecommendationSettings(models.Model):
             pk=1,
             defaults={
                 'min_match_rate': 0.3,
-                'default_algorithm': 'jaccard',
+                'default_algorithm': 'coverage',
                 'default_limit': 20,
                 'exclude_seasonings_default': True
             }
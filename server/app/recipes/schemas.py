@@ -3,7 +3,7 @@
 """
 
 from ninja import Schema
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -32,6 +32,7 @@ class RecipeSearchResponseSchema(Schema):
     recipes: List[RecipeSchema]
     total: int
     matched_ingredients: List[str]
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지이면 None)
 
 
 class RecipeRecommendRequestSchema(Schema):
@@ -46,9 +47,21 @@ class RecipeRecommendResponseSchema(Schema):
     match_rate: str  # 예: "80% 이상 매칭"
 
 
+class RecipeBatchRecommendRequestSchema(Schema):
+    """일괄 레시피 추천 요청 스키마"""
+    ingredient_sets: List[List[str]]  # 재료 조합 목록 (조합별 정규화 재료명)
+    exclude_seasonings: bool = True
+    limit: int = 20  # 조합별 추천 레시피 최대 개수 (범위: 1-100)
+
+
+class RecipeBatchRecommendResponseSchema(Schema):
+    """일괄 레시피 추천 응답 스키마"""
+    results: List[RecipeRecommendResponseSchema]  # ingredient_sets 순서
+
+
 class RecommendedRecipeSchema(RecipeSchema):
     """추천 레시피 스키마 (GET /recommendations용)"""
-    match_score: float  # 유사도 점수 (0.0 ~ 1.0)
+    match_score: float  # 유사도 점수 (0.0 ~ 1.0, seasoning_bonus는 최대 1.05)
     matched_count: int  # 매칭된 재료 수
     total_count: int  # 레시피 전체 재료 수
     algorithm: str  # 사용된 알고리즘
@@ -58,8 +71,39 @@ class RecipeRecommendationsResponseSchema(Schema):
     """레시피 추천 응답 스키마 (GET /recommendations용)"""
     recipes: List[RecommendedRecipeSchema]
     total: int
+    total_is_exact: bool = True  # False이면 total은 추정값 (exact_total=false)
     algorithm: str
     summary: str  # 예: "85% 이상 매칭"
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지이면 None)
+    facets: Optional[Dict[str, Dict[str, int]]] = None  # 패싯 필드 → {값: 레시피 수} (facet_counts=true일 때)
+
+
+class MissingIngredientSchema(Schema):
+    """부족한 재료 스키마"""
+    id: int
+    name: str
+    category: str
+
+
+class NearMissRecipeSchema(RecipeSchema):
+    """필수 재료가 조금 부족한 레시피 스키마"""
+    missing_ingredients: List[MissingIngredientSchema]
+    missing_count: int  # 부족한 필수 재료 수
+    matched_count: int  # 보유한 필수 재료 수
+    total_count: int  # 레시피 필수 재료 수
+
+
+class ShoppingListItemSchema(MissingIngredientSchema):
+    """장보기 목록 항목 스키마"""
+    unlocks: int  # 이 재료만 사면 만들 수 있게 되는 레시피 수
+    near_miss_count: int  # 이 재료가 부족한 레시피 수
+
+
+class NearMissResponseSchema(Schema):
+    """거의 만들 수 있는 레시피 + 장보기 목록 응답 스키마"""
+    recipes: List[NearMissRecipeSchema]
+    shopping_list: List[ShoppingListItemSchema]
+    total: int
 
 
 class IngredientCategorySchema(Schema):
@@ -77,6 +121,7 @@ class NormalizedIngredientSchema(Schema):
     name: str
     category: Optional[IngredientCategorySchema] = None
     is_common_seasoning: bool
+    recipe_count: int = 0  # 이 재료를 쓰는 레시피 수 (정렬 기준)
 
 
 class NormalizedIngredientListResponseSchema(Schema):
@@ -0,0 +1,28 @@
+"""
+레시피 데이터 버전 관리
+
+레시피/재료 데이터가 변경될 때마다 버전 토큰을 갱신하여
+프로세스별 인메모리 인덱스가 재구축 시점을 판단할 수 있도록 함
+(토큰은 공유 캐시에 저장되어 모든 워커/파드가 같은 버전을 봄, core.data_version 참고)
+"""
+
+from core.data_version import DataVersion
+
+DATA_VERSION_CACHE_KEY = 'recipes:data_version'
+
+_data_version = DataVersion(DATA_VERSION_CACHE_KEY)
+
+
+def get_data_version() -> str:
+    """
+    현재 데이터 버전 조회
+
+    Returns:
+        버전 토큰 문자열
+    """
+    return _data_version.get()
+
+
+def bump_data_version():
+    """데이터 버전 갱신 (즉시 한 번, 트랜잭션 커밋 후 한 번 더)"""
+    _data_version.bump()
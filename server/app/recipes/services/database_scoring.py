@@ -0,0 +1,146 @@
+"""
+DB 집계 기반 레시피 추천
+
+인메모리 인덱스(recipe_index) 대신 레시피별 GROUP BY 집계 쿼리 1회로
+매칭 수/재료 수/점수를 계산하고 정렬·LIMIT까지 DB에서 처리
+→ 프로세스별 인덱스 메모리 없이 상위 limit개만 전송
+
+RecommendationSettings.scoring_mode='database'일 때 사용
+"""
+
+from typing import Dict, Iterable, Optional
+from django.db.models import Count, F, FloatField, Q, Window
+from django.db.models.functions import Cast
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from .recipe_index import FACET_FIELDS, MatchResult, RecipeMatch
+from .scoring import SqlScoreInputs, get_scorer
+
+
+def _distinct_count(condition: Q) -> Count:
+    """조건을 만족하는 고유 정규화 재료 수"""
+    return Count('normalized_ingredient_id', distinct=True, filter=condition or None)
+
+
+def _as_float(name: str) -> Cast:
+    """정수 집계값을 float로 변환 (PostgreSQL 정수 나눗셈 방지)"""
+    return Cast(F(name), FloatField())
+
+
+def _facet_counts(recipe_ids) -> Dict[str, Dict[str, int]]:
+    """레시피 집합의 패싯 값별 레시피 수 (RecipeIndex.facet_counts와 같은 순서: 많은 순 → 값, DB 정렬 규칙과 무관하게 파이썬에서 정렬)"""
+    counts = {}
+    recipes = Recipe.objects.filter(id__in=recipe_ids).order_by()
+    for field in FACET_FIELDS:
+        rows = (
+            recipes
+            .exclude(**{f'{field}__isnull': True})
+            .exclude(**{field: ''})
+            .values_list(field)
+            .annotate(count=Count('id'))
+        )
+        counts[field] = dict(sorted(rows, key=lambda row: (-row[1], row[0])))
+    return counts
+
+
+def match_in_database(
+    user_ids: Iterable[int],
+    exclude_seasonings: bool,
+    min_match_rate: float,
+    limit: Optional[int] = None,
+    rank_by_matched_count: bool = True,
+    algorithm: str = 'coverage',
+    facets: Optional[Dict[str, Iterable[str]]] = None,
+    count_facets: bool = False
+) -> MatchResult:
+    """
+    사용자 재료와 매칭되는 레시피 목록 (RecipeIndex.match와 동일한 결과)
+
+    min_match_rate > 0이면 사용자 재료를 포함한 레시피만 집계 대상
+    (재료 시그니처 GIN 인덱스로 후보 레시피를 먼저 찾음)
+    조건을 만족한 전체 개수는 COUNT(*) OVER()로 같은 쿼리에서 계산
+    패싯 조건은 레시피 필드 IN 조건, 패싯 집계는 조건을 만족한 레시피에 대한 필드별 GROUP BY (쿼리 5회 추가)
+
+    Raises:
+        KeyError: 등록되지 않은 알고리즘
+        NotImplementedError: DB 집계 모드를 지원하지 않는 알고리즘
+    """
+    scorer = get_scorer(algorithm)
+    user_ids = set(user_ids)
+
+    seasoning = Q(normalized_ingredient__is_common_seasoning=True)
+    owned = Q(normalized_ingredient_id__in=user_ids)
+    counted = ~seasoning if exclude_seasonings else Q()
+
+    stats = {
+        'matched': _distinct_count(counted & owned),
+        'total_count': _distinct_count(counted),
+    }
+    if scorer.uses_seasonings:
+        stats.update(
+            essential_matched=_distinct_count(~seasoning & owned),
+            essential_totals=_distinct_count(~seasoning),
+            seasoning_matched=_distinct_count(seasoning & owned),
+            seasoning_totals=_distinct_count(seasoning),
+        )
+
+    if exclude_seasonings:
+        user_size = len(user_ids) - NormalizedIngredient.objects.filter(
+            id__in=user_ids, is_common_seasoning=True
+        ).count()
+    else:
+        user_size = len(user_ids)
+
+    score = scorer.expression(SqlScoreInputs(
+        matched=_as_float('matched'),
+        totals=_as_float('total_count'),
+        essential_matched=_as_float('essential_matched') if scorer.uses_seasonings else None,
+        essential_totals=_as_float('essential_totals') if scorer.uses_seasonings else None,
+        seasoning_matched=_as_float('seasoning_matched') if scorer.uses_seasonings else None,
+        seasoning_totals=_as_float('seasoning_totals') if scorer.uses_seasonings else None,
+        user_size=user_size,
+    ))
+
+    queryset = Ingredient.objects.filter(normalized_ingredient__isnull=False)
+    if min_match_rate > 0:
+        if not user_ids:
+            return MatchResult([], 0, facet_counts={field: {} for field in FACET_FIELDS} if count_facets else None)
+        # 후보 레시피: 재료 시그니처 겹침(&&) 검색, GIN 인덱스 사용
+        if exclude_seasonings and not scorer.uses_seasonings:
+            candidates = Recipe.objects.filter(essential_signature__overlap=list(user_ids))
+        else:
+            candidates = Recipe.objects.filter(ingredient_signature__overlap=list(user_ids))
+        queryset = queryset.filter(recipe_id__in=candidates.order_by().values('id'))
+    for field, values in (facets or {}).items():
+        values = list(values)
+        if values:
+            queryset = queryset.filter(**{f'recipe__{field}__in': values})
+
+    # 정렬: 점수 → (매칭 재료 수) → 레시피 기본 정렬(-created_at)
+    ordering = ['-match_score', '-matched', '-recipe__created_at', 'recipe_id']
+    if not rank_by_matched_count:
+        ordering.remove('-matched')
+
+    passed = (
+        queryset
+        .order_by()
+        .values('recipe_id')
+        .annotate(**stats)
+        .annotate(match_score=score)
+        .filter(total_count__gt=0, match_score__gte=min_match_rate)
+    )
+    queryset = (
+        passed
+        .annotate(full_count=Window(Count('*')))
+        .order_by(*ordering)
+        .values_list('recipe_id', 'match_score', 'matched', 'total_count', 'full_count')
+    )
+    if limit is not None:
+        queryset = queryset[:limit]
+
+    rows = list(queryset)
+    matches = [
+        RecipeMatch(recipe_id, float(match_score), matched, total_count)
+        for recipe_id, match_score, matched, total_count, _ in rows
+    ]
+    facet_counts = _facet_counts(passed.values('recipe_id')) if count_facets else None
+    return MatchResult(matches, rows[0][4] if rows else 0, facet_counts=facet_counts)
@@ -0,0 +1,136 @@
+"""
+냉장고별 레시피 매칭 수 벡터
+
+냉장고 재료가 하나 바뀌면 그 재료를 포함한 레시피의 매칭 수만 바뀌므로
+냉장고별 매칭 Ingredient 행 수(필수/조미료)를 희소 벡터로 유지하고
+재료 추가/삭제 시 해당 재료의 posting만 더하거나 빼서 갱신
+
+벡터는 반영한 냉장고 재료 ID 집합을 함께 저장하여, 조회 시 실제 냉장고 재료와의
+차이만 적용 (다른 프로세스/관리자 화면에서 바뀐 재료도 자동 반영)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, NamedTuple, Set
+import numpy as np
+from django.conf import settings
+from .recipe_index import RecipeIndex, get_recipe_index
+
+
+class FridgeMatchVector(NamedTuple):
+    """조회 시점의 매칭 수 벡터 (읽기 전용 사본)"""
+    index: RecipeIndex
+    rows: np.ndarray
+    essential_matched: np.ndarray
+    seasoning_matched: np.ndarray
+
+
+class FridgeScores:
+    """
+    냉장고 하나의 레시피별 매칭 행 수 (희소 벡터)
+
+    rows: 매칭 재료가 1개 이상인 레시피 행 번호 (오름차순)
+    essential_matched/seasoning_matched: 행별 매칭된 필수/조미료 Ingredient 행 수
+    """
+
+    def __init__(self, index: RecipeIndex):
+        self.index = index
+        self.ingredient_ids: Set[int] = set()
+        self.rows = np.empty(0, dtype=np.int64)
+        self.essential_matched = np.empty(0, dtype=np.int64)
+        self.seasoning_matched = np.empty(0, dtype=np.int64)
+
+    def apply(self, added: Iterable[int] = (), removed: Iterable[int] = ()):
+        """재료 추가/삭제를 반영 (해당 재료의 posting만 읽음)"""
+        added = set(added) - self.ingredient_ids
+        removed = set(removed) & self.ingredient_ids
+        if not added and not removed:
+            return
+
+        index = self.index
+        parts_rows = [self.rows]
+        parts_essential = [self.essential_matched]
+        parts_seasoning = [self.seasoning_matched]
+        for sign, ids in ((1, added), (-1, removed)):
+            for column in index.columns_for(ids, exclude_seasonings=False):
+                start, end = index.posting_ptr[column], index.posting_ptr[column + 1]
+                counts = index.posting_counts[start:end].astype(np.int64) * sign
+                zeros = np.zeros_like(counts)
+                parts_rows.append(index.posting_rows[start:end].astype(np.int64))
+                if index.is_seasoning[column]:
+                    parts_essential.append(zeros)
+                    parts_seasoning.append(counts)
+                else:
+                    parts_essential.append(counts)
+                    parts_seasoning.append(zeros)
+
+        rows, inverse = np.unique(np.concatenate(parts_rows), return_inverse=True)
+        essential = np.bincount(inverse, weights=np.concatenate(parts_essential), minlength=len(rows))
+        seasoning = np.bincount(inverse, weights=np.concatenate(parts_seasoning), minlength=len(rows))
+        keep = (essential != 0) | (seasoning != 0)
+
+        self.rows = rows[keep]
+        self.essential_matched = essential[keep].astype(np.int64)
+        self.seasoning_matched = seasoning[keep].astype(np.int64)
+        self.ingredient_ids = (self.ingredient_ids | added) - removed
+
+
+_fridge_scores: 'OrderedDict[int, FridgeScores]' = OrderedDict()
+_fridge_scores_lock = threading.Lock()
+
+
+def _max_entries() -> int:
+    """프로세스당 유지할 최대 냉장고 수"""
+    return getattr(settings, 'FRIDGE_SCORE_CACHE_MAX_ENTRIES', 1024)
+
+
+def _store(fridge_id: int, scores: FridgeScores):
+    """LRU 저장 (잠금 안에서 호출)"""
+    _fridge_scores[fridge_id] = scores
+    _fridge_scores.move_to_end(fridge_id)
+    while len(_fridge_scores) > _max_entries():
+        _fridge_scores.popitem(last=False)
+
+
+def get_fridge_scores(fridge_id: int, ingredient_ids: Iterable[int]) -> FridgeMatchVector:
+    """
+    현재 냉장고 재료에 맞는 매칭 수 벡터 조회
+
+    저장된 벡터와 재료 차이만 반영, 추천 인덱스가 재구축되었으면 새로 계산
+
+    Args:
+        fridge_id: 냉장고 ID
+        ingredient_ids: 현재 냉장고의 정규화 재료 ID
+    """
+    index = get_recipe_index()
+    ingredient_ids = set(ingredient_ids)
+    with _fridge_scores_lock:
+        scores = _fridge_scores.get(fridge_id)
+        if scores is None or scores.index is not index:
+            scores = FridgeScores(index)
+        scores.apply(
+            added=ingredient_ids - scores.ingredient_ids,
+            removed=scores.ingredient_ids - ingredient_ids
+        )
+        _store(fridge_id, scores)
+        return FridgeMatchVector(index, scores.rows, scores.essential_matched, scores.seasoning_matched)
+
+
+def update_fridge_scores(fridge_id: int, added: Iterable[int] = (), removed: Iterable[int] = ()):
+    """
+    냉장고 재료 변경 반영
+
+    이 프로세스에 벡터가 없으면 무시 (다음 조회 시 get_fridge_scores가 계산)
+    """
+    with _fridge_scores_lock:
+        scores = _fridge_scores.get(fridge_id)
+        if scores is not None:
+            scores.apply(added=added, removed=removed)
+
+
+def clear_fridge_scores(fridge_id: int):
+    """냉장고 비우기 반영"""
+    with _fridge_scores_lock:
+        scores = _fridge_scores.get(fridge_id)
+        if scores is not None:
+            scores.apply(removed=set(scores.ingredient_ids))
@@ -0,0 +1,122 @@
+"""
+추천 인덱스 바이너리 스냅샷 (mmap 공유)
+
+여러 워커 프로세스가 같은 스냅샷 파일을 읽기 전용 mmap으로 열어
+인덱스 배열을 물리 메모리 한 벌로 공유하고, 기동 시 ORM 전체 조회 대신 파일 열기만 수행
+
+파일 형식:
+    MAGIC (8 bytes) | 헤더 길이 (uint64 LE) | 헤더 JSON | 배열 데이터 (각 ALIGNMENT 정렬)
+    헤더: {'version': 데이터 버전, 'arrays': {이름: {dtype, shape, offset}}, 'metadata': {...}}
+
+쓰기는 같은 디렉터리의 임시 파일에 쓴 뒤 os.replace로 교체
+(이미 열린 mmap은 이전 파일을 계속 참조하므로 교체 중에도 안전)
+"""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Optional, Tuple
+import numpy as np
+from django.conf import settings
+
+MAGIC = b'F2FRIDX1'
+ALIGNMENT = 64
+_LENGTH = struct.Struct('<Q')
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def get_snapshot_path() -> str:
+    """설정된 스냅샷 경로 (빈 문자열이면 사용 안 함)"""
+    return getattr(settings, 'RECIPE_INDEX_SNAPSHOT_PATH', '')
+
+
+def write_snapshot(path: str, version: str, arrays: Dict[str, np.ndarray], metadata: dict) -> int:
+    """
+    스냅샷 파일 쓰기 (원자적 교체)
+
+    Returns:
+        파일 크기 (bytes)
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps(
+        {'version': version, 'arrays': layout, 'metadata': metadata},
+        ensure_ascii=False
+    ).encode('utf-8')
+    data_start = _align(len(MAGIC) + _LENGTH.size + len(header))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.recipe_index.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(MAGIC + _LENGTH.pack(len(header)) + header)
+            for name, array in arrays.items():
+                f.seek(data_start + layout[name]['offset'])
+                f.write(array.tobytes())
+            f.truncate(data_start + offset)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return data_start + offset
+
+
+def _read_header(f) -> Tuple[dict, int]:
+    """헤더와 배열 데이터 시작 위치"""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise ValueError('not a recipe index snapshot')
+    (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+    header = json.loads(f.read(length).decode('utf-8'))
+    return header, _align(len(MAGIC) + _LENGTH.size + length)
+
+
+def read_snapshot_version(path: str) -> Optional[str]:
+    """스냅샷의 데이터 버전 (파일이 없거나 형식이 다르면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            return _read_header(f)[0]['version']
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def open_snapshot(path: str) -> Tuple[str, Dict[str, np.ndarray], dict]:
+    """
+    스냅샷을 읽기 전용 mmap으로 열기
+
+    배열은 mmap 위의 읽기 전용 뷰 (프로세스 간 페이지 캐시 공유)
+
+    Returns:
+        (데이터 버전, 배열, metadata)
+
+    Raises:
+        OSError: 파일을 열 수 없음
+        ValueError: 스냅샷 형식이 아님
+    """
+    with open(path, 'rb') as f:
+        header, data_start = _read_header(f)
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype, shape = np.dtype(spec['dtype']), tuple(spec['shape'])
+        count = int(np.prod(shape, dtype=np.int64))
+        if count == 0:
+            arrays[name] = np.empty(shape, dtype=dtype)
+            continue
+        arrays[name] = np.frombuffer(
+            buffer, dtype=dtype, count=count, offset=data_start + spec['offset']
+        ).reshape(shape)
+    return header['version'], arrays, header['metadata']
@@ -0,0 +1,92 @@
+"""
+재료명 → 정규화 재료 별칭 테이블
+
+사용자가 입력한 재료명(쇠고기, 대파, 계란물 등)을 해시맵 조회 한 번으로 정규화 재료 ID로 변환
+(정규화 재료명과 정확히 일치하지 않아도 변환, 요청마다 name__in 쿼리를 하지 않음)
+
+별칭 우선순위 (뒤가 앞을 덮어씀)
+1. Ingredient.original_name → normalized_ingredient 연결 (한 원본명이 여러 재료에 연결되면 가장 많이 쓰인 재료)
+2. 관리자 등록 별칭 (IngredientAlias)
+3. 정규화 재료명 자신
+
+키는 앞뒤 공백 제거, 연속 공백 하나로, 소문자 (alias_key)
+데이터 버전이 바뀌면 다음 조회 시 재구축 (프로세스당 1개 유지)
+"""
+
+import threading
+from typing import Dict, Iterable, Optional
+from django.db.models import Count
+from recipes.models import Ingredient, IngredientAlias, NormalizedIngredient
+from .data_version import get_data_version
+
+
+def alias_key(name: str) -> str:
+    """별칭 조회 키 (공백 정리, 소문자)"""
+    return ' '.join((name or '').split()).lower()
+
+
+class AliasTable:
+    """별칭 키 → 정규화 재료 ID"""
+
+    def __init__(self, version: str, ids_by_alias: Dict[str, int]):
+        self.version = version
+        self.ids_by_alias = ids_by_alias
+
+    @classmethod
+    def build(cls, version: str) -> 'AliasTable':
+        """DB에서 별칭 테이블 구축 (쿼리 3회)"""
+        ids_by_alias: Dict[str, int] = {}
+
+        # 원본 재료명 연결: 사용 횟수 오름차순으로 덮어써 가장 많이 쓰인 재료가 남음
+        links = (
+            Ingredient.objects
+            .filter(normalized_ingredient__isnull=False)
+            .values_list('original_name', 'normalized_ingredient_id')
+            .annotate(uses=Count('id'))
+            .order_by('uses', 'normalized_ingredient_id')
+        )
+        for original_name, normalized_id, _ in links:
+            key = alias_key(original_name)
+            if key:
+                ids_by_alias[key] = normalized_id
+
+        for alias, normalized_id in IngredientAlias.objects.values_list('alias', 'normalized_ingredient_id'):
+            ids_by_alias[alias_key(alias)] = normalized_id
+
+        for name, normalized_id in NormalizedIngredient.objects.values_list('name', 'id'):
+            ids_by_alias[alias_key(name)] = normalized_id
+
+        ids_by_alias.pop('', None)
+        return cls(version, ids_by_alias)
+
+    def resolve(self, name: str) -> Optional[int]:
+        """재료명 → 정규화 재료 ID (없으면 None)"""
+        return self.ids_by_alias.get(alias_key(name))
+
+    def resolve_many(self, names: Iterable[str]) -> Dict[str, int]:
+        """재료명 → 정규화 재료 ID (변환할 수 없는 재료명은 제외)"""
+        resolved = {}
+        for name in names:
+            normalized_id = self.ids_by_alias.get(alias_key(name))
+            if normalized_id is not None:
+                resolved[name] = normalized_id
+        return resolved
+
+
+_table: Optional[AliasTable] = None
+_table_lock = threading.Lock()
+
+
+def get_alias_table() -> AliasTable:
+    """현재 데이터 버전의 별칭 테이블 조회 (데이터 버전이 바뀌었으면 재구축)"""
+    global _table
+
+    version = get_data_version()
+    table = _table
+    if table is not None and table.version == version:
+        return table
+
+    with _table_lock:
+        if _table is None or _table.version != version:
+            _table = AliasTable.build(version)
+        return _table
@@ -0,0 +1,150 @@
+"""
+정규화 재료명 자동완성 인덱스 (인메모리)
+
+요청마다 DB를 조회하지 않고 프로세스별 인덱스에서 재료명을 찾음
+
+- 접두사: 재료명 정렬 목록에서 이진 탐색 (연속 구간)
+- 중간 일치: 문자별 posting(해당 문자를 포함하는 재료 행 번호)에서 가장 짧은 목록만 확인
+- 초성: 검색어가 모두 초성(ㄱ~ㅎ)이면 재료명의 초성 문자열로 같은 방식 검색
+  (예: "ㄷㅈㄱㄱ" → 돼지고기)
+
+결과는 접두사 일치 → 중간 일치 순, 각각 사용 순(사용 레시피 수 많은 순, 같으면 재료명 순)
+제안 항목(이름/카테고리/범용 조미료)은 구축 시 JSON 조각으로 직렬화
+데이터 버전이 바뀌면 다음 조회 시 재구축 (프로세스당 1개 유지)
+"""
+
+import heapq
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence
+import orjson
+from recipes.models import NormalizedIngredient
+from .data_version import get_data_version
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_HANGUL_FIRST = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_SYLLABLES_PER_CHOSEONG = 588  # 중성 21 × 종성 28
+
+# 접두사 구간의 끝 (모든 문자보다 큰 문자)
+_MAX_CHAR = '\U0010ffff'
+
+
+def choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 문자열 (한글이 아닌 문자는 그대로)"""
+    return ''.join(
+        CHOSEONG[(ord(char) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSEONG]
+        if _HANGUL_FIRST <= ord(char) <= _HANGUL_LAST else char
+        for char in text
+    )
+
+
+def is_choseong_query(text: str) -> bool:
+    """초성으로만 이루어진 검색어인지 여부 (공백 허용)"""
+    letters = text.replace(' ', '')
+    return bool(letters) and all(char in _CHOSEONG_SET for char in letters)
+
+
+def _normalize_query(text: str) -> str:
+    return ' '.join((text or '').split()).casefold()
+
+
+class _TextView:
+    """재료별 검색 문자열 (재료명 또는 초성)에 대한 접두사/중간 일치 검색"""
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts = texts
+        # 검색 문자열 순 정렬 (접두사 이진 탐색), 같은 문자열은 행 번호 순
+        self.order = sorted(range(len(texts)), key=lambda row: (texts[row], row))
+        self.sorted_texts = [texts[row] for row in self.order]
+        # 문자 → 그 문자를 포함하는 행 번호 (오름차순 = 사용 순)
+        self.postings: Dict[str, List[int]] = {}
+        for row, text in enumerate(texts):
+            for char in set(text):
+                self.postings.setdefault(char, []).append(row)
+
+    def prefix_rows(self, query: str, limit: int) -> List[int]:
+        """query로 시작하는 행 (사용 순, 최대 limit개)"""
+        start = bisect_left(self.sorted_texts, query)
+        end = bisect_left(self.sorted_texts, query + _MAX_CHAR, start)
+        return heapq.nsmallest(limit, self.order[start:end])
+
+    def infix_rows(self, query: str, limit: int) -> List[int]:
+        """query를 중간에 포함하는 행 (접두사 일치 제외, 사용 순, 최대 limit개)"""
+        if limit <= 0:
+            return []
+        candidates = min((self.postings.get(char, []) for char in set(query)), key=len)
+        rows = []
+        for row in candidates:
+            text = self.texts[row]
+            if query in text and not text.startswith(query):
+                rows.append(row)
+                if len(rows) >= limit:
+                    break
+        return rows
+
+    def search(self, query: str, limit: int) -> List[int]:
+        rows = self.prefix_rows(query, limit)
+        return rows + self.infix_rows(query, limit - len(rows))
+
+
+class AutocompleteIndex:
+    """정규화 재료 자동완성 인덱스 (행 번호 = 사용 순)"""
+
+    def __init__(self, version: str, names: List[str], cards: List[bytes]):
+        self.version = version
+        self.names = names
+        self.cards = cards
+        keys = [name.casefold() for name in names]
+        self.name_view = _TextView(keys)
+        self.choseong_view = _TextView([choseong(key) for key in keys])
+
+    @classmethod
+    def build(cls, version: str) -> 'AutocompleteIndex':
+        """DB에서 자동완성 인덱스 구축 (쿼리 1회, 카테고리명 포함, 사용 레시피 수 많은 순)"""
+        rows = (
+            NormalizedIngredient.objects
+            .order_by('-recipe_count', 'name')
+            .values_list('name', 'category__name', 'is_common_seasoning')
+        )
+        names, cards = [], []
+        for name, category_name, is_common_seasoning in rows:
+            names.append(name)
+            cards.append(orjson.dumps({
+                'name': name,
+                'category': category_name or '기타',
+                'is_common_seasoning': is_common_seasoning,
+            }))
+        return cls(version, names, cards)
+
+    def search_rows(self, query: str, limit: int = 10) -> List[int]:
+        """검색어와 일치하는 재료 행 번호 (접두사 → 중간 일치, 초성 검색어는 초성으로)"""
+        query = _normalize_query(query)
+        if not query or limit <= 0:
+            return []
+        view = self.choseong_view if is_choseong_query(query) else self.name_view
+        return view.search(query, limit)
+
+    def suggest(self, query: str, limit: int = 10) -> List[bytes]:
+        """검색어와 일치하는 제안 항목 JSON 조각"""
+        return [self.cards[row] for row in self.search_rows(query, limit)]
+
+
+_index: Optional[AutocompleteIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """현재 데이터 버전의 자동완성 인덱스 조회 (데이터 버전이 바뀌었으면 재구축)"""
+    global _index
+
+    version = get_data_version()
+    index = _index
+    if index is not None and index.version == version:
+        return index
+
+    with _index_lock:
+        if _index is None or _index.version != version:
+            _index = AutocompleteIndex.build(version)
+        return _index
@@ -0,0 +1,106 @@
+"""
+재료명 유사도 매칭 (pg_trgm)
+
+정확히 일치하는 정규화 재료가 없는 재료명(오타, 띄어쓰기 차이)을
+정규화 재료명 trigram GIN 인덱스(normalized_name_trgm_idx)로 찾아 유사도 순으로 정렬
+
+- 여러 재료명을 쿼리 1회로 조회 (name % 재료명 조건의 OR, 재료명별 similarity 계산)
+- 인덱스 조건(%)의 기준 pg_trgm.similarity_threshold를 트랜잭션 안에서만 INGREDIENT_FUZZY_THRESHOLD로 설정
+  (기본값 0.3보다 낮은 최솟값도 적용)
+- pg_trgm 확장이 없는 DB에서는 매칭하지 않음 (빈 결과)
+"""
+
+import operator
+from functools import reduce
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection, transaction
+from django.db.models import Q
+from recipes.models import NormalizedIngredient
+
+# pg_trgm.similarity_threshold 기본값 (% 연산자 기준)
+PG_TRGM_DEFAULT_THRESHOLD = 0.3
+
+_trigram_available: Optional[bool] = None
+
+
+def trigram_available() -> bool:
+    """DB에 pg_trgm 확장이 설치되어 있는지 여부 (프로세스별 1회 조회)"""
+    global _trigram_available
+    if _trigram_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+            _trigram_available = cursor.fetchone()[0]
+    return _trigram_available
+
+
+def get_fuzzy_threshold() -> float:
+    """재료명 유사도 최솟값"""
+    return getattr(settings, 'INGREDIENT_FUZZY_THRESHOLD', 0.3)
+
+
+def similar_ingredients(
+    names: Iterable[str],
+    threshold: Optional[float] = None
+) -> Dict[str, List[Tuple[int, float]]]:
+    """
+    재료명별 유사한 정규화 재료 (유사도 조회 쿼리 1회)
+
+    Returns:
+        {재료명: [(정규화 재료 ID, 유사도), ...]} 유사도 내림차순, 후보가 없는 재료명은 제외
+    """
+    names = list(dict.fromkeys(name for name in names if name))
+    if not names or not trigram_available():
+        return {}
+    threshold = get_fuzzy_threshold() if threshold is None else threshold
+
+    similarities = {f'similarity_{i}': TrigramSimilarity('name', name) for i, name in enumerate(names)}
+    with transaction.atomic(), connection.cursor() as cursor:
+        # % 연산자 기준값을 최솟값으로 (SET LOCAL과 같음, 트랜잭션 종료 시 원래 값)
+        cursor.execute(
+            "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+            [str(min(max(threshold, 0.0), 1.0))]
+        )
+        rows = list(
+            NormalizedIngredient.objects
+            .filter(reduce(operator.or_, (Q(name__trigram_similar=name) for name in names)))
+            .annotate(**similarities)
+            .order_by()
+            .values_list('id', *similarities)
+        )
+
+    matches: Dict[str, List[Tuple[int, float]]] = {}
+    for normalized_id, *scores in rows:
+        for name, score in zip(names, scores):
+            if score >= threshold:
+                matches.setdefault(name, []).append((normalized_id, score))
+    for candidates in matches.values():
+        candidates.sort(key=lambda candidate: (-candidate[1], candidate[0]))
+    return matches
+
+
+def resolve_similar_ingredients(
+    used_ids: Callable[[Iterable[int], bool], Set[int]],
+    names: Iterable[str],
+    exclude_seasonings: bool = False
+) -> Dict[str, int]:
+    """
+    재료명 → 레시피에 쓰이는 가장 유사한 정규화 재료 ID (쿼리 1회)
+
+    Args:
+        used_ids: 레시피에 쓰이는 재료 판별 함수 (RecipeIndex.used_ids 또는 used_ingredient_ids)
+        names: 정확히 일치하는 재료가 없는 재료명
+        exclude_seasonings: 범용 조미료 제외 여부
+    """
+    matches = similar_ingredients(names)
+    used = used_ids(
+        (normalized_id for candidates in matches.values() for normalized_id, _ in candidates),
+        exclude_seasonings
+    )
+    resolved = {}
+    for name, candidates in matches.items():
+        best = next((normalized_id for normalized_id, _ in candidates if normalized_id in used), None)
+        if best is not None:
+            resolved[name] = best
+    return resolved
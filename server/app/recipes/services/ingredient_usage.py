@@ -0,0 +1,63 @@
+"""
+정규화 재료별 사용 레시피 수 (NormalizedIngredient.recipe_count)
+
+자동완성/재료 목록을 요청마다 COUNT 조인 없이 사용 빈도 순으로 정렬하기 위해 비정규화
+레시피 시그니처를 재계산할 때(refresh_recipe_signatures) 시그니처가 바뀔 수 있는
+재료(재계산 전/후 시그니처에 포함된 재료)만 다시 계산
+recipe_count > 0이면 레시피에 쓰이는 재료 (RecipeIndex.used_ids의 DB 버전)
+"""
+
+from typing import Iterable, Optional, Set
+from django.db.models import Count, Func, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from recipes.models import Ingredient, NormalizedIngredient
+
+
+def signature_ingredient_ids(recipes) -> Set[int]:
+    """레시피 QuerySet의 재료 시그니처에 포함된 정규화 재료 ID (DB에서 unnest, 중복 제거)"""
+    return set(
+        recipes
+        .order_by()
+        .annotate(normalized_id=Func(F('ingredient_signature'), function='unnest', output_field=IntegerField()))
+        .values_list('normalized_id', flat=True)
+        .distinct()
+    )
+
+
+def used_ingredient_ids(ingredient_ids: Iterable[int], exclude_seasonings: bool = False) -> Set[int]:
+    """정규화 재료 ID 중 레시피에 쓰이는 ID (exclude_seasonings이면 범용 조미료 제외, 쿼리 1회)"""
+    ingredient_ids = set(ingredient_ids)
+    if not ingredient_ids:
+        return set()
+    queryset = NormalizedIngredient.objects.filter(id__in=ingredient_ids, recipe_count__gt=0)
+    if exclude_seasonings:
+        queryset = queryset.filter(is_common_seasoning=False)
+    return set(queryset.order_by().values_list('id', flat=True))
+
+
+def refresh_recipe_counts(normalized_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    정규화 재료별 사용 레시피 수 재계산 (UPDATE 1회, 시그널 발생 없음)
+
+    Args:
+        normalized_ids: 재계산할 정규화 재료 ID (None이면 전체)
+
+    Returns:
+        갱신된 재료 수
+    """
+    queryset = NormalizedIngredient.objects.all()
+    if normalized_ids is not None:
+        normalized_ids = list(normalized_ids)
+        if not normalized_ids:
+            return 0
+        queryset = queryset.filter(id__in=normalized_ids)
+
+    counts = (
+        Ingredient.objects
+        .filter(normalized_ingredient=OuterRef('pk'))
+        .order_by()
+        .values('normalized_ingredient')
+        .annotate(recipes=Count('recipe', distinct=True))
+        .values('recipes')
+    )
+    return queryset.update(recipe_count=Coalesce(Subquery(counts), Value(0)))
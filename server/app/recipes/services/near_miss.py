@@ -0,0 +1,163 @@
+"""
+"거의 만들 수 있는" 레시피와 장보기 목록
+
+필수(비조미료) 재료가 1~2개만 부족한 레시피를 찾고, 부족한 재료별로
+구매 시 바로 만들 수 있게 되는 레시피 수(unlocks)로 장보기 목록을 정렬
+
+추천 인덱스의 레시피×필수 재료 CSR(essential_indptr/essential_indices)과
+재료 이름 테이블(ingredient_names)만 사용 → 레시피/재료 ORM 조회 없음
+scoring_mode='database'이면 필수 재료 시그니처(essential_signature) 겹침 검색 1회로 같은 결과 계산
+"""
+
+from collections import Counter
+from typing import Iterable, List, NamedTuple, Tuple
+import numpy as np
+from recipes.models import Recipe
+from .recipe_index import RecipeIndex
+
+
+class NearMissRecipe(NamedTuple):
+    """부족한 필수 재료가 적은 레시피"""
+    recipe_id: int
+    missing_ids: Tuple[int, ...]  # 부족한 필수 재료 ID
+    matched_count: int  # 보유한 필수 재료 수
+    total_count: int  # 레시피 필수 재료 수
+
+
+class ShoppingItem(NamedTuple):
+    """장보기 목록 항목"""
+    ingredient_id: int
+    unlocks: int  # 이 재료만 사면 만들 수 있게 되는 레시피 수
+    near_miss_count: int  # 이 재료가 부족한 레시피 수
+
+
+class NearMissResult(NamedTuple):
+    """부족한 재료 수 순 레시피 목록 + 장보기 목록 + 전체 레시피 수"""
+    recipes: List[NearMissRecipe]
+    shopping_list: List[ShoppingItem]
+    total: int
+
+
+def find_near_misses(
+    index: RecipeIndex,
+    user_ids: Iterable[int],
+    max_missing: int = 2,
+    limit: int = 20,
+    shopping_limit: int = 10
+) -> NearMissResult:
+    """
+    필수 재료가 1~max_missing개 부족한 레시피 조회
+
+    사용자 필수 재료를 하나 이상 포함한 후보 레시피의 posting을 한 번 읽어
+    매칭 수를 계산하고, 조건을 만족한 레시피의 필수 재료 CSR 행에서 부족한 재료를 추출
+
+    정렬:
+        레시피: 부족한 재료 수 → 부족한 재료들의 unlocks 합 (많은 순) → 기본 정렬 순서
+        장보기 목록: unlocks → near_miss_count (많은 순) → 재료 ID
+
+    Args:
+        index: 추천 인덱스
+        user_ids: 사용자 보유 정규화 재료 ID
+        max_missing: 허용할 최대 부족 재료 수
+        limit: 반환할 최대 레시피 수
+        shopping_limit: 반환할 최대 장보기 목록 항목 수
+    """
+    columns = index.columns_for(user_ids, exclude_seasonings=True)
+    matched = index.matched_counts(columns)
+    rows = np.flatnonzero(matched)
+    missing_counts = index.totals[True][rows] - matched[rows]
+    near = (missing_counts >= 1) & (missing_counts <= max_missing)
+    rows, missing_counts = rows[near], missing_counts[near]
+
+    # 후보 레시피의 필수 재료 CSR 행을 이어 붙여 보유하지 않은 재료만 추출
+    starts = index.essential_indptr[rows]
+    lengths = index.essential_indptr[rows + 1] - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    entries = index.essential_indices[np.arange(lengths.sum()) + offsets]
+    owners = np.repeat(np.arange(len(rows)), lengths)
+
+    in_user = np.zeros(len(index.ingredient_ids), dtype=bool)
+    in_user[columns] = True
+    missing_entries = ~in_user[entries]
+    missing_columns, missing_owners = entries[missing_entries], owners[missing_entries]
+
+    # 재료별 unlocks (부족한 재료가 그 재료 하나뿐인 레시피 수) / near_miss_count
+    n_columns = len(index.ingredient_ids)
+    single = missing_counts[missing_owners] == 1
+    unlocks = np.bincount(missing_columns[single], minlength=n_columns)
+    near_miss_counts = np.bincount(missing_columns, minlength=n_columns)
+
+    shopping_columns = np.flatnonzero(near_miss_counts)
+    shopping_order = np.lexsort((
+        shopping_columns, -near_miss_counts[shopping_columns], -unlocks[shopping_columns]
+    ))[:shopping_limit]
+    shopping_list = [
+        ShoppingItem(
+            int(index.ingredient_ids[shopping_columns[i]]),
+            int(unlocks[shopping_columns[i]]),
+            int(near_miss_counts[shopping_columns[i]])
+        )
+        for i in shopping_order
+    ]
+
+    unlock_sums = np.bincount(missing_owners, weights=unlocks[missing_columns], minlength=len(rows))
+    order = np.lexsort((rows, -unlock_sums, missing_counts))[:limit]
+    missing_bounds = np.searchsorted(missing_owners, np.arange(len(rows) + 1))
+    recipes = []
+    for i in order:
+        own_columns = missing_columns[missing_bounds[i]:missing_bounds[i + 1]]
+        recipes.append(NearMissRecipe(
+            int(index.recipe_ids[rows[i]]),
+            tuple(int(ingredient_id) for ingredient_id in index.ingredient_ids[own_columns]),
+            int(matched[rows[i]]),
+            int(index.totals[True][rows[i]])
+        ))
+
+    return NearMissResult(recipes, shopping_list, len(rows))
+
+
+def find_near_misses_in_database(
+    user_ids: Iterable[int],
+    max_missing: int = 2,
+    limit: int = 20,
+    shopping_limit: int = 10
+) -> NearMissResult:
+    """
+    필수 재료가 1~max_missing개 부족한 레시피 조회 (DB 조회, find_near_misses와 동일한 결과)
+
+    사용자 재료와 필수 재료 시그니처가 겹치는(&&, GIN 인덱스) 레시피만 읽어
+    부족한 재료와 unlocks를 계산 (정렬 기준은 find_near_misses와 같음)
+    """
+    user_ids = set(user_ids)
+    if not user_ids:
+        return NearMissResult([], [], 0)
+
+    candidates = []
+    for row, (recipe_id, signature) in enumerate(
+        Recipe.objects
+        .filter(essential_signature__overlap=list(user_ids))
+        .values_list('id', 'essential_signature')
+    ):
+        missing_ids = tuple(ingredient_id for ingredient_id in signature if ingredient_id not in user_ids)
+        if 1 <= len(missing_ids) <= max_missing:
+            candidates.append((row, recipe_id, missing_ids, len(signature)))
+
+    unlocks, near_miss_counts = Counter(), Counter()
+    for _, _, missing_ids, _ in candidates:
+        near_miss_counts.update(missing_ids)
+        if len(missing_ids) == 1:
+            unlocks[missing_ids[0]] += 1
+
+    shopping_list = sorted(
+        (ShoppingItem(ingredient_id, unlocks[ingredient_id], count) for ingredient_id, count in near_miss_counts.items()),
+        key=lambda item: (-item.unlocks, -item.near_miss_count, item.ingredient_id)
+    )[:shopping_limit]
+
+    candidates.sort(key=lambda candidate: (
+        len(candidate[2]), -sum(unlocks[ingredient_id] for ingredient_id in candidate[2]), candidate[0]
+    ))
+    recipes = [
+        NearMissRecipe(recipe_id, missing_ids, total_count - len(missing_ids), total_count)
+        for _, recipe_id, missing_ids, total_count in candidates[:limit]
+    ]
+    return NearMissResult(recipes, shopping_list, len(candidates))
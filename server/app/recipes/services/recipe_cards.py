@@ -0,0 +1,115 @@
+"""
+레시피 카드 직렬화 캐시
+
+목록 응답의 레시피 공통 필드(RecipeSchema)를 레시피별로 한 번만 orjson으로 직렬화해
+프로세스별 LRU에 저장하고, 응답은 캐시된 JSON 조각에 요청별 필드(match_score 등)를
+이어 붙여 바이트로 조립 (항목마다 Pydantic 모델 생성/검증을 하지 않음)
+
+데이터 버전이 바뀌면(레시피 변경 시그널) 캐시 전체를 비움
+레시피 목록(GET /recipes)은 항목 필드가 다르므로(RecipeListItemSchema) 별도 캐시 사용
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Sequence
+import orjson
+from django.conf import settings
+from django.http import HttpResponse
+from recipes.models import Recipe
+from .data_version import get_data_version
+
+# 카드 필드 (schemas.RecipeSchema와 같은 순서/이름)
+CARD_FIELDS = (
+    'recipe_sno', 'name', 'title', 'servings', 'difficulty', 'cooking_time',
+    'image_url', 'recipe_url', 'introduction',
+)
+
+# 레시피 목록 항목 필드 (schemas.RecipeListItemSchema와 같은 순서/이름)
+LIST_ITEM_FIELDS = (
+    'id', 'recipe_sno', 'name', 'title', 'image_url', 'recipe_url', 'difficulty', 'cooking_time', 'servings',
+)
+
+
+class RecipeCardCache:
+    """
+    레시피 ID → 카드 JSON 조각(bytes) LRU 캐시 (프로세스별, 스레드 안전)
+
+    max_entries가 0 이하이면 저장하지 않음 (매번 조회 후 직렬화)
+    fields: 카드에 담을 레시피 필드 (순서대로 직렬화)
+    """
+
+    def __init__(self, max_entries: int, fields: Sequence[str] = CARD_FIELDS):
+        self.max_entries = max_entries
+        self.fields = tuple(fields)
+        self._entries: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get_many(self, recipe_ids: Iterable[int]) -> Dict[int, bytes]:
+        """
+        레시피별 카드 JSON 조각 (없는 레시피는 제외)
+
+        캐시에 없는 레시피만 한 번의 쿼리로 조회하여 직렬화 (모두 캐시에 있으면 쿼리 없음)
+        """
+        recipe_ids = list(dict.fromkeys(recipe_ids))
+        version = get_data_version()
+        cards = {}
+        with self._lock:
+            if self._version != version:
+                self._entries.clear()
+                self._version = version
+            for recipe_id in recipe_ids:
+                card = self._entries.get(recipe_id)
+                if card is not None:
+                    self._entries.move_to_end(recipe_id)
+                    cards[recipe_id] = card
+
+        missing = [recipe_id for recipe_id in recipe_ids if recipe_id not in cards]
+        if not missing:
+            return cards
+
+        columns = ('id',) + tuple(field for field in self.fields if field != 'id')
+        fetched = {
+            row['id']: orjson.dumps({field: row[field] for field in self.fields})
+            for row in Recipe.objects.filter(id__in=missing).order_by().values(*columns)
+        }
+        cards.update(fetched)
+        if self.max_entries > 0:
+            with self._lock:
+                if self._version == version:
+                    self._entries.update(fetched)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        return cards
+
+    def clear(self):
+        """전체 항목 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+def stitch_card(card: bytes, fields: dict) -> bytes:
+    """카드 JSON 조각에 요청별 필드를 이어 붙인 객체 ({...카드, ...fields})"""
+    if not fields:
+        return card
+    return card[:-1] + b',' + orjson.dumps(fields)[1:]
+
+
+def render_list(key: str, items: List[bytes], fields: dict) -> bytes:
+    """{key: [items...], ...fields} 응답 본문 (items는 이미 직렬화된 객체)"""
+    body = b'{"' + key.encode() + b'":[' + b','.join(items) + b']'
+    if fields:
+        body += b',' + orjson.dumps(fields)[1:]
+    else:
+        body += b'}'
+    return body
+
+
+def json_response(content: bytes, status: int = 200) -> HttpResponse:
+    """직렬화된 JSON 본문 응답 (django-ninja 응답 검증을 거치지 않음)"""
+    return HttpResponse(content, status=status, content_type='application/json')
+
+
+recipe_card_cache = RecipeCardCache(getattr(settings, 'RECIPE_CARD_CACHE_MAX_ENTRIES', 20000))
+recipe_list_item_cache = RecipeCardCache(getattr(settings, 'RECIPE_CARD_CACHE_MAX_ENTRIES', 20000), LIST_ITEM_FIELDS)
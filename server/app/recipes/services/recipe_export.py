@@ -0,0 +1,45 @@
+"""
+NDJSON 스트리밍 내보내기
+
+Accept: application/x-ndjson 요청에는 목록 전체를 만들지 않고
+서버 사이드 커서(QuerySet.iterator)로 chunk_size개씩 읽어 한 줄에 레시피 하나씩 스트리밍
+(메모리 사용량은 결과 크기와 무관하게 chunk 하나 분량)
+
+주의: WSGI(gunicorn)에서는 그대로 스트리밍되지만, ASGI에서 동기 이터레이터는
+Django가 전체를 모은 뒤 전송함
+"""
+
+from typing import Iterable, Iterator
+import orjson
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def wants_ndjson(request) -> bool:
+    """Accept 헤더로 NDJSON 스트리밍 요청 여부 판단"""
+    return NDJSON_CONTENT_TYPE in request.headers.get('Accept', '')
+
+
+def get_chunk_size() -> int:
+    """서버 사이드 커서에서 한 번에 가져올 행 수"""
+    return getattr(settings, 'NDJSON_EXPORT_CHUNK_SIZE', 2000)
+
+
+def ndjson_lines(queryset, fields: Iterable[str], chunk_size: int) -> Iterator[bytes]:
+    """QuerySet 행을 NDJSON 줄로 변환 (chunk_size줄씩 묶어서 반환)"""
+    lines = []
+    for row in queryset.values(*fields).iterator(chunk_size=chunk_size):
+        lines.append(orjson.dumps(row))
+        if len(lines) >= chunk_size:
+            yield b'\n'.join(lines) + b'\n'
+            lines = []
+    if lines:
+        yield b'\n'.join(lines) + b'\n'
+
+
+def ndjson_response(queryset, fields: Iterable[str]) -> StreamingHttpResponse:
+    """QuerySet 전체를 NDJSON으로 스트리밍 (queryset이 None이면 빈 응답)"""
+    lines = ndjson_lines(queryset, fields, get_chunk_size()) if queryset is not None else iter(())
+    return StreamingHttpResponse(lines, content_type=NDJSON_CONTENT_TYPE)
@@ -0,0 +1,818 @@
+"""
+레시피 추천 인덱스
+
+프로세스별 인메모리 레시피×재료 희소 행렬(CSR)로 추천 요청마다
+전체 레시피/재료를 조회하지 않고 벡터 연산으로 점수 계산
+"""
+
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+import numpy as np
+from django.conf import settings
+from django.db.models import Count
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from .data_version import get_data_version
+from .index_snapshot import get_snapshot_path, open_snapshot, read_snapshot_version, write_snapshot
+from .scoring import ScoreInputs, get_scorer
+
+
+class RecipeMatch(NamedTuple):
+    """레시피 매칭 결과"""
+    recipe_id: int
+    match_score: float  # 알고리즘별 점수 (기본: 보유 재료 수 / 레시피 전체 재료 수)
+    matched_count: int  # 매칭된 재료 수
+    total_count: int  # 레시피 전체 재료 수
+
+
+class MatchResult(NamedTuple):
+    """매칭 결과 목록 + 조건을 만족한 전체 개수"""
+    matches: List[RecipeMatch]
+    total: int
+    total_is_exact: bool = True  # False이면 total은 추정값 (상한 기반 가지치기 사용 시)
+    facet_counts: Optional[Dict[str, Dict[str, int]]] = None  # 패싯 필드 → {값: 조건을 만족한 레시피 수}
+
+
+# 패싯 필터/집계 대상 레시피 필드
+FACET_FIELDS = ('method', 'situation', 'ingredient_type', 'recipe_type', 'difficulty')
+
+
+def normalize_facets(facets: Optional[Dict[str, Iterable[str]]]) -> Optional[Dict[str, List[str]]]:
+    """
+    패싯 조건 → {필드: 정렬된 값 목록} (FACET_FIELDS 순서, 값이 없는 필드 제외, 조건이 없으면 None)
+
+    Raises:
+        ValueError: FACET_FIELDS에 없는 필드
+    """
+    facets = facets or {}
+    unknown = set(facets) - set(FACET_FIELDS)
+    if unknown:
+        raise ValueError(f'unknown facet fields: {", ".join(sorted(map(str, unknown)))}')
+    normalized = {}
+    for field in FACET_FIELDS:
+        values = sorted({str(value).strip() for value in facets.get(field) or () if str(value).strip()})
+        if values:
+            normalized[field] = values
+    return normalized or None
+
+
+# 가지치기 1단계에서 k번째 점수 하한을 추정할 때 모을 posting 수 (limit 배수)
+SEED_POSTINGS_PER_RESULT = 4
+
+
+def _csr_pointer(keys: np.ndarray, size: int) -> np.ndarray:
+    """정렬된 키 배열에서 CSR 포인터(indptr) 생성"""
+    indptr = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=indptr[1:])
+    return indptr
+
+
+class RecipeIndex:
+    """
+    레시피 추천 희소 행렬 인덱스
+
+    행(row)은 기본 정렬(-created_at) 순서의 레시피, 열(column)은 정규화 재료
+
+    - indptr/indices: 레시피×재료 CSR (레시피별 재료 열 목록)
+    - posting_ptr/posting_rows: 재료×레시피 CSR (재료별 레시피 행 목록, 역색인)
+    - totals/norms: 레시피별 고유 재료 수와 L2 norm (키: exclude_seasonings 여부)
+    - seasoning_totals: 레시피별 조미료 수
+    - sized_posting_rows/sized_posting_totals: 재료별 posting을 (레시피 재료 수, 행) 순으로
+      정렬한 사본 (키: exclude_seasonings 여부, 상한 기반 가지치기용)
+    - posting_counts: posting별 Ingredient 행 수 (같은 재료 중복 등록 포함)
+    - essential_row_counts/seasoning_row_counts: 레시피별 필수/조미료 Ingredient 행 수
+      (RecommendationService 점수 기준, 정규화되지 않은 재료는 필수로 계산)
+    - essential_indptr/essential_indices: 레시피×필수(비조미료) 재료 CSR
+    - ingredient_names: 정규화 재료 ID → (이름, 카테고리명) (응답용 이름 조회 테이블)
+    - facet_values/facet_codes: 패싯 필드별 값 목록과 레시피별 값 번호 (빈 값은 -1)
+    - facet_bitmaps: 패싯 필드별 (값 수, 레시피 수/8) 비트맵 (np.packbits, 값별 레시피 행 집합)
+
+    사용자 재료 벡터 u에 대한 매칭 수 A·u는 사용자 재료 열의
+    posting만 모아 bincount 한 번으로 계산
+    """
+
+    def __init__(
+        self,
+        version: str,
+        recipe_ids: List[int],
+        rows: Iterable[Tuple[int, int, bool]],
+        seasoning_ids: Iterable[int] = (),
+        unnormalized_counts: Optional[Dict[int, int]] = None,
+        ingredient_names: Optional[Dict[int, Tuple[str, str]]] = None,
+        facets: Optional[Dict[str, List[str]]] = None
+    ):
+        """
+        Args:
+            version: 인덱스를 구축한 시점의 데이터 버전
+            recipe_ids: 기본 정렬 순서의 레시피 ID 목록
+            rows: (recipe_id, normalized_ingredient_id, is_common_seasoning) 목록 (Ingredient 행 단위)
+            seasoning_ids: 레시피에 쓰이지 않은 재료를 포함한 전체 범용 조미료 ID
+            unnormalized_counts: 레시피 ID → 정규화되지 않은 Ingredient 행 수
+            ingredient_names: 정규화 재료 ID → (이름, 카테고리명)
+            facets: 패싯 필드 → recipe_ids 순서의 레시피별 값 (없는 필드는 모두 빈 값)
+        """
+        self.version = version
+        self.recipe_ids = np.asarray(recipe_ids, dtype=np.int64)
+        row_of = {recipe_id: row for row, recipe_id in enumerate(recipe_ids)}
+        n_recipes = len(recipe_ids)
+
+        seasoning_ids = set(seasoning_ids)
+        entry_rows, entry_ids = [], []
+        for recipe_id, normalized_id, is_seasoning in rows:
+            row = row_of.get(recipe_id)
+            if row is None:
+                continue
+            entry_rows.append(row)
+            entry_ids.append(normalized_id)
+            if is_seasoning:
+                seasoning_ids.add(normalized_id)
+
+        entry_rows = np.asarray(entry_rows, dtype=np.int64)
+        entry_ids = np.asarray(entry_ids, dtype=np.int64)
+
+        # 열 = 정렬된 고유 정규화 재료 ID
+        self.ingredient_ids = np.unique(entry_ids)
+        n_columns = len(self.ingredient_ids)
+        entry_cols = np.searchsorted(self.ingredient_ids, entry_ids)
+
+        # 중복 (레시피, 재료) 제거 + 행 우선 정렬 (중복 행 수는 entry_counts)
+        keys, entry_counts = np.unique(entry_rows * max(n_columns, 1) + entry_cols, return_counts=True)
+        csr_rows = keys // max(n_columns, 1)
+        csr_cols = keys % max(n_columns, 1)
+
+        self.indptr = _csr_pointer(csr_rows, n_recipes)
+        self.indices = csr_cols.astype(np.int32)
+
+        # 전치(열 우선) = 재료별 posting list
+        by_column = np.argsort(csr_cols, kind='stable')
+        self.posting_ptr = _csr_pointer(csr_cols[by_column], n_columns)
+        self.posting_rows = csr_rows[by_column].astype(np.int32)
+        self.posting_counts = entry_counts[by_column].astype(np.int32)
+
+        self.seasoning_ids = frozenset(seasoning_ids)
+        self.is_seasoning = np.isin(self.ingredient_ids, np.fromiter(seasoning_ids, dtype=np.int64))
+        self.totals = {
+            False: np.bincount(csr_rows, minlength=n_recipes),
+            True: np.bincount(csr_rows[~self.is_seasoning[csr_cols]], minlength=n_recipes),
+        }
+        self.norms = {key: np.sqrt(totals) for key, totals in self.totals.items()}
+        self.seasoning_totals = self.totals[False] - self.totals[True]
+
+        entry_is_seasoning = self.is_seasoning[csr_cols]
+        self.essential_indptr = _csr_pointer(csr_rows[~entry_is_seasoning], n_recipes)
+        self.essential_indices = csr_cols[~entry_is_seasoning].astype(np.int32)
+        self.ingredient_names = ingredient_names or {}
+        self.from_snapshot = False
+
+        unnormalized = np.zeros(n_recipes, dtype=np.int64)
+        for recipe_id, count in (unnormalized_counts or {}).items():
+            row = row_of.get(recipe_id)
+            if row is not None:
+                unnormalized[row] = count
+        self.essential_row_counts = np.bincount(
+            csr_rows, weights=entry_counts * ~entry_is_seasoning, minlength=n_recipes
+        ).astype(np.int64) + unnormalized
+        self.seasoning_row_counts = np.bincount(
+            csr_rows, weights=entry_counts * entry_is_seasoning, minlength=n_recipes
+        ).astype(np.int64)
+
+        # 재료별 posting을 레시피 재료 수 순으로 정렬 → 재료 수 범위를 이진 탐색으로 슬라이스
+        self.sized_posting_rows = {}
+        self.sized_posting_totals = {}
+        posting_cols = np.repeat(np.arange(n_columns), np.diff(self.posting_ptr))
+        for key, totals in self.totals.items():
+            posting_totals = totals[self.posting_rows]
+            order = np.lexsort((self.posting_rows, posting_totals, posting_cols))
+            self.sized_posting_rows[key] = self.posting_rows[order]
+            self.sized_posting_totals[key] = posting_totals[order]
+
+        # 패싯 값별 레시피 행 비트맵
+        self.facet_values, self.facet_codes, self.facet_bitmaps = {}, {}, {}
+        for field in FACET_FIELDS:
+            recipe_values = (facets or {}).get(field) or [''] * n_recipes
+            values = sorted(set(recipe_values) - {''})
+            code_of = {value: code for code, value in enumerate(values)}
+            codes = np.fromiter((code_of.get(value, -1) for value in recipe_values), dtype=np.int32, count=n_recipes)
+            self.facet_values[field] = values
+            self.facet_codes[field] = codes
+            self.facet_bitmaps[field] = np.array(
+                [np.packbits(codes == code) for code in range(len(values))], dtype=np.uint8
+            ).reshape(len(values), (n_recipes + 7) // 8)
+
+    @classmethod
+    def build(cls, version: str) -> 'RecipeIndex':
+        """DB에서 인덱스 구축 (쿼리 4회)"""
+        recipe_ids, facets = [], {field: [] for field in FACET_FIELDS}
+        for recipe_id, *values in Recipe.objects.values_list('id', *FACET_FIELDS):
+            recipe_ids.append(recipe_id)
+            for field, value in zip(FACET_FIELDS, values):
+                facets[field].append(value or '')
+        seasoning_ids = []
+        ingredient_names = {}
+        for normalized_id, name, category_name, is_seasoning in (
+            NormalizedIngredient.objects
+            .order_by()
+            .values_list('id', 'name', 'category__name', 'is_common_seasoning')
+        ):
+            ingredient_names[normalized_id] = (name, category_name or '기타')
+            if is_seasoning:
+                seasoning_ids.append(normalized_id)
+        rows = (
+            Ingredient.objects
+            .filter(normalized_ingredient__isnull=False)
+            .order_by()
+            .values_list('recipe_id', 'normalized_ingredient_id', 'normalized_ingredient__is_common_seasoning')
+            .iterator(chunk_size=10000)
+        )
+        unnormalized_counts = dict(
+            Ingredient.objects
+            .filter(normalized_ingredient__isnull=True)
+            .order_by()
+            .values('recipe_id')
+            .annotate(count=Count('id'))
+            .values_list('recipe_id', 'count')
+        )
+        return cls(version, recipe_ids, rows, seasoning_ids, unnormalized_counts, ingredient_names, facets)
+
+    # 스냅샷 배열 이름 → (속성, exclude_seasonings 키) (키가 None이면 배열 속성)
+    SNAPSHOT_ARRAYS = {
+        'recipe_ids': ('recipe_ids', None),
+        'ingredient_ids': ('ingredient_ids', None),
+        'indptr': ('indptr', None),
+        'indices': ('indices', None),
+        'posting_ptr': ('posting_ptr', None),
+        'posting_rows': ('posting_rows', None),
+        'posting_counts': ('posting_counts', None),
+        'is_seasoning': ('is_seasoning', None),
+        'totals_all': ('totals', False),
+        'totals_essential': ('totals', True),
+        'norms_all': ('norms', False),
+        'norms_essential': ('norms', True),
+        'seasoning_totals': ('seasoning_totals', None),
+        'essential_indptr': ('essential_indptr', None),
+        'essential_indices': ('essential_indices', None),
+        'essential_row_counts': ('essential_row_counts', None),
+        'seasoning_row_counts': ('seasoning_row_counts', None),
+        'sized_posting_rows_all': ('sized_posting_rows', False),
+        'sized_posting_rows_essential': ('sized_posting_rows', True),
+        'sized_posting_totals_all': ('sized_posting_totals', False),
+        'sized_posting_totals_essential': ('sized_posting_totals', True),
+    }
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        인덱스 배열을 스냅샷 파일로 저장 (services.index_snapshot)
+
+        Returns:
+            파일 크기 (bytes)
+        """
+        arrays = {
+            name: getattr(self, attr) if key is None else getattr(self, attr)[key]
+            for name, (attr, key) in self.SNAPSHOT_ARRAYS.items()
+        }
+        arrays['seasoning_ids'] = np.array(sorted(self.seasoning_ids), dtype=np.int64)
+        for field in FACET_FIELDS:
+            arrays[f'facet_codes_{field}'] = self.facet_codes[field]
+            arrays[f'facet_bitmaps_{field}'] = self.facet_bitmaps[field]
+        metadata = {
+            'ingredient_names': {
+                str(normalized_id): list(names) for normalized_id, names in self.ingredient_names.items()
+            },
+            'facet_values': self.facet_values,
+        }
+        return write_snapshot(path, self.version, arrays, metadata)
+
+    @classmethod
+    def load_snapshot(cls, path: str) -> 'RecipeIndex':
+        """
+        스냅샷 파일을 mmap으로 열어 인덱스 생성 (배열 재계산 없음, 읽기 전용 배열)
+
+        Raises:
+            OSError: 파일을 열 수 없음
+            ValueError: 스냅샷 형식이 아님
+        """
+        version, arrays, metadata = open_snapshot(path)
+        if 'facet_values' not in metadata:
+            raise ValueError('snapshot has no facet bitmaps')
+        index = cls.__new__(cls)
+        index.version = version
+        index.from_snapshot = True
+        for attr in ('totals', 'norms', 'sized_posting_rows', 'sized_posting_totals'):
+            setattr(index, attr, {})
+        for name, (attr, key) in cls.SNAPSHOT_ARRAYS.items():
+            if key is None:
+                setattr(index, attr, arrays[name])
+            else:
+                getattr(index, attr)[key] = arrays[name]
+        index.seasoning_ids = frozenset(arrays['seasoning_ids'].tolist())
+        index.ingredient_names = {
+            int(normalized_id): tuple(names) for normalized_id, names in metadata['ingredient_names'].items()
+        }
+        index.facet_values = metadata['facet_values']
+        index.facet_codes = {field: arrays[f'facet_codes_{field}'] for field in FACET_FIELDS}
+        index.facet_bitmaps = {field: arrays[f'facet_bitmaps_{field}'] for field in FACET_FIELDS}
+        return index
+
+    def facet_mask(self, facets: Dict[str, Iterable[str]]) -> Optional[np.ndarray]:
+        """
+        패싯 조건을 만족하는 레시피 행 마스크 (조건이 없으면 None)
+
+        같은 필드의 값은 OR, 필드 간은 AND (비트맵 OR/AND 후 한 번만 unpack)
+        인덱스에 없는 값은 일치하는 레시피 없음
+        """
+        n_recipes = len(self.recipe_ids)
+        selected = None
+        for field, values in facets.items():
+            values = set(values)
+            if not values:
+                continue
+            bitmaps = self.facet_bitmaps[field]
+            field_bits = np.zeros(bitmaps.shape[1], dtype=np.uint8)
+            for code, value in enumerate(self.facet_values[field]):
+                if value in values:
+                    field_bits |= bitmaps[code]
+            selected = field_bits if selected is None else selected & field_bits
+        if selected is None:
+            return None
+        return np.unpackbits(selected, count=n_recipes).astype(bool)
+
+    def facet_counts(self, rows: np.ndarray) -> Dict[str, Dict[str, int]]:
+        """레시피 행 집합의 패싯 값별 레시피 수 (많은 순, 0개인 값 제외)"""
+        counts = {}
+        for field in FACET_FIELDS:
+            values = self.facet_values[field]
+            codes = self.facet_codes[field][rows]
+            field_counts = np.bincount(codes[codes >= 0], minlength=len(values))
+            order = np.lexsort((np.arange(len(values)), -field_counts))
+            counts[field] = {values[code]: int(field_counts[code]) for code in order if field_counts[code]}
+        return counts
+
+    def used_ids(self, ingredient_ids: Iterable[int], exclude_seasonings: bool = False) -> Set[int]:
+        """정규화 재료 ID 중 레시피에 쓰이는 ID (exclude_seasonings이면 범용 조미료 제외)"""
+        return set(self.ingredient_ids[self.columns_for(ingredient_ids, exclude_seasonings)].tolist())
+
+    def columns_for(self, user_ids: Iterable[int], exclude_seasonings: bool) -> np.ndarray:
+        """정규화 재료 ID → 인덱스 열 번호 (인덱스에 없는 재료는 제외)"""
+        ids = np.unique(np.fromiter(user_ids, dtype=np.int64))
+        positions = np.searchsorted(self.ingredient_ids, ids)
+        positions = positions[positions < len(self.ingredient_ids)]
+        columns = positions[np.isin(self.ingredient_ids[positions], ids)]
+        if exclude_seasonings:
+            columns = columns[~self.is_seasoning[columns]]
+        return columns
+
+    def matched_counts(self, columns: np.ndarray) -> np.ndarray:
+        """희소 행렬-벡터 곱: 레시피별 매칭 재료 수"""
+        if len(columns) == 0:
+            return np.zeros(len(self.recipe_ids), dtype=np.int64)
+        postings = np.concatenate([
+            self.posting_rows[self.posting_ptr[col]:self.posting_ptr[col + 1]]
+            for col in columns
+        ])
+        return np.bincount(postings, minlength=len(self.recipe_ids))
+
+    def row_matched_counts(self, rows: np.ndarray, in_user: np.ndarray) -> np.ndarray:
+        """레시피×재료 CSR 행을 직접 읽어 지정한 레시피들의 매칭 재료 수 계산"""
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        if lengths.sum() == 0:
+            return np.zeros(len(rows), dtype=np.int64)
+        offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        entries = self.indices[np.arange(lengths.sum()) + offsets]
+        owners = np.repeat(np.arange(len(rows)), lengths)
+        return np.bincount(owners, weights=in_user[entries], minlength=len(rows)).astype(np.int64)
+
+    def match(
+        self,
+        user_ids: Iterable[int],
+        exclude_seasonings: bool,
+        min_match_rate: float,
+        limit: Optional[int] = None,
+        rank_by_matched_count: bool = True,
+        algorithm: str = 'coverage',
+        exact_total: bool = True,
+        facets: Optional[Dict[str, Iterable[str]]] = None,
+        count_facets: bool = False
+    ) -> MatchResult:
+        """
+        사용자 재료와 매칭되는 레시피 목록
+
+        사용자 재료를 하나 이상 포함한 후보 레시피만 대상
+        (min_match_rate가 0 이하이면 매칭 0개 레시피도 포함)
+
+        정렬: 점수 → (매칭 재료 수) → 기본 정렬 순서
+        limit 지정 시 전체 정렬 대신 argpartition으로 상위 후보만 정렬
+
+        exact_total=False이고 limit이 지정되면 점수 상한으로 상위 limit개에
+        들 수 없는 레시피를 건너뜀 (_match_pruned, 결과 목록은 동일, total은 추정값)
+        패싯 조건/집계를 사용하면 항상 전체 계산 (패싯 비트맵으로 후보를 먼저 좁힘)
+
+        Args:
+            user_ids: 사용자 보유 정규화 재료 ID
+            exclude_seasonings: 범용 조미료 제외 여부
+            min_match_rate: 최소 점수
+            limit: 반환할 최대 개수 (None이면 전체)
+            rank_by_matched_count: 동점 시 매칭 재료 수로 2차 정렬 여부
+            algorithm: 점수 알고리즘 이름 (services.scoring 레지스트리)
+            exact_total: 전체 개수를 정확히 계산할지 여부
+            facets: 패싯 필드 → 허용 값 목록 (facet_mask)
+            count_facets: 조건을 만족한 전체 레시피의 패싯 값별 개수 계산 여부
+
+        Returns:
+            MatchResult(정렬된 상위 매칭 목록, 조건을 만족한 전체 개수, 전체 개수 정확 여부, 패싯 개수)
+
+        Raises:
+            KeyError: 등록되지 않은 알고리즘
+        """
+        scorer = get_scorer(algorithm)
+        user_ids = set(user_ids)
+        totals = self.totals[exclude_seasonings]
+
+        columns = self.columns_for(user_ids, exclude_seasonings=False)
+        user_size = len(user_ids - self.seasoning_ids) if exclude_seasonings else len(user_ids)
+
+        mask = self.facet_mask(facets) if facets else None
+        if (not exact_total and limit is not None and min_match_rate > 0 and scorer.monotone
+                and mask is None and not count_facets):
+            counted = columns[~self.is_seasoning[columns]] if exclude_seasonings else columns
+            return self._match_pruned(
+                scorer, counted, user_size, exclude_seasonings, min_match_rate, limit, rank_by_matched_count
+            )
+
+        seasoning_columns = columns[self.is_seasoning[columns]]
+        counts = self.matched_counts(columns[~self.is_seasoning[columns]] if exclude_seasonings else columns)
+        seasoning_counts = self.matched_counts(seasoning_columns) if scorer.uses_seasonings else None
+
+        if min_match_rate <= 0:
+            rows = np.flatnonzero(totals)
+        elif seasoning_counts is not None:
+            rows = np.flatnonzero(counts + seasoning_counts)
+        else:
+            rows = np.flatnonzero(counts)
+        if mask is not None:
+            rows = rows[mask[rows]]
+
+        matched = counts[rows]
+        if seasoning_counts is not None:
+            seasoning_matched = seasoning_counts[rows]
+            essential_matched = matched if exclude_seasonings else matched - seasoning_matched
+        else:
+            seasoning_matched = essential_matched = None
+
+        scores = scorer.score(ScoreInputs(
+            matched=matched,
+            totals=totals[rows],
+            norms=self.norms[exclude_seasonings][rows],
+            essential_matched=essential_matched,
+            essential_totals=self.totals[True][rows],
+            seasoning_matched=seasoning_matched,
+            seasoning_totals=self.seasoning_totals[rows],
+            user_size=user_size,
+        ))
+
+        passed = scores >= min_match_rate
+        rows, matched, scores = rows[passed], matched[passed], scores[passed]
+        matches = self._rank(rows, matched, scores, totals, limit, rank_by_matched_count)
+        facet_counts = self.facet_counts(rows) if count_facets else None
+        return MatchResult(matches, len(rows), facet_counts=facet_counts)
+
+    def match_batch(
+        self,
+        user_id_sets: List[Iterable[int]],
+        exclude_seasonings: bool,
+        min_match_rate: float,
+        limit: Optional[int] = None,
+        rank_by_matched_count: bool = True,
+        algorithm: str = 'coverage'
+    ) -> List[MatchResult]:
+        """
+        여러 재료 조합의 매칭 결과를 한 번에 계산
+
+        (조합×재료) 희소 행렬과 재료×레시피 posting의 곱으로 모든 조합의
+        (조합, 레시피)별 매칭 수를 한 번에 구하고 점수도 한 번에 계산
+        결과는 조합별 match()와 동일 (min_match_rate가 0 이하이면 조합별 match() 사용)
+
+        Returns:
+            user_id_sets 순서의 MatchResult 목록
+        """
+        scorer = get_scorer(algorithm)
+        user_id_sets = [set(user_ids) for user_ids in user_id_sets]
+        if min_match_rate <= 0:
+            return [
+                self.match(user_ids, exclude_seasonings, min_match_rate, limit, rank_by_matched_count, algorithm)
+                for user_ids in user_id_sets
+            ]
+
+        n_recipes = len(self.recipe_ids)
+        totals = self.totals[exclude_seasonings]
+        user_sizes = np.array([
+            len(user_ids - self.seasoning_ids) if exclude_seasonings else len(user_ids)
+            for user_ids in user_id_sets
+        ], dtype=np.int64)
+
+        # (조합, 레시피) 키별 posting 모으기: 조합 × posting 희소 곱
+        keys, seasoning_flags = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=bool)]
+        for set_index, user_ids in enumerate(user_id_sets):
+            columns = self.columns_for(user_ids, exclude_seasonings=False)
+            if exclude_seasonings and not scorer.uses_seasonings:
+                columns = columns[~self.is_seasoning[columns]]
+            lengths = self.posting_ptr[columns + 1] - self.posting_ptr[columns]
+            starts = self.posting_ptr[columns]
+            offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+            postings = self.posting_rows[np.arange(lengths.sum()) + offsets].astype(np.int64)
+            keys.append(set_index * n_recipes + postings)
+            seasoning_flags.append(np.repeat(self.is_seasoning[columns], lengths))
+
+        keys, inverse = np.unique(np.concatenate(keys), return_inverse=True)
+        seasoning_flags = np.concatenate(seasoning_flags)
+        all_counts = np.bincount(inverse, minlength=len(keys))
+        seasoning_counts = np.bincount(inverse, weights=seasoning_flags, minlength=len(keys)).astype(np.int64)
+        set_indices, rows = np.divmod(keys, max(n_recipes, 1))
+
+        counts = all_counts - seasoning_counts if exclude_seasonings else all_counts
+        if scorer.uses_seasonings:
+            seasoning_matched = seasoning_counts
+            essential_matched = all_counts - seasoning_counts
+        else:
+            # 조미료 제외 시 조미료 열은 처음부터 제외했으므로 매칭 수 0인 키 없음
+            seasoning_matched = essential_matched = None
+
+        scores = scorer.score(ScoreInputs(
+            matched=counts,
+            totals=totals[rows],
+            norms=self.norms[exclude_seasonings][rows],
+            essential_matched=essential_matched,
+            essential_totals=self.totals[True][rows],
+            seasoning_matched=seasoning_matched,
+            seasoning_totals=self.seasoning_totals[rows],
+            user_size=user_sizes[set_indices],
+        ))
+
+        passed = scores >= min_match_rate
+        set_indices, rows, counts, scores = set_indices[passed], rows[passed], counts[passed], scores[passed]
+        bounds = np.searchsorted(set_indices, np.arange(len(user_id_sets) + 1))
+        results = []
+        for set_index in range(len(user_id_sets)):
+            start, end = bounds[set_index], bounds[set_index + 1]
+            matches = self._rank(
+                rows[start:end], counts[start:end], scores[start:end], totals, limit, rank_by_matched_count
+            )
+            results.append(MatchResult(matches, int(end - start)))
+        return results
+
+    def _rank(
+        self,
+        rows: np.ndarray,
+        matched: np.ndarray,
+        scores: np.ndarray,
+        totals: np.ndarray,
+        limit: Optional[int],
+        rank_by_matched_count: bool
+    ) -> List[RecipeMatch]:
+        """점수 → (매칭 재료 수) → 기본 정렬 순서로 상위 limit개 정렬"""
+        total = len(rows)
+        if limit is not None and limit < total:
+            # limit번째 점수 이상인 후보만 남김 (동점은 모두 유지하여 정렬 결과 보존)
+            kth_score = np.partition(scores, total - limit)[total - limit]
+            top = scores >= kth_score
+            rows, matched, scores = rows[top], matched[top], scores[top]
+
+        if rank_by_matched_count:
+            order = np.lexsort((rows, -matched, -scores))
+        else:
+            order = np.lexsort((rows, -scores))
+        if limit is not None:
+            order = order[:limit]
+
+        recipe_totals = totals[rows]
+        return [
+            RecipeMatch(int(self.recipe_ids[rows[i]]), float(scores[i]), int(matched[i]), int(recipe_totals[i]))
+            for i in order
+        ]
+
+    def _size_range(self, scorer, n_columns: int, user_size: int, threshold: float, max_total: int):
+        """
+        점수 상한이 threshold 이상인 레시피 재료 수 범위 (없으면 None)
+
+        재료 수 n인 레시피의 매칭 수는 min(n, 사용자 재료 열 수) 이하이고
+        monotone 알고리즘의 점수는 매칭 수에 대해 단조 증가
+        → 이 매칭 수로 계산한 점수가 레시피 점수의 상한
+        """
+        sizes = np.arange(1, max_total + 1)
+        upper_bounds = scorer.score(ScoreInputs(
+            matched=np.minimum(sizes, n_columns),
+            totals=sizes,
+            norms=np.sqrt(sizes),
+            essential_matched=None,
+            essential_totals=sizes,
+            seasoning_matched=None,
+            seasoning_totals=np.zeros_like(sizes),
+            user_size=user_size,
+        ))
+        admissible = np.flatnonzero(upper_bounds >= threshold)
+        if len(admissible) == 0:
+            return None
+        return int(sizes[admissible[0]]), int(sizes[admissible[-1]])
+
+    def _match_pruned(
+        self,
+        scorer,
+        columns: np.ndarray,
+        user_size: int,
+        exclude_seasonings: bool,
+        min_match_rate: float,
+        limit: int,
+        rank_by_matched_count: bool
+    ) -> MatchResult:
+        """
+        점수 상한 기반 상위 limit개 매칭 (MaxScore 방식)
+
+        1. 희소 재료부터 posting을 모아 정확한 점수를 계산하고 k번째 점수를 하한(theta)으로 사용
+        2. 점수 상한이 theta 미만인 재료 수의 레시피는 posting을 읽지 않고 건너뜀
+        3. 남은 레시피는 모든 posting이 포함되므로 매칭 수가 정확
+
+        건너뛴 레시피의 점수 상한 < theta <= 최종 k번째 점수이므로 결과 목록은 전체 계산과 동일
+        """
+        totals = self.totals[exclude_seasonings]
+        if len(columns) == 0 or len(totals) == 0:
+            return MatchResult([], 0)
+
+        posting_rows = self.sized_posting_rows[exclude_seasonings]
+        posting_totals = self.sized_posting_totals[exclude_seasonings]
+        max_total = int(totals.max())
+
+        def postings_between(column, low, high):
+            start, end = self.posting_ptr[column], self.posting_ptr[column + 1]
+            sizes = posting_totals[start:end]
+            return (
+                start + np.searchsorted(sizes, low, side='left'),
+                start + np.searchsorted(sizes, high, side='right')
+            )
+
+        def score_rows(rows, matched):
+            return scorer.score(ScoreInputs(
+                matched=matched,
+                totals=totals[rows],
+                norms=self.norms[exclude_seasonings][rows],
+                essential_matched=None,
+                essential_totals=self.totals[True][rows],
+                seasoning_matched=None,
+                seasoning_totals=self.seasoning_totals[rows],
+                user_size=user_size,
+            ))
+
+        bounds = self._size_range(scorer, len(columns), user_size, min_match_rate, max_total)
+        if bounds is None:
+            return MatchResult([], 0)
+
+        # 1단계: 희소 재료 우선으로 posting을 모아 k번째 점수 하한 추정
+        lengths = self.posting_ptr[columns + 1] - self.posting_ptr[columns]
+        columns = columns[np.argsort(lengths, kind='stable')]
+        in_user = np.zeros(len(self.ingredient_ids), dtype=bool)
+        in_user[columns] = True
+
+        seed, seen = [], 0
+        for column in columns:
+            start, end = postings_between(column, *bounds)
+            seed.append(posting_rows[start:end])
+            seen += end - start
+            if seen >= limit * SEED_POSTINGS_PER_RESULT:
+                break
+        seed_rows = np.unique(np.concatenate(seed))
+
+        threshold = min_match_rate
+        if len(seed_rows) >= limit:
+            seed_scores = score_rows(seed_rows, self.row_matched_counts(seed_rows, in_user))
+            if (seed_scores >= min_match_rate).sum() >= limit:
+                threshold = max(threshold, float(np.partition(seed_scores, -limit)[-limit]))
+
+        # 2단계: 상한이 theta 이상인 재료 수 범위의 posting만 집계
+        pruned = self._size_range(scorer, len(columns), user_size, threshold, max_total)
+        ranges = [postings_between(column, *pruned) for column in columns]
+        postings = np.concatenate([posting_rows[start:end] for start, end in ranges])
+        rows, matched = np.unique(postings, return_counts=True)
+        scores = score_rows(rows, matched)
+
+        passed = scores >= min_match_rate
+        rows, matched, scores = rows[passed], matched[passed], scores[passed]
+        matches = self._rank(rows, matched, scores, totals, limit, rank_by_matched_count)
+
+        if pruned == bounds:
+            return MatchResult(matches, len(rows))
+
+        # 건너뛴 posting 수 × (범위 내 posting당 조건 만족 레시피 비율)로 전체 개수 추정
+        scanned = len(postings)
+        skipped = sum(
+            end - start for start, end in (postings_between(column, *bounds) for column in columns)
+        ) - scanned
+        estimated = len(rows) + int(round(skipped * len(rows) / scanned)) if scanned else len(rows)
+        return MatchResult(matches, estimated, total_is_exact=False)
+
+
+_index = None
+_index_lock = threading.Lock()
+# DB에서 구축한 인덱스를 스냅샷으로 교체할 수 있는지 마지막으로 확인한 시각 (monotonic)
+_snapshot_checked_at = 0.0
+
+
+def get_recipe_index() -> RecipeIndex:
+    """
+    현재 데이터 버전의 추천 인덱스 조회
+
+    데이터 버전이 바뀌었으면 재구축 (프로세스당 1개 유지)
+    RECIPE_INDEX_SNAPSHOT_PATH의 스냅샷이 현재 데이터 버전이면 DB 대신 스냅샷을 mmap으로 사용
+
+    스냅샷 빌더(write_recipe_index_snapshot --watch)는 버전이 바뀐 뒤 조금 늦게 스냅샷을 쓰므로
+    - 스냅샷 파일이 있으면 현재 버전 스냅샷을 RECIPE_INDEX_SNAPSHOT_WAIT초까지 기다린 뒤 DB에서 구축
+    - DB에서 구축한 인덱스는 RECIPE_INDEX_SNAPSHOT_RECHECK_INTERVAL초마다 스냅샷을 확인하여
+      현재 버전 스냅샷이 생기면 교체 (워커별 힙 사본 해제, 물리 메모리 한 벌 공유)
+    """
+    global _index
+
+    version = get_data_version()
+    index = _index
+    if index is not None and index.version == version:
+        if not index.from_snapshot and _snapshot_recheck_due():
+            return _swap_to_snapshot(version)
+        return index
+
+    with _index_lock:
+        if _index is None or _index.version != version:
+            _index = _wait_for_snapshot(version) or RecipeIndex.build(version)
+        return _index
+
+
+def _snapshot_recheck_due() -> bool:
+    """DB에서 구축한 인덱스의 스냅샷 교체 확인 주기가 되었는지 여부"""
+    if not get_snapshot_path():
+        return False
+    interval = getattr(settings, 'RECIPE_INDEX_SNAPSHOT_RECHECK_INTERVAL', 1.0)
+    return time.monotonic() - _snapshot_checked_at >= interval
+
+
+def _swap_to_snapshot(version: str) -> RecipeIndex:
+    """현재 버전 스냅샷이 생겼으면 DB에서 구축한 인덱스를 스냅샷으로 교체"""
+    global _index, _snapshot_checked_at
+
+    with _index_lock:
+        _snapshot_checked_at = time.monotonic()
+        if _index is not None and _index.version == version and not _index.from_snapshot:
+            _index = _load_current_snapshot(version) or _index
+        return _index
+
+
+def _wait_for_snapshot(version: str) -> Optional[RecipeIndex]:
+    """
+    현재 버전 스냅샷 로드 (빌더가 쓰는 중이면 짧은 간격으로 재시도)
+
+    스냅샷 파일이 없으면(빌더 미사용) 기다리지 않음
+    """
+    global _snapshot_checked_at
+
+    _snapshot_checked_at = time.monotonic()
+    index = _load_current_snapshot(version)
+    path = get_snapshot_path()
+    if index is not None or not path or not os.path.exists(path):
+        return index
+
+    deadline = time.monotonic() + getattr(settings, 'RECIPE_INDEX_SNAPSHOT_WAIT', 3.0)
+    delay = 0.05
+    while index is None and time.monotonic() + delay <= deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+        # 기다리는 동안 버전이 다시 바뀌었으면 새 버전으로 구축
+        if get_data_version() != version:
+            return None
+        index = _load_current_snapshot(version)
+    return index
+
+
+def refresh_snapshot(path: str) -> Optional[RecipeIndex]:
+    """
+    스냅샷이 현재 데이터 버전이 아니면 DB에서 다시 구축하여 저장
+
+    구축 중에 버전이 바뀌면 이전 버전으로 저장되므로 다음 호출에서 다시 구축
+
+    Returns:
+        새로 저장한 인덱스 (이미 현재 버전이면 None)
+    """
+    version = get_data_version()
+    if read_snapshot_version(path) == version:
+        return None
+    index = RecipeIndex.build(version)
+    index.save_snapshot(path)
+    return index
+
+
+def _load_current_snapshot(version: str) -> Optional[RecipeIndex]:
+    """현재 데이터 버전의 스냅샷이 있으면 로드 (없거나 버전이 다르면 None)"""
+    path = get_snapshot_path()
+    if not path or read_snapshot_version(path) != version:
+        return None
+    try:
+        index = RecipeIndex.load_snapshot(path)
+    except (OSError, ValueError):
+        return None
+    # 버전 확인 후 파일이 교체된 경우
+    return index if index.version == version else None
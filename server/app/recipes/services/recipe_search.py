@@ -0,0 +1,99 @@
+"""
+재료 AND 검색 (키셋 페이지네이션)
+
+모든 재료를 포함한 레시피를 재료 시그니처 포함(@>) 검색(GIN 인덱스) 한 번으로 찾고,
+같은 쿼리의 COUNT(*) OVER()로 남은 전체 개수를 함께 계산
+
+정렬은 (-created_at, -id) 고정, 다음 페이지는 마지막 레시피의 (created_at, id) 이후부터 조회
+(OFFSET 없이 페이지 깊이와 무관하게 같은 비용)
+커서에는 이미 반환한 개수를 담아 total = 반환한 개수 + 남은 개수로 계산
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import List, NamedTuple, Optional
+from django.db.models import Count, Q, Window
+from recipes.models import Recipe
+
+
+class SearchCursor(NamedTuple):
+    """다음 페이지 시작 위치 (마지막 레시피의 정렬 키 + 이미 반환한 개수)"""
+    ingredient_ids: List[int]
+    created_at: datetime
+    recipe_id: int
+    seen: int
+
+
+class SearchPage(NamedTuple):
+    """검색 결과 한 페이지"""
+    recipe_ids: List[int]
+    total: int
+    next_cursor: Optional[SearchCursor]
+
+
+def encode_search_cursor(cursor: SearchCursor) -> str:
+    """커서 → URL-safe 불투명 문자열"""
+    payload = json.dumps(
+        [cursor.ingredient_ids, cursor.created_at.isoformat(), cursor.recipe_id, cursor.seen],
+        separators=(',', ':')
+    ).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_search_cursor(value: str, ingredient_ids: List[int]) -> SearchCursor:
+    """
+    불투명 문자열 → 커서
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 다른 재료 조합의 커서
+    """
+    try:
+        payload = base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+        ids, created_at, recipe_id, seen = json.loads(payload)
+        cursor = SearchCursor(
+            [int(i) for i in ids], datetime.fromisoformat(created_at), int(recipe_id), max(0, int(seen))
+        )
+    except (TypeError, ValueError, UnicodeDecodeError) as exc:
+        raise ValueError('invalid cursor') from exc
+    if cursor.ingredient_ids != list(ingredient_ids):
+        raise ValueError('cursor belongs to another search')
+    return cursor
+
+
+def search_queryset(ingredient_ids: List[int], after: Optional[SearchCursor] = None):
+    """모든 재료를 포함한 레시피 QuerySet (after 이후, 정렬: -created_at, -id)"""
+    queryset = Recipe.objects.filter(ingredient_signature__contains=ingredient_ids)
+    if after is not None:
+        queryset = queryset.filter(
+            Q(created_at__lt=after.created_at) | Q(created_at=after.created_at, id__lt=after.recipe_id)
+        )
+    return queryset.order_by('-created_at', '-id')
+
+
+def search_recipes_by_ingredients(
+    ingredient_ids: List[int],
+    limit: int,
+    after: Optional[SearchCursor] = None
+) -> SearchPage:
+    """
+    모든 재료를 포함한 레시피 한 페이지 (쿼리 1회)
+
+    Args:
+        ingredient_ids: 정렬된 정규화 재료 ID (모두 포함해야 함)
+        limit: 페이지 크기
+        after: 이전 페이지의 next_cursor (None이면 첫 페이지)
+    """
+    seen = after.seen if after is not None else 0
+    rows = list(
+        search_queryset(ingredient_ids, after)
+        .annotate(remaining=Window(Count('*')))
+        .values_list('id', 'created_at', 'remaining')[:limit]
+    )
+    total = seen + (rows[0][2] if rows else 0)
+
+    next_cursor = None
+    if rows and seen + len(rows) < total:
+        last_id, last_created_at, _ = rows[-1]
+        next_cursor = SearchCursor(list(ingredient_ids), last_created_at, last_id, seen + len(rows))
+    return SearchPage([recipe_id for recipe_id, _, _ in rows], total, next_cursor)
@@ -0,0 +1,71 @@
+"""
+레시피 재료 시그니처 관리
+
+Recipe.ingredient_signature / essential_signature에 레시피별 정규화 재료 ID
+배열(중복 제거, 오름차순)을 비정규화하여 GIN 인덱스로
+겹침(&&)/포함(@>) 검색을 Ingredient 조인 없이 처리
+"""
+
+from typing import Iterable, Optional
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.fields import ArrayField
+from django.db import models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from recipes.models import Recipe, Ingredient
+from .ingredient_usage import refresh_recipe_counts, signature_ingredient_ids
+
+
+def _signature_subquery(exclude_seasonings: bool = False) -> Coalesce:
+    """레시피별 정규화 재료 ID 배열 서브쿼리 (재료가 없으면 빈 배열)"""
+    ingredients = Ingredient.objects.filter(recipe=OuterRef('pk'), normalized_ingredient__isnull=False)
+    if exclude_seasonings:
+        ingredients = ingredients.exclude_seasonings()
+    signature = (
+        ingredients
+        .order_by()
+        .values('recipe')
+        .annotate(ids=ArrayAgg('normalized_ingredient_id', distinct=True, order_by='normalized_ingredient_id'))
+        .values('ids')
+    )
+    return Coalesce(Subquery(signature), Value([]), output_field=ArrayField(models.IntegerField()))
+
+
+def refresh_recipe_signatures(recipe_ids: Optional[Iterable[int]] = None) -> int:
+    """
+    레시피 재료 시그니처 재계산 (UPDATE 1회, 시그널 발생 없음)
+
+    재계산 전/후 시그니처에 포함된 정규화 재료의 사용 레시피 수도 함께 갱신
+
+    Args:
+        recipe_ids: 재계산할 레시피 ID 또는 values('id') QuerySet (None이면 전체)
+
+    Returns:
+        갱신된 레시피 수
+    """
+    queryset = Recipe.objects.all()
+    if recipe_ids is not None:
+        queryset = queryset.filter(id__in=recipe_ids)
+
+    affected_ids = signature_ingredient_ids(queryset)
+    updated = queryset.update(
+        ingredient_signature=_signature_subquery(),
+        essential_signature=_signature_subquery(exclude_seasonings=True),
+    )
+    refresh_recipe_counts(affected_ids | signature_ingredient_ids(queryset))
+    return updated
+
+
+def refresh_signatures_containing(normalized_ids: Iterable[int]) -> int:
+    """
+    정규화 재료를 포함한 레시피의 시그니처 재계산
+
+    범용 조미료 여부 변경, 정규화 재료 병합/삭제 시 사용
+    """
+    normalized_ids = list(normalized_ids)
+    if not normalized_ids:
+        return 0
+    recipe_ids = Recipe.objects.filter(
+        ingredient_signature__overlap=normalized_ids
+    ).values('id')
+    return refresh_recipe_signatures(recipe_ids)
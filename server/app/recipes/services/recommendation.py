@@ -2,10 +2,17 @@
 레시피 추천 알고리즘 서비스
 
 냉장고 재료 기반으로 레시피를 추천하는 핵심 알고리즘
+
+recommend_recipes / recommend_with_filters는 냉장고별 매칭 수 벡터
+(services.fridge_scores)로 매칭 재료가 있는 레시피만 점수를 계산하고,
+레시피 수와 무관하게 고정된 쿼리 수로 부족한 재료를 조회
 """
 
-from typing import List, Dict, Any
-from recipes.models import Recipe, Ingredient
+from collections import defaultdict
+from typing import Iterable, List, Dict, Any, Set, Tuple
+import numpy as np
+from recipes.models import Recipe, Ingredient, parse_difficulty_level
+from .fridge_scores import get_fridge_scores
 
 
 class RecommendationService:
@@ -30,30 +37,40 @@ class RecommendationService:
         """
         # 레시피의 모든 재료 조회
         recipe_ingredients = recipe.ingredients.select_related('normalized_ingredient').all()
-
-        # 필수 재료만 추출 (조미료 제외)
-        essential_ingredients = [
-            ing for ing in recipe_ingredients
-            if not (ing.normalized_ingredient and ing.normalized_ingredient.is_common_seasoning)
+        rows = [
+            (ing.normalized_ingredient_id, bool(ing.normalized_ingredient and ing.normalized_ingredient.is_common_seasoning))
+            for ing in recipe_ingredients
         ]
 
-        # 조미료 재료
-        seasoning_ingredients = [
-            ing for ing in recipe_ingredients
-            if ing.normalized_ingredient and ing.normalized_ingredient.is_common_seasoning
-        ]
+        # 냉장고 재료 ID 집합
+        fridge_ingredient_ids = set(fridge_ingredients.values_list('id', flat=True))
+
+        return self._score_rows(rows, fridge_ingredient_ids)
+
+    def _score_rows(
+        self,
+        rows: Iterable[Tuple[int, bool]],
+        fridge_ingredient_ids: Set[int]
+    ) -> float:
+        """
+        레시피 재료 행 목록으로 매칭 점수 계산 (calculate_match_score와 동일 공식)
+
+        Args:
+            rows: (normalized_ingredient_id, is_common_seasoning) 목록 (재료 행 단위)
+            fridge_ingredient_ids: 냉장고의 정규화 재료 ID 집합
+        """
+        # 필수 재료 / 조미료 재료 분리
+        essential_ingredients = [normalized_id for normalized_id, is_seasoning in rows if not is_seasoning]
+        seasoning_ingredients = [normalized_id for normalized_id, is_seasoning in rows if is_seasoning]
 
         # 필수 재료가 없는 경우 예외 처리
         if not essential_ingredients:
             return 0.0
 
-        # 냉장고 재료 ID 집합
-        fridge_ingredient_ids = set(fridge_ingredients.values_list('id', flat=True))
-
         # 매칭된 필수 재료 수 계산
         matched_essential_count = sum(
-            1 for ing in essential_ingredients
-            if ing.normalized_ingredient_id in fridge_ingredient_ids
+            1 for normalized_id in essential_ingredients
+            if normalized_id in fridge_ingredient_ids
         )
 
         # 기본 점수 계산 (0-100)
@@ -63,8 +80,8 @@ class RecommendationService:
         seasoning_bonus = 0
         if seasoning_ingredients:
             matched_seasoning_count = sum(
-                1 for ing in seasoning_ingredients
-                if ing.normalized_ingredient_id in fridge_ingredient_ids
+                1 for normalized_id in seasoning_ingredients
+                if normalized_id in fridge_ingredient_ids
             )
             # 조미료 매칭률에 비례하여 최대 5점
             seasoning_bonus = min(
@@ -141,38 +158,7 @@ class RecommendationService:
                 ...
             ]
         """
-        # 냉장고 재료 조회
-        fridge_ingredients = fridge.get_normalized_ingredients()
-
-        # 냉장고가 비어있으면 빈 리스트 반환
-        if not fridge_ingredients.exists():
-            return []
-
-        # 모든 레시피에 대해 매칭 점수 계산
-        all_recipes = Recipe.objects.prefetch_related(
-            'ingredients__normalized_ingredient'
-        ).all()
-
-        recommendations = []
-        for recipe in all_recipes:
-            score = self.calculate_match_score(recipe, fridge_ingredients)
-
-            # 최소 점수 이상인 레시피만 포함
-            if score >= min_score:
-                missing_ingredients = self.get_missing_ingredients(recipe, fridge_ingredients)
-
-                recommendations.append({
-                    'recipe': recipe,
-                    'score': score,
-                    'missing_ingredients': missing_ingredients,
-                    'missing_count': len(missing_ingredients)
-                })
-
-        # 점수 역순 정렬
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
-
-        # 상위 limit개 반환
-        return recommendations[:limit]
+        return self._recommend(fridge, limit, min_score)
 
     def recommend_with_filters(
         self,
@@ -193,46 +179,180 @@ class RecommendationService:
         Returns:
             필터링된 추천 레시피 목록
         """
-        # 냉장고 재료 조회
-        fridge_ingredients = fridge.get_normalized_ingredients()
-
-        # 냉장고가 비어있으면 빈 리스트 반환
-        if not fridge_ingredients.exists():
-            return []
-
         # 레시피 QuerySet 시작
-        recipes_queryset = Recipe.objects.prefetch_related(
-            'ingredients__normalized_ingredient'
-        ).all()
+        recipes_queryset = Recipe.objects.all()
 
-        # 난이도 필터 적용
+        # 난이도 필터 적용 (해석된 난이도 단계, 알 수 없는 난이도는 원본 문자열 비교)
         if difficulty:
-            recipes_queryset = recipes_queryset.filter(difficulty=difficulty)
+            difficulty_level = parse_difficulty_level(difficulty)
+            if difficulty_level is not None:
+                recipes_queryset = recipes_queryset.filter(difficulty_level=difficulty_level)
+            else:
+                recipes_queryset = recipes_queryset.filter(difficulty=difficulty)
 
-        # 조리 시간 필터 적용
+        # 조리 시간 필터 적용 (분 단위 숫자 범위)
         if max_time is not None:
-            recipes_queryset = recipes_queryset.filter(
-                cooking_time__lte=str(max_time)
+            recipes_queryset = recipes_queryset.filter(cooking_minutes__lte=max_time)
+
+        # 필터링된 레시피에 대해 매칭 점수 계산 (최소 점수 30)
+        return self._recommend(fridge, limit, 30, recipes_queryset)
+
+    def _recommend(
+        self,
+        fridge,
+        limit: int,
+        min_score: float,
+        recipes_queryset=None
+    ) -> List[Dict[str, Any]]:
+        """
+        일괄 추천
+
+        min_score > 0이면 냉장고별 매칭 수 벡터로 매칭 재료가 있는 레시피만 점수 계산
+        (쿼리: 냉장고 재료, [필터], 상위 레시피, 상위 레시피의 부족한 재료)
+        min_score <= 0이면 매칭 0개 레시피도 포함되므로 전체 레시피 재료 행으로 계산
+        부족한 재료는 반환할 상위 limit개 레시피만 조회
+
+        Args:
+            recipes_queryset: 추천 대상 레시피 필터 (None이면 전체)
+
+        Returns:
+            recommend_recipes와 같은 구조의 추천 목록
+        """
+        # 냉장고 재료 ID 집합 (1회 조회)
+        fridge_ingredient_ids = set(fridge.get_normalized_ingredients().values_list('id', flat=True))
+
+        # 냉장고가 비어있으면 빈 리스트 반환
+        if not fridge_ingredient_ids:
+            return []
+
+        if min_score > 0:
+            scored = self._score_from_fridge_vector(fridge, fridge_ingredient_ids, min_score, recipes_queryset)
+        else:
+            scored = self._score_all_recipes(
+                recipes_queryset if recipes_queryset is not None else Recipe.objects.all(),
+                fridge_ingredient_ids, min_score
             )
+        scored = scored[:limit]
+
+        top_ids = [recipe_id for recipe_id, _ in scored]
+        recipes_by_id = Recipe.objects.in_bulk(top_ids)
+        missing_by_recipe = self._missing_ingredients_by_recipe(top_ids, fridge_ingredient_ids)
 
-        # 필터링된 레시피에 대해 매칭 점수 계산
         recommendations = []
-        for recipe in recipes_queryset:
-            score = self.calculate_match_score(recipe, fridge_ingredients)
-
-            # 최소 점수 30 이상인 레시피만 포함
-            if score >= 30:
-                missing_ingredients = self.get_missing_ingredients(recipe, fridge_ingredients)
-
-                recommendations.append({
-                    'recipe': recipe,
-                    'score': score,
-                    'missing_ingredients': missing_ingredients,
-                    'missing_count': len(missing_ingredients)
-                })
+        for recipe_id, score in scored:
+            recipe = recipes_by_id.get(recipe_id)
+            if recipe is None:
+                continue
+            missing_ingredients = missing_by_recipe.get(recipe_id, [])
+            recommendations.append({
+                'recipe': recipe,
+                'score': score,
+                'missing_ingredients': missing_ingredients,
+                'missing_count': len(missing_ingredients)
+            })
+
+        return recommendations
+
+    def _score_from_fridge_vector(
+        self,
+        fridge,
+        fridge_ingredient_ids: Set[int],
+        min_score: float,
+        recipes_queryset=None
+    ) -> List[Tuple[int, float]]:
+        """
+        냉장고별 매칭 수 벡터로 점수 계산 (_score_rows와 동일 공식, 벡터 연산)
+
+        Returns:
+            점수 역순 (동점은 레시피 기본 정렬 순서) [(recipe_id, score), ...]
+        """
+        vector = get_fridge_scores(fridge.id, fridge_ingredient_ids)
+        index, rows = vector.index, vector.rows
+        essential_matched, seasoning_matched = vector.essential_matched, vector.seasoning_matched
+
+        # 필터가 있으면 조건에 맞는 레시피(숫자 컬럼 범위 조회)로 후보를 먼저 좁힌 뒤 점수 계산
+        if recipes_queryset is not None:
+            allowed = np.fromiter(recipes_queryset.values_list('id', flat=True), dtype=np.int64)
+            keep = np.isin(index.recipe_ids[rows], allowed)
+            rows = rows[keep]
+            essential_matched, seasoning_matched = essential_matched[keep], seasoning_matched[keep]
+
+        essential_totals = index.essential_row_counts[rows]
+        seasoning_totals = index.seasoning_row_counts[rows]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            base_scores = (essential_matched / essential_totals) * 100
+            seasoning_bonus = np.minimum((seasoning_matched / seasoning_totals) * 5, 5)
+        seasoning_bonus = np.where(seasoning_totals > 0, seasoning_bonus, 0.0)
+        scores = np.where(essential_totals > 0, base_scores + seasoning_bonus, 0.0)
+
+        passed = scores >= min_score
+        rows, scores = rows[passed], scores[passed]
+        order = np.lexsort((rows, -scores))
+        return list(zip(index.recipe_ids[rows[order]].tolist(), scores[order].tolist()))
+
+    def _score_all_recipes(
+        self,
+        recipes_queryset,
+        fridge_ingredient_ids: Set[int],
+        min_score: float
+    ) -> List[Tuple[int, float]]:
+        """
+        레시피 QuerySet 전체의 재료 행으로 점수 계산 (쿼리 2회)
+
+        Returns:
+            점수 역순 [(recipe_id, score), ...]
+        """
+        # 레시피별 재료 행 (normalized_ingredient_id, is_common_seasoning)
+        recipe_ids = list(recipes_queryset.values_list('id', flat=True))
+        rows_by_recipe = defaultdict(list)
+        ingredient_rows = (
+            Ingredient.objects
+            .filter(recipe_id__in=recipes_queryset.values('id'))
+            .order_by()
+            .values_list('recipe_id', 'normalized_ingredient_id', 'normalized_ingredient__is_common_seasoning')
+            .iterator(chunk_size=10000)
+        )
+        for recipe_id, normalized_id, is_seasoning in ingredient_rows:
+            rows_by_recipe[recipe_id].append((normalized_id, bool(is_seasoning)))
+
+        # 최소 점수 이상인 레시피만 포함
+        scored = []
+        for recipe_id in recipe_ids:
+            score = self._score_rows(rows_by_recipe.get(recipe_id, ()), fridge_ingredient_ids)
+            if score >= min_score:
+                scored.append((recipe_id, score))
 
         # 점수 역순 정렬
-        recommendations.sort(key=lambda x: x['score'], reverse=True)
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored
+
+    def _missing_ingredients_by_recipe(
+        self,
+        recipe_ids: List[int],
+        fridge_ingredient_ids: Set[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        여러 레시피의 부족한 필수 재료 목록 (get_missing_ingredients와 동일 구조/순서, 1회 조회)
+        """
+        if not recipe_ids:
+            return {}
+
+        recipe_ingredients = (
+            Ingredient.objects
+            .exclude_seasonings()
+            .select_related('normalized_ingredient__category')
+            .filter(recipe_id__in=recipe_ids, normalized_ingredient__isnull=False)
+        )
+
+        missing_by_recipe = defaultdict(list)
+        for ing in recipe_ingredients:
+            if ing.normalized_ingredient_id not in fridge_ingredient_ids:
+                missing_by_recipe[ing.recipe_id].append({
+                    'id': ing.normalized_ingredient.id,
+                    'name': ing.normalized_ingredient.name,
+                    'original_name': ing.original_name,
+                    'category': ing.normalized_ingredient.category
+                })
 
-        # 상위 limit개 반환
-        return recommendations[:limit]
+        return missing_by_recipe
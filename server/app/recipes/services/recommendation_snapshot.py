@@ -0,0 +1,74 @@
+"""
+추천 결과 커서 페이지네이션
+
+커서에는 요청 조건(데이터 버전, 정렬된 정규화 재료 ID, 옵션)과 다음 페이지 위치를 담고,
+순위가 매겨진 결과(스냅샷)는 공유 캐시에 TTL과 함께 저장
+→ 두 번째 페이지부터는 점수 재계산 없이 스냅샷을 잘라서 응답 (O(페이지 크기))
+"""
+
+import base64
+import hashlib
+import json
+from typing import Dict, List, NamedTuple, Optional
+from django.conf import settings
+from django.core.cache import cache
+from .recipe_index import MatchResult, normalize_facets
+
+SNAPSHOT_CACHE_KEY_PREFIX = 'recipes:recommendation_snapshot:'
+
+
+class CursorState(NamedTuple):
+    """커서에 담긴 추천 조건과 다음 페이지 시작 위치"""
+    version: str
+    ingredient_ids: List[int]
+    algorithm: str
+    exclude_seasonings: bool
+    min_match_rate: float
+    exact_total: bool
+    offset: int
+    facets: Optional[Dict[str, List[str]]] = None  # 패싯 필드 → 허용 값 (정렬된 목록)
+
+    def snapshot_key(self) -> str:
+        """같은 조건(위치 제외)이면 같은 스냅샷 캐시 키"""
+        conditions = json.dumps(list(self._replace(offset=0)), separators=(',', ':'), sort_keys=True)
+        return SNAPSHOT_CACHE_KEY_PREFIX + hashlib.sha1(conditions.encode()).hexdigest()
+
+
+def get_snapshot_max_results() -> int:
+    """스냅샷에 저장할 최대 순위 개수"""
+    return getattr(settings, 'RECOMMENDATION_SNAPSHOT_MAX_RESULTS', 1000)
+
+
+def encode_cursor(state: CursorState) -> str:
+    """커서 상태 → URL-safe 불투명 문자열"""
+    payload = json.dumps(list(state), separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> CursorState:
+    """
+    불투명 문자열 → 커서 상태
+
+    Raises:
+        ValueError: 형식이 잘못된 커서 (FACET_FIELDS에 없는 패싯 필드 포함)
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        version, ids, algorithm, exclude_seasonings, min_match_rate, exact_total, offset, *rest = json.loads(payload)
+        facets = normalize_facets(rest[0]) if rest else None
+        return CursorState(
+            str(version), [int(i) for i in ids], str(algorithm), bool(exclude_seasonings),
+            float(min_match_rate), bool(exact_total), max(0, int(offset)), facets
+        )
+    except (TypeError, ValueError, AttributeError, UnicodeDecodeError) as exc:
+        raise ValueError('invalid cursor') from exc
+
+
+def load_snapshot(state: CursorState) -> Optional[MatchResult]:
+    """스냅샷 조회 (만료되었으면 None)"""
+    return cache.get(state.snapshot_key())
+
+
+def save_snapshot(state: CursorState, result: MatchResult):
+    """스냅샷 저장 (RECOMMENDATION_SNAPSHOT_TTL초 후 만료)"""
+    cache.set(state.snapshot_key(), result, timeout=getattr(settings, 'RECOMMENDATION_SNAPSHOT_TTL', 600))
@@ -0,0 +1,94 @@
+"""
+레시피 추천 결과 캐시
+
+같은 재료 조합/옵션의 추천 요청이 반복되므로 응답을 프로세스별 LRU 캐시에 저장
+키에 데이터 버전을 포함하여 레시피/재료가 바뀌면 이전 결과는 사용되지 않음
+(이전 버전 항목은 LRU로 자연스럽게 제거)
+추천 설정은 설정으로 정해진 옵션 값(limit, 알고리즘, 최소 점수 등)이 키에 들어가므로
+설정이 바뀌어도 결과가 같은 요청은 그대로 적중
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+from django.conf import settings
+from .data_version import get_data_version
+
+
+class RecommendationCache:
+    """
+    추천 결과 LRU 캐시 (프로세스별, 스레드 안전)
+
+    max_entries가 0 이하이면 캐시 비활성화
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        endpoint: str,
+        ingredient_ids: Iterable[int],
+        *options: Hashable,
+        version: Optional[str] = None
+    ) -> tuple:
+        """
+        캐시 키 생성: (데이터 버전, 엔드포인트, 정렬된 정규화 재료 ID, 옵션...)
+
+        재료 입력 순서/중복과 무관하게 같은 재료 조합은 같은 키
+        version을 지정하지 않으면 현재 데이터 버전 조회 (응답의 다른 곳에도 버전을 쓰면 한 번 조회해서 전달)
+        """
+        if version is None:
+            version = get_data_version()
+        return (version, endpoint, tuple(sorted(set(ingredient_ids)))) + options
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+        if self.max_entries <= 0:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        """캐시 저장 (최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """전체 항목 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 (적중률은 조회가 없으면 0.0)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+recommendation_cache = RecommendationCache(getattr(settings, 'RECOMMENDATION_CACHE_MAX_ENTRIES', 1024))
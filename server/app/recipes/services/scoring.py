@@ -0,0 +1,197 @@
+"""
+레시피 추천 점수 알고리즘 레지스트리
+
+모든 알고리즘은 추천 인덱스에 미리 계산된 레시피별 통계
+(재료 수, L2 norm, 조미료 수)와 요청별 매칭 수만으로 점수를 계산
+→ 알고리즘과 무관하게 후보 수에 비례하는 비용
+
+DB 집계 모드(RecommendationSettings.scoring_mode='database')에서는
+같은 통계를 SQL 식으로 받아 expression()으로 점수 식을 생성
+
+새 알고리즘 추가:
+    @register_scorer
+    class MyScorer(Scorer):
+        name = 'my_algorithm'
+        label = '설명'
+
+        def score(self, inputs):
+            return ...
+
+        def expression(self, stats):  # DB 집계 모드 지원 시
+            return ...
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+import math
+import numpy as np
+from django.db.models import Case, Expression, FloatField, Value, When
+from django.db.models.functions import Coalesce, NullIf, Sqrt
+from django.db.models.lookups import GreaterThan
+
+
+@dataclass
+class ScoreInputs:
+    """
+    후보 레시피별 점수 계산 입력 (모든 배열은 후보 순서와 동일)
+
+    matched/totals/norms는 요청의 exclude_seasonings 기준 값
+    essential_matched/seasoning_matched는 uses_seasonings=True인 알고리즘에만 제공
+    """
+    matched: np.ndarray  # 매칭된 재료 수
+    totals: np.ndarray  # 레시피 재료 수
+    norms: np.ndarray  # 레시피 재료 벡터 L2 norm (√재료 수)
+    essential_matched: Optional[np.ndarray]  # 매칭된 필수(비조미료) 재료 수
+    essential_totals: np.ndarray  # 필수(비조미료) 재료 수
+    seasoning_matched: Optional[np.ndarray]  # 매칭된 조미료 수
+    seasoning_totals: np.ndarray  # 조미료 수
+    user_size: Union[int, np.ndarray]  # 사용자 재료 수 (일괄 계산 시 후보별 배열)
+
+
+@dataclass
+class SqlScoreInputs:
+    """
+    DB 집계 모드의 점수 계산 입력 (레시피별 GROUP BY 집계 식, float)
+
+    essential_*/seasoning_*은 uses_seasonings=True인 알고리즘에만 제공
+    """
+    matched: Expression
+    totals: Expression
+    essential_matched: Optional[Expression]
+    essential_totals: Optional[Expression]
+    seasoning_matched: Optional[Expression]
+    seasoning_totals: Optional[Expression]
+    user_size: int
+
+
+def _sql_ratio(numerator: Expression, denominator: Expression) -> Expression:
+    """0으로 나누는 경우 NULL을 반환하는 SQL 나눗셈"""
+    return numerator / NullIf(denominator, Value(0.0))
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """0으로 나누는 경우 0을 반환하는 나눗셈"""
+    numerator = numerator.astype(np.float64)
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator > 0)
+
+
+class Scorer:
+    """점수 알고리즘 베이스 클래스"""
+
+    name = ''
+    label = ''
+    # 조미료 매칭 수(seasoning_matched)가 필요한지 여부
+    uses_seasonings = False
+    # 레시피 재료 수가 같을 때 점수가 매칭 수에 대해 단조 증가하는지 여부
+    # (True이면 점수 상한으로 상위 k개 후보를 가지치기할 수 있음)
+    monotone = False
+
+    def score(self, inputs: ScoreInputs) -> np.ndarray:
+        """후보별 점수 배열 반환"""
+        raise NotImplementedError
+
+    def expression(self, stats: SqlScoreInputs) -> Expression:
+        """
+        DB 집계 모드용 점수 SQL 식
+
+        Raises:
+            NotImplementedError: DB 집계 모드를 지원하지 않는 알고리즘
+        """
+        raise NotImplementedError
+
+
+SCORERS: Dict[str, Scorer] = {}
+
+
+def register_scorer(cls):
+    """점수 알고리즘 등록 데코레이터"""
+    SCORERS[cls.name] = cls()
+    return cls
+
+
+def get_scorer(name: str) -> Scorer:
+    """
+    이름으로 점수 알고리즘 조회
+
+    Raises:
+        KeyError: 등록되지 않은 알고리즘
+    """
+    return SCORERS[name]
+
+
+@register_scorer
+class CoverageScorer(Scorer):
+    """레시피 기준 매칭률: 보유 재료 수 / 레시피 전체 재료 수"""
+
+    name = 'coverage'
+    label = '레시피 기준 매칭률'
+    monotone = True
+
+    def score(self, inputs):
+        return _ratio(inputs.matched, inputs.totals)
+
+    def expression(self, stats):
+        return _sql_ratio(stats.matched, stats.totals)
+
+
+@register_scorer
+class JaccardScorer(Scorer):
+    """Jaccard: |A ∩ B| / |A ∪ B|"""
+
+    name = 'jaccard'
+    label = 'Jaccard 유사도'
+    monotone = True
+
+    def score(self, inputs):
+        union = inputs.totals + inputs.user_size - inputs.matched
+        return _ratio(inputs.matched, union)
+
+    def expression(self, stats):
+        union = stats.totals + Value(float(stats.user_size)) - stats.matched
+        return _sql_ratio(stats.matched, union)
+
+
+@register_scorer
+class CosineScorer(Scorer):
+    """Cosine: |A ∩ B| / (‖A‖ × ‖B‖)"""
+
+    name = 'cosine'
+    label = 'Cosine 유사도'
+    monotone = True
+
+    def score(self, inputs):
+        return _ratio(inputs.matched, inputs.norms * np.sqrt(inputs.user_size))
+
+    def expression(self, stats):
+        return _sql_ratio(stats.matched, Sqrt(stats.totals) * Value(math.sqrt(stats.user_size)))
+
+
+@register_scorer
+class SeasoningBonusScorer(Scorer):
+    """
+    필수 재료 매칭률 + 조미료 보너스 (RecommendationService와 동일 공식)
+
+    점수 = 필수 재료 매칭률 + 조미료 매칭률 × 0.05 (0.0 ~ 1.05)
+    """
+
+    name = 'seasoning_bonus'
+    label = '필수 재료 매칭률 + 조미료 보너스'
+    uses_seasonings = True
+    max_bonus = 0.05
+
+    def score(self, inputs):
+        base = _ratio(inputs.essential_matched, inputs.essential_totals)
+        bonus = _ratio(inputs.seasoning_matched, inputs.seasoning_totals) * self.max_bonus
+        return np.where(inputs.essential_totals > 0, base + bonus, 0.0)
+
+    def expression(self, stats):
+        base = _sql_ratio(stats.essential_matched, stats.essential_totals)
+        bonus = Coalesce(
+            _sql_ratio(stats.seasoning_matched, stats.seasoning_totals),
+            Value(0.0)
+        ) * Value(self.max_bonus)
+        return Case(
+            When(GreaterThan(stats.essential_totals, Value(0.0)), then=base + bonus),
+            default=Value(0.0),
+            output_field=FloatField()
+        )
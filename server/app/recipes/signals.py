@@ -0,0 +1,71 @@
+"""
+레시피 데이터 변경 시그널
+
+레시피/재료/정규화 재료/재료 별칭/재료 카테고리가 변경되면 데이터 버전을 갱신하여
+인메모리 추천 인덱스가 다음 요청에서 재구축되고 추천 결과 캐시가 무효화되도록 하고,
+레시피 재료 시그니처(Recipe.ingredient_signature)를 다시 계산
+추천 설정은 레시피 데이터가 아니므로 버전을 갱신하지 않음
+(설정으로 정해진 옵션 값이 추천 결과 캐시 키에 들어가므로 설정 변경은 다른 키로 반영)
+
+주의: QuerySet.update() / bulk_create()는 시그널을 발생시키지 않으므로
+호출하는 쪽에서 bump_data_version() / refresh_recipe_signatures()를 직접 호출해야 함
+"""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from .models import Recipe, Ingredient, NormalizedIngredient, IngredientAlias, IngredientCategory
+from .services.data_version import bump_data_version
+from .services.recipe_signature import refresh_recipe_signatures, refresh_signatures_containing
+
+
+@receiver(post_save, sender=Recipe)
+@receiver(post_delete, sender=Recipe)
+@receiver(post_save, sender=Ingredient)
+@receiver(post_delete, sender=Ingredient)
+@receiver(post_save, sender=NormalizedIngredient)
+@receiver(post_delete, sender=NormalizedIngredient)
+@receiver(post_save, sender=IngredientAlias)
+@receiver(post_delete, sender=IngredientAlias)
+@receiver(post_save, sender=IngredientCategory)
+@receiver(post_delete, sender=IngredientCategory)
+def on_recipe_data_changed(sender, **kwargs):
+    """레시피 데이터 변경 시 데이터 버전 갱신"""
+    bump_data_version()
+
+
+@receiver(post_save, sender=Ingredient)
+@receiver(post_delete, sender=Ingredient)
+def on_ingredient_changed(sender, instance, raw=False, **kwargs):
+    """재료 추가/수정/삭제 시 해당 레시피의 시그니처 재계산"""
+    if raw:
+        return
+    refresh_recipe_signatures([instance.recipe_id])
+
+
+@receiver(pre_save, sender=NormalizedIngredient)
+def remember_seasoning_flag(sender, instance, raw=False, **kwargs):
+    """범용 조미료 여부 변경 감지를 위해 저장 전 값 기록"""
+    if raw or instance.pk is None:
+        instance._previous_is_common_seasoning = None
+        return
+    instance._previous_is_common_seasoning = (
+        NormalizedIngredient.objects
+        .filter(pk=instance.pk)
+        .values_list('is_common_seasoning', flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=NormalizedIngredient)
+def on_seasoning_flag_changed(sender, instance, created, raw=False, **kwargs):
+    """범용 조미료 여부가 바뀌면 해당 재료를 쓰는 레시피의 시그니처 재계산"""
+    previous = getattr(instance, '_previous_is_common_seasoning', None)
+    if raw or created or previous is None or previous == instance.is_common_seasoning:
+        return
+    refresh_signatures_containing([instance.pk])
+
+
+@receiver(post_delete, sender=NormalizedIngredient)
+def on_normalized_ingredient_deleted(sender, instance, **kwargs):
+    """정규화 재료 삭제(병합 포함) 시 해당 재료를 쓰던 레시피의 시그니처 재계산"""
+    refresh_signatures_containing([instance.pk])
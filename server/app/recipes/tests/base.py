@@ -2,10 +2,13 @@
 테스트용 공통 베이스 클래스
 """
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from recipes.models import IngredientCategory
 
 
+# 같은 프로세스의 데이터 변경은 즉시 반영되므로 데이터 버전 재확인(공유 캐시 조회)을 하지 않음
+# (쿼리 수 검증이 테스트 실행 시간에 좌우되지 않도록)
+@override_settings(DATA_VERSION_CHECK_INTERVAL=3600)
 class CategoryTestCase(TestCase):
     """카테고리를 자동으로 생성하는 테스트 베이스 클래스"""
 
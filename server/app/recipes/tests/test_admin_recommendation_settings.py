@@ -23,7 +23,7 @@ class AdminRecommendationSettingsTest(TestCase):
         # 기본값 검증
         settings = RecommendationSettings.objects.get(pk=1)
         self.assertEqual(settings.min_match_rate, 0.3)
-        self.assertEqual(settings.default_algorithm, 'jaccard')
+        self.assertEqual(settings.default_algorithm, 'coverage')
         self.assertEqual(settings.default_limit, 20)
         self.assertTrue(settings.exclude_seasonings_default)
 
@@ -27,7 +27,11 @@ class AlgorithmExplanationTest(TestCase):
         # 한글 설명 포함 확인
         self.assertIn('자카드', jaccard_choice[1])
         self.assertIn('교집합', jaccard_choice[1])
-        self.assertIn('권장', jaccard_choice[1])
+        self.assertNotIn('권장', jaccard_choice[1])
+
+        # 권장 알고리즘은 coverage (기본값)
+        coverage_choice = next(c for c in choices if c[0] == 'coverage')
+        self.assertIn('권장', coverage_choice[1])
 
     def test_cosine_algorithm_choice_description(self):
         """
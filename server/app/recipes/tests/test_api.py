@@ -2,7 +2,7 @@
 레시피 검색 API 테스트
 """
 
-from django.test import Client
+from django.test import Client, override_settings
 from recipes.models import Recipe, Ingredient, NormalizedIngredient
 from .base import CategoryTestCase
 import json
@@ -188,6 +188,38 @@ class RecipeSearchAPITest(CategoryTestCase):
         if len(recipes) > 1:
             self.assertGreaterEqual(recipes[0]['match_rate'], recipes[1]['match_rate'])
 
+    def test_recommend_batch(self):
+        """여러 재료 조합 일괄 추천은 조합별 /recommend 결과와 동일"""
+        ingredient_sets = [['돼지고기', '배추'], ['두부'], ['없는재료'], []]
+        response = self.client.post(
+            '/fridge2fork/v1/recipes/recommend/batch',
+            data=json.dumps({'ingredient_sets': ingredient_sets, 'exclude_seasonings': True}),
+            content_type='application/json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(len(results), len(ingredient_sets))
+        for ingredients, result in zip(ingredient_sets, results):
+            single = self.client.post(
+                '/fridge2fork/v1/recipes/recommend',
+                data=json.dumps({'ingredients': ingredients, 'exclude_seasonings': True}),
+                content_type='application/json'
+            ).json()
+            self.assertEqual(result, single)
+        self.assertGreater(len(results[0]['recipes']), 0)
+
+    @override_settings(RECOMMENDATION_BATCH_MAX_SETS=2)
+    def test_recommend_batch_too_many_sets(self):
+        """최대 조합 수 초과 시 400"""
+        response = self.client.post(
+            '/fridge2fork/v1/recipes/recommend/batch',
+            data=json.dumps({'ingredient_sets': [['돼지고기']] * 3}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'TooManyIngredientSets')
+
     def test_ingredient_autocomplete(self):
         """재료 자동완성 테스트"""
         response = self.client.get('/fridge2fork/v1/recipes/ingredients/autocomplete', {'q': '돼지'})
@@ -0,0 +1,67 @@
+"""
+벤치마크 합성 카탈로그/실행기 테스트
+"""
+
+from django.test import TestCase, override_settings
+from recipes.benchmark import CatalogSpec, ENDPOINTS, catalog_exists, generate_catalog, run_benchmarks
+from recipes.benchmark.catalog import ingredient_names, recipe_ingredient_ranks
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+
+
+class SyntheticCatalogTest(TestCase):
+    """합성 카탈로그 생성 테스트"""
+
+    spec = CatalogSpec(recipes=120, seed=7)
+
+    def test_deterministic(self):
+        """같은 seed이면 같은 재료명/레시피 구성"""
+        self.assertEqual(ingredient_names(self.spec), ingredient_names(self.spec))
+        self.assertEqual(list(recipe_ingredient_ranks(self.spec)), list(recipe_ingredient_ranks(self.spec)))
+        self.assertNotEqual(
+            list(recipe_ingredient_ranks(self.spec)),
+            list(recipe_ingredient_ranks(self.spec._replace(seed=8)))
+        )
+
+    def test_frequency_skew(self):
+        """빈도 상위 재료가 하위 재료보다 훨씬 많이 사용됨"""
+        usage = [0] * self.spec.ingredients
+        for batch in recipe_ingredient_ranks(self.spec):
+            for _, ranks in batch:
+                self.assertEqual(len(ranks), len(set(ranks)))
+                for rank in ranks:
+                    usage[rank] += 1
+        self.assertGreater(sum(usage[:10]), sum(usage[-250:]))
+
+    def test_generate_catalog(self):
+        """DB 생성 후 시그니처/조미료/미정규화 재료 포함"""
+        stats = generate_catalog(self.spec)
+        self.assertTrue(catalog_exists(self.spec))
+        self.assertEqual(Recipe.objects.count(), 120)
+        self.assertEqual(Ingredient.objects.count(), stats['ingredient_rows'])
+        self.assertEqual(
+            NormalizedIngredient.objects.filter(is_common_seasoning=True).count(), stats['seasonings']
+        )
+        self.assertFalse(Recipe.objects.filter(ingredient_signature=[]).exists())
+
+
+@override_settings(DATA_VERSION_CHECK_INTERVAL=3600)
+class BenchmarkRunnerTest(TestCase):
+    """벤치마크 실행기 테스트"""
+
+    def test_report(self):
+        """모든 엔드포인트를 오류 없이 측정하고 보고서 생성"""
+        spec = CatalogSpec(recipes=60, seed=3)
+        generate_catalog(spec)
+        report = run_benchmarks(spec, requests=3)
+
+        self.assertEqual(report['catalog']['recipes'], 60)
+        self.assertEqual(list(report['endpoints']), list(ENDPOINTS))
+        for name, result in report['endpoints'].items():
+            self.assertEqual(result['errors'], 0, name)
+            self.assertLessEqual(result['p50_ms'], result['p99_ms'])
+            if name == 'autocomplete':
+                # 인메모리 자동완성 인덱스 (구축 후 DB 조회 없음)
+                self.assertEqual(result['queries_max'], 0, name)
+            else:
+                self.assertGreater(result['queries_max'], 0, name)
+            self.assertGreater(result['peak_rss_mb'], 0)
@@ -0,0 +1,175 @@
+"""
+DB 집계 기반 추천 테스트
+"""
+
+from recipes.models import Recipe, Ingredient, NormalizedIngredient, RecommendationSettings
+from recipes.services import recipe_index
+from recipes.services.database_scoring import match_in_database
+from recipes.services.ingredient_usage import used_ingredient_ids
+from recipes.services.near_miss import find_near_misses, find_near_misses_in_database
+from recipes.services.recipe_index import get_recipe_index
+from recipes.services.result_cache import recommendation_cache
+from recipes.services.scoring import SCORERS
+from .base import CategoryTestCase
+
+
+class DatabaseScoringTest(CategoryTestCase):
+    """DB 집계 모드 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 준비"""
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.tofu = NormalizedIngredient.objects.create(name='두부', category=self.etc_norm_category)
+        self.salt = NormalizedIngredient.objects.create(
+            name='소금', category=self.seasoning_norm_category, is_common_seasoning=True
+        )
+        self.pepper = NormalizedIngredient.objects.create(
+            name='후추', category=self.seasoning_norm_category, is_common_seasoning=True
+        )
+
+        self._create_recipe('R001', '제육볶음', [self.pork, self.onion, self.salt], method='볶음')
+        self._create_recipe('R002', '두부조림', [self.tofu, self.salt, self.pepper], method='조림')
+        self._create_recipe('R003', '양파볶음', [self.onion, self.onion], method='볶음')
+        self._create_recipe('R004', '두부양파국', [self.tofu, self.onion], method='끓이기')
+        self._create_recipe('R005', '소금물', [self.salt])
+
+    def _create_recipe(self, recipe_sno, name, normalized_ingredients, **fields):
+        recipe = Recipe.objects.create(
+            recipe_sno=recipe_sno, name=name, title=name,
+            servings='2.0', difficulty='아무나', cooking_time='20.0', **fields
+        )
+        for normalized in normalized_ingredients:
+            Ingredient.objects.create(
+                recipe=recipe,
+                original_name=normalized.name,
+                normalized_name=normalized.name,
+                normalized_ingredient=normalized
+            )
+        return recipe
+
+    def _as_tuples(self, result):
+        """점수 부동소수 오차를 제거한 비교용 튜플"""
+        return [
+            (m.recipe_id, round(m.match_score, 9), m.matched_count, m.total_count)
+            for m in result.matches
+        ]
+
+    def test_equals_index(self):
+        """모든 알고리즘에서 인메모리 인덱스와 같은 결과"""
+        index = get_recipe_index()
+        cases = [
+            {self.pork.id},
+            {self.onion.id, self.salt.id},
+            {self.tofu.id, self.onion.id, self.salt.id, self.pepper.id},
+        ]
+        for algorithm in SCORERS:
+            for user_ids in cases:
+                for exclude_seasonings in (True, False):
+                    for min_match_rate in (0.0, 0.3, 1.0):
+                        for limit in (None, 2):
+                            args = (user_ids, exclude_seasonings, min_match_rate)
+                            expected = index.match(*args, limit=limit, algorithm=algorithm)
+                            result = match_in_database(*args, limit=limit, algorithm=algorithm)
+                            self.assertEqual(self._as_tuples(result), self._as_tuples(expected))
+                            self.assertEqual(result.total, expected.total)
+
+    def test_rank_by_score_only(self):
+        """매칭 수 2차 정렬 없이 점수만으로 정렬"""
+        args = ({self.onion.id, self.tofu.id}, True, 0.3)
+        expected = get_recipe_index().match(*args, rank_by_matched_count=False)
+        result = match_in_database(*args, rank_by_matched_count=False)
+        self.assertEqual(self._as_tuples(result), self._as_tuples(expected))
+
+    def test_facets_equal_index(self):
+        """패싯 필터/집계도 인메모리 인덱스와 같은 결과"""
+        index = get_recipe_index()
+        args = ({self.onion.id, self.tofu.id, self.salt.id}, False, 0.0)
+        for facets in (None, {'method': ['볶음']}, {'method': ['볶음', '끓이기'], 'difficulty': ['아무나']}):
+            expected = index.match(*args, facets=facets, count_facets=True)
+            result = match_in_database(*args, facets=facets, count_facets=True)
+            self.assertEqual(self._as_tuples(result), self._as_tuples(expected))
+            self.assertEqual(result.total, expected.total)
+            self.assertEqual(result.facet_counts, expected.facet_counts)
+            self.assertEqual(list(result.facet_counts['method']), list(expected.facet_counts['method']))
+
+    def test_near_misses_equal_index(self):
+        """부족한 재료 목록/장보기 목록이 인메모리 인덱스와 같은 결과"""
+        index = get_recipe_index()
+        for user_ids in ({self.onion.id}, {self.tofu.id}, {self.pork.id, self.tofu.id}):
+            for max_missing in (1, 2):
+                self.assertEqual(
+                    find_near_misses_in_database(user_ids, max_missing=max_missing),
+                    find_near_misses(index, user_ids, max_missing=max_missing)
+                )
+
+    def test_used_ids_equal_index(self):
+        """레시피에 쓰이는 재료 판별이 인메모리 인덱스와 같은 결과"""
+        unused = NormalizedIngredient.objects.create(name='당근', category=self.vegetable_category)
+        ids = [self.pork.id, self.salt.id, unused.id]
+        for exclude_seasonings in (True, False):
+            self.assertEqual(
+                used_ingredient_ids(ids, exclude_seasonings),
+                get_recipe_index().used_ids(ids, exclude_seasonings)
+            )
+
+    def test_no_user_ingredients(self):
+        """사용자 재료가 없으면 빈 결과"""
+        result = match_in_database(set(), True, 0.3)
+        self.assertEqual(result.matches, [])
+        self.assertEqual(result.total, 0)
+
+    def test_api_uses_database_mode(self):
+        """scoring_mode='database'이면 인메모리 인덱스를 구축하지 않음"""
+        settings = RecommendationSettings.get_settings()
+        settings.scoring_mode = 'database'
+        settings.save()
+        recipe_index._index = None
+
+        response = self.client.get('/fridge2fork/v1/recipes/recommendations', {
+            'ingredients': '두부,양파',
+            'algorithm': 'coverage',
+            'min_match_rate': 0.5,
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertIsNone(recipe_index._index)
+        self.assertEqual(data['total'], 4)
+        self.assertEqual(data['recipes'][0]['name'], '두부양파국')
+        self.assertEqual(data['recipes'][0]['match_score'], 1.0)
+
+    def test_all_endpoints_use_database_mode(self):
+        """scoring_mode='database'이면 모든 추천 엔드포인트가 인덱스 없이 인메모리 모드와 같은 응답"""
+        requests = [
+            ('post', '/fridge2fork/v1/recipes/recommend', {'ingredients': ['두부', '양파']}),
+            ('post', '/fridge2fork/v1/recipes/recommend/batch', {'ingredient_sets': [['두부'], ['양파', '소금']]}),
+            ('get', '/fridge2fork/v1/recipes/search', {'ingredients': '양파'}),
+            ('get', '/fridge2fork/v1/recipes/near-misses', {'ingredients': '양파'}),
+            ('get', '/fridge2fork/v1/recipes/recommendations', {
+                'ingredients': '두부,양파', 'min_match_rate': 0.3, 'method': '볶음,끓이기', 'facet_counts': True
+            }),
+        ]
+
+        def responses():
+            recommendation_cache.clear()
+            results = []
+            for method, url, payload in requests:
+                if method == 'post':
+                    response = self.client.post(url, payload, content_type='application/json')
+                else:
+                    response = self.client.get(url, payload)
+                self.assertEqual(response.status_code, 200, url)
+                results.append(response.json())
+            return results
+
+        settings = RecommendationSettings.get_settings()
+        settings.scoring_mode = 'database'
+        settings.save()
+        recipe_index._index = None
+        database_results = responses()
+        self.assertIsNone(recipe_index._index)
+
+        settings.scoring_mode = 'memory'
+        settings.save()
+        self.assertEqual(database_results, responses())
+        self.assertIsNotNone(recipe_index._index)
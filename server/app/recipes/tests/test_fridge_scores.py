@@ -0,0 +1,72 @@
+"""
+냉장고별 레시피 매칭 수 벡터 테스트
+"""
+
+from django.test import SimpleTestCase
+import numpy as np
+from recipes.services.recipe_index import RecipeIndex
+from recipes.services.fridge_scores import FridgeScores
+
+
+class FridgeScoresTest(SimpleTestCase):
+    """재료 추가/삭제 시 증분 갱신 테스트"""
+
+    def setUp(self):
+        """무작위 레시피 200개 (재료 1~10개, 같은 재료 중복 등록 포함, 재료 40종 중 0~7번은 조미료)"""
+        rng = np.random.default_rng(11)
+        rows = []
+        for recipe_id in range(1, 201):
+            for ingredient_id in rng.integers(0, 40, size=int(rng.integers(1, 11))):
+                rows.append((recipe_id, int(ingredient_id), ingredient_id < 8))
+        self.rows = rows
+        self.index = RecipeIndex('v1', list(range(1, 201)), rows)
+        self.rng = rng
+
+    def _recompute(self, ingredient_ids):
+        """행 목록에서 직접 계산한 레시피별 매칭 행 수 {recipe_id: (필수, 조미료)}"""
+        counts = {}
+        for recipe_id, ingredient_id, is_seasoning in self.rows:
+            if ingredient_id in ingredient_ids:
+                essential, seasoning = counts.get(recipe_id, (0, 0))
+                counts[recipe_id] = (essential, seasoning + 1) if is_seasoning else (essential + 1, seasoning)
+        return counts
+
+    def _as_dict(self, scores):
+        recipe_ids = self.index.recipe_ids[scores.rows]
+        return {
+            int(recipe_id): (int(essential), int(seasoning))
+            for recipe_id, essential, seasoning
+            in zip(recipe_ids, scores.essential_matched, scores.seasoning_matched)
+        }
+
+    def test_incremental_equals_recompute(self):
+        """추가/삭제를 반복해도 처음부터 계산한 결과와 동일"""
+        scores = FridgeScores(self.index)
+        current = set()
+        for _ in range(60):
+            ingredient_id = int(self.rng.integers(0, 42))
+            if ingredient_id in current:
+                scores.apply(removed=[ingredient_id])
+                current.discard(ingredient_id)
+            else:
+                scores.apply(added=[ingredient_id])
+                current.add(ingredient_id)
+            self.assertEqual(scores.ingredient_ids, current)
+            self.assertEqual(self._as_dict(scores), self._recompute(current))
+
+    def test_duplicate_and_unknown_changes_ignored(self):
+        """이미 반영된 재료 추가, 없는 재료 삭제는 무시"""
+        scores = FridgeScores(self.index)
+        scores.apply(added=[1, 2])
+        before = self._as_dict(scores)
+        scores.apply(added=[1], removed=[3])
+        self.assertEqual(self._as_dict(scores), before)
+
+        scores.apply(removed=[1, 2])
+        self.assertEqual(len(scores.rows), 0)
+
+    def test_row_totals(self):
+        """레시피별 필수/조미료 Ingredient 행 수"""
+        index = RecipeIndex('v1', [10], [(10, 1, False), (10, 1, False), (10, 2, True)], unnormalized_counts={10: 3})
+        self.assertEqual(list(index.essential_row_counts), [5])
+        self.assertEqual(list(index.seasoning_row_counts), [1])
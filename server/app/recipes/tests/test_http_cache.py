@@ -0,0 +1,88 @@
+"""
+카탈로그 API 조건부 요청 (ETag / 304) 테스트
+"""
+
+from unittest import mock
+from django.contrib import admin
+from django.test import Client, override_settings
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from .base import CategoryTestCase
+
+
+class CatalogConditionalGetTest(CategoryTestCase):
+    """카테고리/재료 목록/레시피 상세 ETag 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='김치찌개', title='김치찌개',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+
+    def _assert_not_modified(self, path, params=None):
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('"'))
+
+        with self.assertNumQueries(0):
+            cached = self.client.get(path, params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached.content, b'')
+        self.assertEqual(cached['ETag'], etag)
+        self.assertEqual(cached['Cache-Control'], response['Cache-Control'])
+        return etag
+
+    @override_settings(CATALOG_CACHE_MAX_AGE=120)
+    def test_categories(self):
+        etag = self._assert_not_modified(f'{self.url}/categories')
+        self.assertEqual(self.client.get(f'{self.url}/categories')['Cache-Control'], 'public, max-age=120')
+        self.assertNotEqual(
+            self.client.get(f'{self.url}/categories', {'category_type': 'ingredient'})['ETag'], etag
+        )
+
+    def test_ingredients(self):
+        etag = self._assert_not_modified(f'{self.url}/ingredients', {'limit': 10})
+        self.assertNotEqual(self.client.get(f'{self.url}/ingredients', {'limit': 20})['ETag'], etag)
+
+    def test_recipe_detail(self):
+        self._assert_not_modified(f'{self.url}/{self.recipe.id}')
+
+    def test_stale_or_weak_etag(self):
+        path = f'{self.url}/{self.recipe.id}'
+        etag = self.client.get(path)['ETag']
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH=f'"stale", W/{etag}').status_code, 304)
+        self.assertEqual(self.client.get(path, HTTP_IF_NONE_MATCH='*').status_code, 304)
+
+    def test_etag_changes_with_data(self):
+        path = f'{self.url}/{self.recipe.id}'
+        etag = self.client.get(path)['ETag']
+        self.recipe.introduction = '얼큰한 찌개'
+        self.recipe.save()
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['introduction'], '얼큰한 찌개')
+
+    def test_missing_recipe_has_no_etag(self):
+        response = self.client.get(f'{self.url}/999999')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_etag_changes_with_admin_bulk_action(self):
+        """QuerySet.update()를 쓰는 관리자 액션도 ETag 변경"""
+        Ingredient.objects.create(recipe=self.recipe, original_name='김치', normalized_name='김치')
+        path = f'{self.url}/{self.recipe.id}'
+        etag = self.client.get(path)['ETag']
+
+        model_admin = admin.site._registry[Ingredient]
+        with mock.patch.object(model_admin, 'message_user'):
+            model_admin.mark_as_optional(None, Ingredient.objects.filter(recipe=self.recipe))
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.json()['ingredients'][0]['is_essential'])
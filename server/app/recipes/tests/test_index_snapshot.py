@@ -0,0 +1,216 @@
+"""
+추천 인덱스 mmap 스냅샷 테스트
+"""
+
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+import numpy as np
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services import recipe_index
+from recipes.services.data_version import get_data_version
+from recipes.services.fridge_scores import FridgeScores
+from recipes.services.index_snapshot import read_snapshot_version
+from recipes.services.near_miss import find_near_misses
+from recipes.services.recipe_index import RecipeIndex, get_recipe_index, refresh_snapshot
+from .base import CategoryTestCase
+
+
+class SnapshotRoundTripTest(SimpleTestCase):
+    """저장 후 mmap 로드한 인덱스가 원본과 동일하게 동작"""
+
+    def setUp(self):
+        """무작위 레시피 200개 (재료 1~10개, 재료 40종 중 0~5번은 조미료)"""
+        rng = np.random.default_rng(13)
+        rows = []
+        for recipe_id in range(1, 201):
+            for ingredient_id in rng.integers(0, 40, size=int(rng.integers(1, 11))):
+                rows.append((recipe_id, int(ingredient_id), ingredient_id < 6))
+        names = {i: (f'재료{i}', '기타') for i in range(40)}
+        facets = {'recipe_type': [str(v) for v in rng.choice(['국/탕', '반찬', ''], size=200)]}
+        self.index = RecipeIndex('v1', list(range(1, 201)), rows, [50], {3: 2}, names, facets)
+        self.user_id_sets = [
+            set(int(i) for i in rng.choice(40, size=int(rng.integers(1, 15)), replace=False))
+            for _ in range(10)
+        ]
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'index.bin')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """배열/조미료/재료명 동일, 배열은 읽기 전용"""
+        self.index.save_snapshot(self.path)
+        self.assertEqual(read_snapshot_version(self.path), 'v1')
+        loaded = RecipeIndex.load_snapshot(self.path)
+
+        self.assertEqual(loaded.version, 'v1')
+        for name, (attr, key) in RecipeIndex.SNAPSHOT_ARRAYS.items():
+            original = getattr(self.index, attr) if key is None else getattr(self.index, attr)[key]
+            array = getattr(loaded, attr) if key is None else getattr(loaded, attr)[key]
+            np.testing.assert_array_equal(array, original, err_msg=name)
+            self.assertEqual(array.dtype, original.dtype, name)
+        self.assertFalse(loaded.posting_rows.flags.writeable)
+        self.assertEqual(loaded.seasoning_ids, self.index.seasoning_ids)
+        self.assertEqual(loaded.ingredient_names, self.index.ingredient_names)
+        self.assertEqual(loaded.facet_values, self.index.facet_values)
+        for field, bitmaps in self.index.facet_bitmaps.items():
+            np.testing.assert_array_equal(loaded.facet_bitmaps[field], bitmaps, err_msg=field)
+            np.testing.assert_array_equal(loaded.facet_codes[field], self.index.facet_codes[field], err_msg=field)
+
+    def test_same_results(self):
+        """매칭/일괄 매칭/가지치기/부족 재료/냉장고 벡터 결과 동일"""
+        self.index.save_snapshot(self.path)
+        loaded = RecipeIndex.load_snapshot(self.path)
+
+        for user_ids in self.user_id_sets:
+            for algorithm in ('coverage', 'jaccard', 'seasoning_bonus'):
+                for exact_total in (True, False):
+                    args = (user_ids, True, 0.3)
+                    kwargs = {'limit': 5, 'algorithm': algorithm, 'exact_total': exact_total}
+                    self.assertEqual(loaded.match(*args, **kwargs), self.index.match(*args, **kwargs))
+                    kwargs.update(facets={'recipe_type': ['국/탕']}, count_facets=True)
+                    self.assertEqual(loaded.match(*args, **kwargs), self.index.match(*args, **kwargs))
+            self.assertEqual(find_near_misses(loaded, user_ids), find_near_misses(self.index, user_ids))
+
+            original_scores, loaded_scores = FridgeScores(self.index), FridgeScores(loaded)
+            original_scores.apply(added=user_ids)
+            loaded_scores.apply(added=user_ids)
+            np.testing.assert_array_equal(loaded_scores.rows, original_scores.rows)
+            np.testing.assert_array_equal(loaded_scores.essential_matched, original_scores.essential_matched)
+
+        self.assertEqual(
+            loaded.match_batch(self.user_id_sets, False, 0.3, limit=5),
+            self.index.match_batch(self.user_id_sets, False, 0.3, limit=5)
+        )
+
+    def test_empty_index(self):
+        """빈 인덱스도 저장/로드 가능"""
+        RecipeIndex('v0', [], []).save_snapshot(self.path)
+        loaded = RecipeIndex.load_snapshot(self.path)
+        self.assertEqual(loaded.match({1}, True, 0.0, limit=10).matches, [])
+
+    def test_invalid_file(self):
+        """스냅샷 형식이 아니거나 없는 파일"""
+        with open(self.path, 'wb') as f:
+            f.write(b'not a snapshot')
+        self.assertIsNone(read_snapshot_version(self.path))
+        self.assertIsNone(read_snapshot_version(self.path + '.missing'))
+        with self.assertRaises(ValueError):
+            RecipeIndex.load_snapshot(self.path)
+
+
+class SnapshotHotSwapTest(CategoryTestCase):
+    """워커의 스냅샷 사용/교체 테스트"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'index.bin')
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='제육볶음', title='제육볶음',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        self._add_ingredient(self.recipe, self.pork)
+        recipe_index._index = None
+
+    def tearDown(self):
+        recipe_index._index = None
+        self.tmpdir.cleanup()
+
+    def _add_ingredient(self, recipe, normalized):
+        Ingredient.objects.create(
+            recipe=recipe, original_name=normalized.name,
+            normalized_name=normalized.name, normalized_ingredient=normalized
+        )
+
+    def test_uses_snapshot_of_current_version(self):
+        """스냅샷 버전이 현재 데이터 버전이면 mmap 스냅샷 사용, 바뀌면 새 스냅샷으로 교체"""
+        with override_settings(RECIPE_INDEX_SNAPSHOT_PATH=self.path, RECIPE_INDEX_SNAPSHOT_WAIT=0):
+            call_command('write_recipe_index_snapshot', stdout=StringIO())
+            index = get_recipe_index()
+            self.assertEqual(index.version, get_data_version())
+            self.assertFalse(index.recipe_ids.flags.writeable)
+            self.assertEqual([m.recipe_id for m in index.match({self.pork.id}, True, 0.5).matches], [self.recipe.id])
+
+            # 데이터 변경 → 스냅샷이 오래되었으므로 DB에서 구축
+            onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+            self._add_ingredient(self.recipe, onion)
+            rebuilt = get_recipe_index()
+            self.assertTrue(rebuilt.recipe_ids.flags.writeable)
+
+            # 새 스냅샷 생성 후 데이터 버전이 바뀌면 새 스냅샷으로 교체
+            Recipe.objects.create(
+                recipe_sno='R002', name='양파볶음', title='양파볶음',
+                servings='2.0', difficulty='아무나', cooking_time='10.0'
+            )
+            call_command('write_recipe_index_snapshot', stdout=StringIO())
+            swapped = get_recipe_index()
+            self.assertIsNot(swapped, rebuilt)
+            self.assertFalse(swapped.recipe_ids.flags.writeable)
+            self.assertEqual(len(swapped.recipe_ids), 2)
+
+    def test_builder_rewrites_stale_snapshot(self):
+        """--watch 빌더는 데이터 버전이 바뀌면 스냅샷을 다시 생성하고 워커는 새 스냅샷 사용"""
+        call_command('write_recipe_index_snapshot', path=self.path, stdout=StringIO())
+        self.assertIsNone(refresh_snapshot(self.path))
+
+        NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.assertNotEqual(read_snapshot_version(self.path), get_data_version())
+
+        with mock.patch(
+            'recipes.management.commands.write_recipe_index_snapshot.time.sleep',
+            side_effect=KeyboardInterrupt
+        ):
+            call_command('write_recipe_index_snapshot', path=self.path, watch=True, stdout=StringIO())
+        self.assertEqual(read_snapshot_version(self.path), get_data_version())
+
+        with override_settings(RECIPE_INDEX_SNAPSHOT_PATH=self.path):
+            index = get_recipe_index()
+        self.assertEqual(index.version, get_data_version())
+        self.assertFalse(index.recipe_ids.flags.writeable)
+
+    def test_swaps_to_snapshot_written_after_bump(self):
+        """버전이 바뀐 뒤 DB에서 구축한 인덱스는 빌더가 새 스냅샷을 쓰면 mmap 스냅샷으로 교체"""
+        with override_settings(
+            RECIPE_INDEX_SNAPSHOT_PATH=self.path, RECIPE_INDEX_SNAPSHOT_WAIT=0,
+            RECIPE_INDEX_SNAPSHOT_RECHECK_INTERVAL=0
+        ):
+            call_command('write_recipe_index_snapshot', stdout=StringIO())
+            self.assertTrue(get_recipe_index().from_snapshot)
+
+            NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+            built = get_recipe_index()
+            self.assertFalse(built.from_snapshot)
+            self.assertIs(get_recipe_index(), built)
+
+            call_command('write_recipe_index_snapshot', stdout=StringIO())
+            swapped = get_recipe_index()
+        self.assertTrue(swapped.from_snapshot)
+        self.assertFalse(swapped.recipe_ids.flags.writeable)
+        self.assertEqual(swapped.version, get_data_version())
+
+    def test_waits_for_builder_snapshot(self):
+        """버전이 바뀌면 DB에서 구축하지 않고 빌더의 새 스냅샷을 잠시 기다림"""
+        with override_settings(RECIPE_INDEX_SNAPSHOT_PATH=self.path, RECIPE_INDEX_SNAPSHOT_WAIT=3):
+            call_command('write_recipe_index_snapshot', stdout=StringIO())
+            NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+
+            def builder_writes(_):
+                call_command('write_recipe_index_snapshot', stdout=StringIO())
+
+            with mock.patch('recipes.services.recipe_index.time.sleep', side_effect=builder_writes), \
+                    mock.patch.object(RecipeIndex, 'build', wraps=RecipeIndex.build) as build:
+                index = get_recipe_index()
+        build.assert_called_once()  # 빌더(write_recipe_index_snapshot)의 구축만
+        self.assertTrue(index.from_snapshot)
+        self.assertEqual(index.version, get_data_version())
+
+    def test_without_snapshot_path(self):
+        """스냅샷 경로가 없으면 DB에서 구축"""
+        with override_settings(RECIPE_INDEX_SNAPSHOT_PATH=''):
+            self.assertTrue(get_recipe_index().recipe_ids.flags.writeable)
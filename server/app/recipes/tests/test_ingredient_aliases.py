@@ -0,0 +1,106 @@
+"""
+재료 별칭 테이블 테스트
+"""
+
+from django.test import Client
+from recipes.models import Recipe, Ingredient, IngredientAlias, NormalizedIngredient, FridgeIngredient
+from recipes.services.ingredient_aliases import alias_key, get_alias_table
+from .base import CategoryTestCase
+
+
+class IngredientAliasTestCase(CategoryTestCase):
+    """소고기/대파/계란 재료와 원본 재료명 연결"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        self.beef = NormalizedIngredient.objects.create(name='소고기', category=self.meat_category)
+        self.green_onion = NormalizedIngredient.objects.create(name='대파', category=self.vegetable_category)
+        self.egg = NormalizedIngredient.objects.create(name='계란', category=self.etc_norm_category)
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='소고기무국', title='소고기무국',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for original_name, normalized in (('쇠고기', self.beef), ('파', self.green_onion), ('계란물', self.egg)):
+            Ingredient.objects.create(
+                recipe=self.recipe, original_name=original_name,
+                normalized_name=normalized.name, normalized_ingredient=normalized
+            )
+
+
+class AliasTableTest(IngredientAliasTestCase):
+    """별칭 테이블 구축/조회 테스트"""
+
+    def test_alias_key(self):
+        self.assertEqual(alias_key('  Bacon   베이컨 '), 'bacon 베이컨')
+        self.assertEqual(alias_key(None), '')
+
+    def test_resolve_from_original_names(self):
+        table = get_alias_table()
+        self.assertEqual(table.resolve('쇠고기'), self.beef.id)
+        self.assertEqual(table.resolve(' 쇠고기 '), self.beef.id)
+        self.assertEqual(table.resolve('소고기'), self.beef.id)
+        self.assertIsNone(table.resolve('돼지고기'))
+        self.assertEqual(table.resolve_many(['파', '없는재료', '계란물']), {'파': self.green_onion.id, '계란물': self.egg.id})
+
+    def test_most_used_link_wins(self):
+        """한 원본명이 여러 재료에 연결되면 가장 많이 쓰인 재료"""
+        chive = NormalizedIngredient.objects.create(name='쪽파', category=self.vegetable_category)
+        for recipe_sno in ('R002', 'R003'):
+            recipe = Recipe.objects.create(
+                recipe_sno=recipe_sno, name='파전', title='파전',
+                servings='2.0', difficulty='아무나', cooking_time='20.0'
+            )
+            Ingredient.objects.create(
+                recipe=recipe, original_name='파', normalized_name='쪽파', normalized_ingredient=chive
+            )
+        self.assertEqual(get_alias_table().resolve('파'), chive.id)
+
+    def test_curated_alias_priority_and_refresh(self):
+        """관리자 별칭은 원본명 연결보다 우선, 정규화 재료명은 항상 자신, 변경 시 다시 구축"""
+        table = get_alias_table()
+        self.assertIs(get_alias_table(), table)
+
+        IngredientAlias.objects.create(alias='파', normalized_ingredient=self.egg)
+        IngredientAlias.objects.create(alias='대파', normalized_ingredient=self.egg)
+        table = get_alias_table()
+        self.assertEqual(table.resolve('파'), self.egg.id)
+        self.assertEqual(table.resolve('대파'), self.green_onion.id)
+
+        IngredientAlias.objects.filter(alias='파').delete()
+        IngredientAlias.objects.get(alias='대파').delete()
+        self.assertEqual(get_alias_table().resolve('파'), self.green_onion.id)
+
+
+class AliasResolutionApiTest(IngredientAliasTestCase):
+    """API에서 별칭 재료명 사용 테스트"""
+
+    def test_recommend_and_search(self):
+        names = ['쇠고기', '파', '계란물']
+        response = self.client.post(
+            f'{self.url}/recommend', data={'ingredients': names}, content_type='application/json'
+        )
+        self.assertEqual([recipe['recipe_sno'] for recipe in response.json()['recipes']], ['R001'])
+
+        response = self.client.get(f'{self.url}/recommendations', {'ingredients': ','.join(names)})
+        self.assertEqual(response.json()['total'], 1)
+
+        data = self.client.get(f'{self.url}/search', {'ingredients': '쇠고기,파'}).json()
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['matched_ingredients'], ['쇠고기', '파'])
+
+    def test_fridge_add_with_alias(self):
+        response = self.client.post(
+            f'{self.url}/fridge/ingredients', data={'ingredient_name': '쇠고기'},
+            content_type='application/json', HTTP_X_SESSION_ID='alias-session'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(FridgeIngredient.objects.values_list('normalized_ingredient_id', flat=True)), [self.beef.id]
+        )
+
+        response = self.client.post(
+            f'{self.url}/fridge/ingredients', data={'ingredient_name': '돼지고기'},
+            content_type='application/json', HTTP_X_SESSION_ID='alias-session'
+        )
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,95 @@
+"""
+재료 자동완성 인덱스 테스트
+"""
+
+import json
+from django.test import Client, SimpleTestCase
+from recipes.models import NormalizedIngredient
+from recipes.schemas import IngredientAutocompleteResponseSchema
+from recipes.services.ingredient_autocomplete import AutocompleteIndex, choseong, is_choseong_query
+from .base import CategoryTestCase
+
+NAMES = ['간장', '고추장', '다진 돼지고기', '닭고기', '돼지고기', '돼지고기 앞다리', '소고기', 'Bacon']
+
+
+def _index(names=NAMES):
+    names = sorted(names)
+    cards = [json.dumps({'name': name}).encode() for name in names]
+    return AutocompleteIndex('v1', names, cards)
+
+
+class ChoseongTest(SimpleTestCase):
+    """초성 변환 테스트"""
+
+    def test_choseong(self):
+        self.assertEqual(choseong('돼지고기'), 'ㄷㅈㄱㄱ')
+        self.assertEqual(choseong('까나리 액젓 2T'), 'ㄲㄴㄹ ㅇㅈ 2T')
+
+    def test_is_choseong_query(self):
+        self.assertTrue(is_choseong_query('ㄷㅈㄱㄱ'))
+        self.assertTrue(is_choseong_query('ㄷㅈ ㄱㄱ'))
+        self.assertFalse(is_choseong_query('돼ㅈ'))
+        self.assertFalse(is_choseong_query(' '))
+
+
+class AutocompleteIndexTest(SimpleTestCase):
+    """접두사/중간 일치/초성 검색 테스트"""
+
+    def setUp(self):
+        self.index = _index()
+
+    def _names(self, query, limit=10):
+        return [self.index.names[row] for row in self.index.search_rows(query, limit)]
+
+    def test_prefix_then_infix(self):
+        self.assertEqual(self._names('돼지'), ['돼지고기', '돼지고기 앞다리', '다진 돼지고기'])
+        self.assertEqual(self._names('고기'), ['다진 돼지고기', '닭고기', '돼지고기', '돼지고기 앞다리', '소고기'])
+        self.assertEqual(self._names('장'), ['간장', '고추장'])
+
+    def test_choseong(self):
+        self.assertEqual(self._names('ㄷㅈㄱㄱ'), ['돼지고기', '돼지고기 앞다리', '다진 돼지고기'])
+        self.assertEqual(self._names('ㄱㅊ'), ['고추장'])
+        self.assertEqual(self._names('ㅈ'), ['간장', '고추장', '다진 돼지고기', '돼지고기', '돼지고기 앞다리'])
+
+    def test_case_whitespace_and_limit(self):
+        self.assertEqual(self._names('bac'), ['Bacon'])
+        self.assertEqual(self._names('  돼지고기   앞 '), ['돼지고기 앞다리'])
+        self.assertEqual(self._names('고기', limit=2), ['다진 돼지고기', '닭고기'])
+        self.assertEqual(self._names(''), [])
+        self.assertEqual(self._names('없는재료'), [])
+
+    def test_suggest_returns_cards(self):
+        self.assertEqual([json.loads(card) for card in self.index.suggest('소')], [{'name': '소고기'}])
+
+
+class AutocompleteApiTest(CategoryTestCase):
+    """자동완성 API 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes/ingredients/autocomplete'
+        NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        NormalizedIngredient.objects.create(name='다진 돼지고기', category=self.meat_category)
+        NormalizedIngredient.objects.create(name='돼지감자')
+
+    def test_suggestions_without_queries(self):
+        """인덱스 구축 후에는 DB 조회 없음, 카테고리가 없으면 '기타'"""
+        self.client.get(self.url, {'q': '돼지'})
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'q': 'ㄷㅈ'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(IngredientAutocompleteResponseSchema.model_validate(data).dict(), data)
+        self.assertEqual(data['suggestions'], [
+            {'name': '다진 돼지고기', 'category': '육류', 'is_common_seasoning': False},
+            {'name': '돼지감자', 'category': '기타', 'is_common_seasoning': False},
+            {'name': '돼지고기', 'category': '육류', 'is_common_seasoning': False},
+        ])
+
+    def test_rebuilt_on_data_change(self):
+        self.assertEqual(self.client.get(self.url, {'q': '양'}).json()['suggestions'], [])
+        NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.assertEqual(
+            [suggestion['name'] for suggestion in self.client.get(self.url, {'q': '양'}).json()['suggestions']],
+            ['양파']
+        )
@@ -0,0 +1,96 @@
+"""
+재료명 유사도 매칭 테스트 (pg_trgm)
+"""
+
+from unittest import mock
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.ingredient_matching import similar_ingredients, trigram_available
+from .base import CategoryTestCase
+
+
+class IngredientMatchingTestCase(CategoryTestCase):
+    """돼지고기/돼지고기 앞다리/양파 재료와 레시피"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes/search'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.pork_leg = NormalizedIngredient.objects.create(name='돼지고기 앞다리', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        recipe = Recipe.objects.create(
+            recipe_sno='R001', name='제육볶음', title='제육볶음',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in (self.pork, self.onion):
+            Ingredient.objects.create(
+                recipe=recipe, original_name=normalized.name,
+                normalized_name=normalized.name, normalized_ingredient=normalized
+            )
+
+    def _search(self, ingredients, **params):
+        response = self.client.get(self.url, {'ingredients': ingredients, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+
+class TrigramMatchingTest(IngredientMatchingTestCase):
+    """pg_trgm 확장이 있는 DB에서의 유사도 매칭"""
+
+    def setUp(self):
+        if not trigram_available():
+            self.skipTest('pg_trgm 확장이 설치되지 않은 DB')
+        super().setUp()
+
+    def test_similar_ingredients_ranked(self):
+        """재료명별 후보를 유사도 내림차순으로, 유사도 조회 쿼리 1회"""
+        with CaptureQueriesContext(connection) as queries:
+            matches = similar_ingredients(['돼지 고기', '양퍼', '고추장'], threshold=0.2)
+        self.assertEqual(
+            len([query for query in queries if 'recipes_normalizedingredient' in query['sql']]), 1
+        )
+        self.assertEqual(matches['돼지 고기'][0][0], self.pork.id)
+        self.assertIn(self.pork_leg.id, [normalized_id for normalized_id, _ in matches['돼지 고기']])
+        self.assertEqual([score for _, score in matches['돼지 고기']],
+                         sorted((score for _, score in matches['돼지 고기']), reverse=True))
+        self.assertNotIn('고추장', matches)
+
+    def test_search_normalized_fuzzy(self):
+        ingredients = Ingredient.objects.search_normalized('돼지 고기', fuzzy=True)
+        self.assertEqual([ingredient.normalized_ingredient_id for ingredient in ingredients], [self.pork.id])
+        self.assertGreater(ingredients[0].similarity, 0.3)
+        self.assertFalse(Ingredient.objects.search_normalized('돼지 고기', fuzzy=True, threshold=1.0).exists())
+
+    def test_threshold_below_default(self):
+        """pg_trgm.similarity_threshold 기본값(0.3)보다 낮은 최솟값도 적용 ('양퍼'-'양파' 유사도 0.2)"""
+        self.assertEqual(similar_ingredients(['양퍼'], threshold=0.3), {})
+        matches = similar_ingredients(['양퍼'], threshold=0.1)
+        self.assertEqual([normalized_id for normalized_id, _ in matches['양퍼']], [self.onion.id])
+        self.assertLess(matches['양퍼'][0][1], 0.3)
+
+        ingredients = Ingredient.objects.search_normalized('양퍼', fuzzy=True, threshold=0.1)
+        self.assertEqual([ingredient.normalized_ingredient_id for ingredient in ingredients], [self.onion.id])
+
+    def test_search_api_fuzzy(self):
+        """오타/띄어쓰기가 다른 재료명도 레시피에 쓰이는 가장 유사한 재료로 검색"""
+        self.assertEqual(self._search('돼지 고기,양파')['total'], 0)
+        data = self._search('돼지 고기,양파', fuzzy=True)
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['matched_ingredients'], ['돼지 고기', '양파'])
+
+
+class TrigramFallbackTest(IngredientMatchingTestCase):
+    """pg_trgm 확장이 없으면 정확히 일치하는 재료만 검색"""
+
+    def test_without_extension(self):
+        with mock.patch('recipes.services.ingredient_matching.trigram_available', return_value=False):
+            self.assertEqual(similar_ingredients(['돼지 고기']), {})
+            self.assertFalse(Ingredient.objects.search_normalized('돼지 고기', fuzzy=True).exists())
+            ingredients = Ingredient.objects.search_normalized('돼지고기', fuzzy=True)
+            self.assertEqual([ingredient.normalized_ingredient_id for ingredient in ingredients], [self.pork.id])
+            self.assertEqual(ingredients[0].similarity, 1.0)
+            data = self._search('돼지 고기,양파', fuzzy=True)
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['matched_ingredients'], ['양파'])
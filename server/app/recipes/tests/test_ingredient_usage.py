@@ -0,0 +1,91 @@
+"""
+정규화 재료별 사용 레시피 수 테스트
+"""
+
+from django.test import Client
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.ingredient_usage import refresh_recipe_counts
+from .base import CategoryTestCase
+
+
+class RecipeCountTestCase(CategoryTestCase):
+    """돼지고기(레시피 2개)/돼지감자(1개)/돼지껍데기(0개)"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.potato = NormalizedIngredient.objects.create(name='돼지감자', category=self.vegetable_category)
+        self.skin = NormalizedIngredient.objects.create(name='돼지껍데기', category=self.meat_category)
+        self.stew = self._recipe('R001', [self.pork, self.pork, self.potato])
+        self.stir_fry = self._recipe('R002', [self.pork])
+
+    def _recipe(self, recipe_sno, ingredients):
+        recipe = Recipe.objects.create(
+            recipe_sno=recipe_sno, name=recipe_sno, title=recipe_sno,
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in ingredients:
+            Ingredient.objects.create(
+                recipe=recipe, original_name=normalized.name,
+                normalized_name=normalized.name, normalized_ingredient=normalized
+            )
+        return recipe
+
+    def _counts(self):
+        return dict(NormalizedIngredient.objects.values_list('name', 'recipe_count'))
+
+
+class RecipeCountMaintenanceTest(RecipeCountTestCase):
+    """재료/레시피 변경 시 사용 레시피 수 갱신 테스트"""
+
+    def test_counts_distinct_recipes(self):
+        self.assertEqual(self._counts(), {'돼지고기': 2, '돼지감자': 1, '돼지껍데기': 0})
+
+    def test_ingredient_relinked_and_deleted(self):
+        ingredient = self.stir_fry.ingredients.get()
+        ingredient.normalized_ingredient = self.skin
+        ingredient.save()
+        self.assertEqual(self._counts(), {'돼지고기': 1, '돼지감자': 1, '돼지껍데기': 1})
+
+        ingredient.delete()
+        self.assertEqual(self._counts(), {'돼지고기': 1, '돼지감자': 1, '돼지껍데기': 0})
+
+    def test_recipe_deleted(self):
+        self.stew.delete()
+        self.assertEqual(self._counts(), {'돼지고기': 1, '돼지감자': 0, '돼지껍데기': 0})
+
+    def test_refresh_all(self):
+        NormalizedIngredient.objects.update(recipe_count=0)
+        self.assertEqual(refresh_recipe_counts(), 3)
+        self.assertEqual(self._counts(), {'돼지고기': 2, '돼지감자': 1, '돼지껍데기': 0})
+        self.assertEqual(refresh_recipe_counts([]), 0)
+
+
+class UsageRankingTest(RecipeCountTestCase):
+    """자동완성/재료 목록 사용 순 정렬 테스트"""
+
+    def test_autocomplete_ranked_by_usage(self):
+        response = self.client.get(f'{self.url}/ingredients/autocomplete', {'q': '돼지'})
+        self.assertEqual(
+            [suggestion['name'] for suggestion in response.json()['suggestions']],
+            ['돼지고기', '돼지감자', '돼지껍데기']
+        )
+
+        self._recipe('R003', [self.skin])
+        self._recipe('R004', [self.skin])
+        self._recipe('R005', [self.skin])
+        response = self.client.get(f'{self.url}/ingredients/autocomplete', {'q': 'ㄷㅈ'})
+        self.assertEqual(
+            [suggestion['name'] for suggestion in response.json()['suggestions']],
+            ['돼지껍데기', '돼지고기', '돼지감자']
+        )
+
+    def test_ingredient_list_ranked_by_usage(self):
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.url}/ingredients')
+        ingredients = response.json()['ingredients']
+        self.assertEqual(
+            [(ingredient['name'], ingredient['recipe_count']) for ingredient in ingredients],
+            [('돼지고기', 2), ('돼지감자', 1), ('돼지껍데기', 0)]
+        )
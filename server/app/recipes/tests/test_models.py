@@ -3,7 +3,9 @@ Recipe 모델 테스트
 """
 
 from django.test import TestCase
-from recipes.models import Recipe
+from recipes.models import (
+    Recipe, parse_cooking_minutes, parse_servings_count, parse_difficulty_level
+)
 
 
 class RecipeModelTest(TestCase):
@@ -107,3 +109,42 @@ class RecipeModelTest(TestCase):
 
         self.assertIsNotNone(recipe.created_at)
         self.assertIsNotNone(recipe.updated_at)
+
+
+class RecipeTypedFieldsTest(TestCase):
+    """원본 문자열 → 숫자 필드 해석 테스트"""
+
+    def test_parse_cooking_minutes(self):
+        cases = {
+            '30.0': 30, '120.0': 120, '5분이내': 5, '30분이내': 30,
+            '2시간이상': 120, '1시간 30분': 90, '': None, '모름': None,
+        }
+        for value, expected in cases.items():
+            self.assertEqual(parse_cooking_minutes(value), expected, value)
+
+    def test_parse_servings_count(self):
+        cases = {'2.0': 2, '1인분': 1, '6인분이상': 6, '': None}
+        for value, expected in cases.items():
+            self.assertEqual(parse_servings_count(value), expected, value)
+
+    def test_parse_difficulty_level(self):
+        cases = {'아무나': 1, '초급': 2, '초보환영': 2, '중급': 3, '고급': 4, '신의경지': 5, '알수없음': None}
+        for value, expected in cases.items():
+            self.assertEqual(parse_difficulty_level(value), expected, value)
+
+    def test_save_fills_typed_fields(self):
+        """save() 시 숫자 필드 자동 갱신 (update_fields 지정 시에도)"""
+        recipe = Recipe.objects.create(
+            recipe_sno="RCP100", title="갈비찜", name="갈비찜",
+            servings="4.0", difficulty="중급", cooking_time="120.0"
+        )
+        recipe.refresh_from_db()
+        self.assertEqual(
+            (recipe.cooking_minutes, recipe.servings_count, recipe.difficulty_level),
+            (120, 4, 3)
+        )
+
+        recipe.cooking_time = "90.0"
+        recipe.save(update_fields=['cooking_time'])
+        recipe.refresh_from_db()
+        self.assertEqual(recipe.cooking_minutes, 90)
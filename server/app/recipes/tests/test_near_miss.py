@@ -0,0 +1,155 @@
+"""
+거의 만들 수 있는 레시피 / 장보기 목록 테스트
+"""
+
+from django.test import Client, SimpleTestCase
+import numpy as np
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.recipe_index import RecipeIndex
+from recipes.services.near_miss import find_near_misses
+from .base import CategoryTestCase
+
+
+class FindNearMissesTest(SimpleTestCase):
+    """인덱스 기반 부족 재료 계산 테스트"""
+
+    def setUp(self):
+        """무작위 레시피 200개 (재료 1~8개, 재료 30종 중 0~4번은 조미료)"""
+        rng = np.random.default_rng(5)
+        self.recipes = {}
+        rows = []
+        for recipe_id in range(1, 201):
+            ingredient_ids = set(int(i) for i in rng.choice(30, size=int(rng.integers(1, 9)), replace=False))
+            self.recipes[recipe_id] = ingredient_ids
+            rows.extend((recipe_id, i, i < 5) for i in ingredient_ids)
+        self.index = RecipeIndex('v1', list(range(1, 201)), rows)
+        self.rng = rng
+
+    def _brute_force(self, user_ids, max_missing):
+        """레시피별 필수 재료 집합으로 직접 계산한 {recipe_id: 부족한 재료}, unlocks, near_miss_count"""
+        near = {}
+        for recipe_id, ingredient_ids in self.recipes.items():
+            essential = {i for i in ingredient_ids if i >= 5}
+            missing = essential - user_ids
+            if essential & user_ids and 1 <= len(missing) <= max_missing:
+                near[recipe_id] = missing
+        unlocks, counts = {}, {}
+        for missing in near.values():
+            for ingredient_id in missing:
+                counts[ingredient_id] = counts.get(ingredient_id, 0) + 1
+                if len(missing) == 1:
+                    unlocks[ingredient_id] = unlocks.get(ingredient_id, 0) + 1
+        return near, unlocks, counts
+
+    def test_equals_brute_force(self):
+        """부족한 재료, unlocks, 정렬이 직접 계산과 동일"""
+        for _ in range(30):
+            user_ids = set(int(i) for i in self.rng.choice(30, size=int(self.rng.integers(1, 15)), replace=False))
+            for max_missing in (1, 2):
+                near, unlocks, counts = self._brute_force(user_ids, max_missing)
+                result = find_near_misses(self.index, user_ids, max_missing=max_missing, limit=500, shopping_limit=500)
+
+                self.assertEqual(result.total, len(near))
+                self.assertEqual({r.recipe_id: set(r.missing_ids) for r in result.recipes}, near)
+                self.assertEqual(
+                    [(item.ingredient_id, item.unlocks, item.near_miss_count) for item in result.shopping_list],
+                    sorted(
+                        ((i, unlocks.get(i, 0), c) for i, c in counts.items()),
+                        key=lambda item: (-item[1], -item[2], item[0])
+                    )
+                )
+
+                ranks = [
+                    (len(r.missing_ids), -sum(unlocks.get(i, 0) for i in r.missing_ids), r.recipe_id)
+                    for r in result.recipes
+                ]
+                self.assertEqual(ranks, sorted(ranks))
+
+    def test_limits(self):
+        """레시피/장보기 목록 개수 제한, total은 전체 개수"""
+        user_ids = set(range(5, 20))
+        full = find_near_misses(self.index, user_ids, limit=500, shopping_limit=500)
+        result = find_near_misses(self.index, user_ids, limit=3, shopping_limit=2)
+        self.assertEqual(result.recipes, full.recipes[:3])
+        self.assertEqual(result.shopping_list, full.shopping_list[:2])
+        self.assertEqual(result.total, full.total)
+
+    def test_no_candidates(self):
+        """조미료만 보유하거나 인덱스에 없는 재료만 보유하면 빈 결과"""
+        for user_ids in ({0, 1}, {999}):
+            result = find_near_misses(self.index, user_ids)
+            self.assertEqual((result.recipes, result.shopping_list, result.total), ([], [], 0))
+
+
+class NearMissAPITest(CategoryTestCase):
+    """GET /recipes/near-misses 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes/near-misses'
+
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.tofu = NormalizedIngredient.objects.create(name='두부', category=self.etc_norm_category)
+        self.kimchi = NormalizedIngredient.objects.create(name='김치', category=None)
+        self.salt = NormalizedIngredient.objects.create(
+            name='소금', category=self.seasoning_norm_category, is_common_seasoning=True
+        )
+
+        # 제육볶음: 돼지고기, 양파, 소금 → 양파 1개 부족 (조미료 제외)
+        self.recipe1 = self._create_recipe('R001', '제육볶음', [self.pork, self.onion, self.salt])
+        # 두부김치: 돼지고기, 두부, 김치 → 2개 부족
+        self.recipe2 = self._create_recipe('R002', '두부김치', [self.pork, self.tofu, self.kimchi])
+        # 양파돼지볶음: 돼지고기, 양파 → 양파 1개 부족 (최근 생성 → 동점 시 먼저)
+        self.recipe3 = self._create_recipe('R003', '양파돼지볶음', [self.pork, self.onion])
+        # 돼지고기구이: 이미 만들 수 있음 → 제외
+        self.recipe4 = self._create_recipe('R004', '돼지고기구이', [self.pork, self.salt])
+
+    def _create_recipe(self, recipe_sno, name, normalized_ingredients):
+        recipe = Recipe.objects.create(
+            recipe_sno=recipe_sno, name=name, title=name,
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in normalized_ingredients:
+            Ingredient.objects.create(
+                recipe=recipe,
+                original_name=normalized.name,
+                normalized_name=normalized.name,
+                normalized_ingredient=normalized
+            )
+        return recipe
+
+    def test_near_misses_and_shopping_list(self):
+        """부족한 재료 수 순 레시피와 unlocks 순 장보기 목록"""
+        response = self.client.get(self.url, {'ingredients': '돼지고기'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(
+            [(r['recipe_sno'], r['missing_count']) for r in data['recipes']],
+            [('R003', 1), ('R001', 1), ('R002', 2)]
+        )
+        self.assertEqual(
+            data['recipes'][0]['missing_ingredients'],
+            [{'id': self.onion.id, 'name': '양파', 'category': '채소류'}]
+        )
+        self.assertEqual(data['recipes'][2]['matched_count'], 1)
+        self.assertEqual(data['recipes'][2]['total_count'], 3)
+
+        shopping = [(item['name'], item['category'], item['unlocks'], item['near_miss_count'])
+                    for item in data['shopping_list']]
+        self.assertEqual(shopping[0], ('양파', '채소류', 2, 2))
+        self.assertIn(('김치', '기타', 0, 1), shopping)
+
+    def test_max_missing(self):
+        """max_missing=1이면 1개만 부족한 레시피"""
+        response = self.client.get(self.url, {'ingredients': '돼지고기', 'max_missing': 1})
+        data = response.json()
+        self.assertEqual([r['recipe_sno'] for r in data['recipes']], ['R003', 'R001'])
+        self.assertEqual([item['name'] for item in data['shopping_list']], ['양파'])
+
+    def test_unknown_ingredients(self):
+        """알 수 없는 재료만 입력하면 빈 결과"""
+        response = self.client.get(self.url, {'ingredients': '없는재료'})
+        self.assertEqual(response.json(), {'recipes': [], 'shopping_list': [], 'total': 0})
@@ -0,0 +1,121 @@
+"""
+레시피 카드 직렬화 캐시 테스트
+"""
+
+import json
+from django.test import Client, SimpleTestCase
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.schemas import (
+    PaginatedRecipesSchema,
+    RecipeListItemSchema,
+    RecipeSchema,
+    RecipeRecommendResponseSchema,
+    RecipeRecommendationsResponseSchema,
+    RecipeSearchResponseSchema,
+)
+from recipes.services.recipe_cards import CARD_FIELDS, LIST_ITEM_FIELDS, RecipeCardCache, render_list, stitch_card
+from .base import CategoryTestCase
+
+
+class StitchTest(SimpleTestCase):
+    """JSON 조각 조립 테스트"""
+
+    def test_stitch_card(self):
+        card = b'{"name":"\xea\xb9\x80\xec\xb9\x98\xec\xb0\x8c\xea\xb0\x9c"}'
+        self.assertEqual(
+            json.loads(stitch_card(card, {'match_score': 0.5, 'missing': [{'id': 1}]})),
+            {'name': '김치찌개', 'match_score': 0.5, 'missing': [{'id': 1}]}
+        )
+        self.assertEqual(stitch_card(card, {}), card)
+
+    def test_render_list(self):
+        items = [b'{"a":1}', b'{"a":2}']
+        self.assertEqual(
+            json.loads(render_list('recipes', items, {'total': 2, 'next_cursor': None})),
+            {'recipes': [{'a': 1}, {'a': 2}], 'total': 2, 'next_cursor': None}
+        )
+        self.assertEqual(json.loads(render_list('results', [], {})), {'results': []})
+
+
+class RecipeCardCacheTest(CategoryTestCase):
+    """레시피 카드 캐시 테스트"""
+
+    def setUp(self):
+        self.cache = RecipeCardCache(max_entries=10)
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='김치찌개', title='얼큰한 김치찌개',
+            servings='2.0', difficulty='아무나', cooking_time='20.0', introduction='소개 "따옴표"'
+        )
+
+    def test_card_equals_schema(self):
+        """카드 필드/값이 RecipeSchema 직렬화와 동일"""
+        self.assertEqual(CARD_FIELDS, tuple(RecipeSchema.model_fields))
+        card = self.cache.get_many([self.recipe.id])[self.recipe.id]
+        self.assertEqual(json.loads(card), RecipeSchema.from_orm(self.recipe).dict())
+
+    def test_list_item_card_equals_schema(self):
+        """목록 카드 필드/값이 RecipeListItemSchema 직렬화와 동일 (id 포함)"""
+        self.assertEqual(LIST_ITEM_FIELDS, tuple(RecipeListItemSchema.model_fields))
+        card = RecipeCardCache(max_entries=10, fields=LIST_ITEM_FIELDS).get_many([self.recipe.id])[self.recipe.id]
+        self.assertEqual(json.loads(card), RecipeListItemSchema.from_orm(self.recipe).dict())
+
+    def test_cached_until_recipe_changes(self):
+        """캐시된 카드는 쿼리 없이 반환, 레시피가 바뀌면 다시 직렬화"""
+        self.cache.get_many([self.recipe.id])
+        with self.assertNumQueries(0):
+            self.cache.get_many([self.recipe.id])
+
+        self.recipe.title = '새 제목'
+        self.recipe.save()
+        with self.assertNumQueries(1):
+            card = self.cache.get_many([self.recipe.id])[self.recipe.id]
+        self.assertEqual(json.loads(card)['title'], '새 제목')
+
+    def test_missing_recipes_and_limit(self):
+        """없는 레시피는 제외, 최대 개수를 넘으면 오래된 카드 제거"""
+        self.assertEqual(list(self.cache.get_many([self.recipe.id, 999999])), [self.recipe.id])
+
+        small = RecipeCardCache(max_entries=1)
+        other = Recipe.objects.create(
+            recipe_sno='R002', name='된장찌개', title='된장찌개',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        small.get_many([self.recipe.id, other.id])
+        with self.assertNumQueries(1):
+            self.assertEqual(set(small.get_many([self.recipe.id, other.id])), {self.recipe.id, other.id})
+
+
+class CardResponseTest(CategoryTestCase):
+    """카드 조립 응답이 응답 스키마를 만족하는지 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        for recipe_sno, name, ingredients in (('R001', '제육볶음', [pork, onion]), ('R002', '돼지고기구이', [pork])):
+            recipe = Recipe.objects.create(
+                recipe_sno=recipe_sno, name=name, title=name,
+                servings='2.0', difficulty='아무나', cooking_time='20.0'
+            )
+            for normalized in ingredients:
+                Ingredient.objects.create(
+                    recipe=recipe, original_name=normalized.name,
+                    normalized_name=normalized.name, normalized_ingredient=normalized
+                )
+
+    def test_responses_match_schemas(self):
+        responses = (
+            (self.client.get(f'{self.url}/search', {'ingredients': '돼지고기'}), RecipeSearchResponseSchema),
+            (self.client.get(f'{self.url}/recommendations', {'ingredients': '돼지고기'}),
+             RecipeRecommendationsResponseSchema),
+            (self.client.post(f'{self.url}/recommend', data={'ingredients': ['돼지고기']},
+                              content_type='application/json'), RecipeRecommendResponseSchema),
+            (self.client.get(self.url), PaginatedRecipesSchema),
+        )
+        for response, schema in responses:
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Type'], 'application/json')
+            data = response.json()
+            self.assertEqual(schema.model_validate(data).dict(), data)
+            self.assertEqual(len(data['recipes']), 2)
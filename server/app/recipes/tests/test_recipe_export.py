@@ -0,0 +1,67 @@
+"""
+NDJSON 스트리밍 내보내기 테스트
+"""
+
+import json
+from django.test import Client, override_settings
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.recipe_cards import CARD_FIELDS
+from .base import CategoryTestCase
+
+NDJSON = 'application/x-ndjson'
+
+
+class NDJSONExportTest(CategoryTestCase):
+    """Accept: application/x-ndjson 스트리밍 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.recipes = []
+        for i in range(7):
+            recipe = Recipe.objects.create(
+                recipe_sno=f'R{i:03d}', name=f'레시피{i}', title=f'레시피{i}',
+                servings='2.0', difficulty='아무나' if i % 2 else '중급', cooking_time='20.0'
+            )
+            if i < 5:
+                Ingredient.objects.create(
+                    recipe=recipe, original_name='돼지고기',
+                    normalized_name='돼지고기', normalized_ingredient=self.pork
+                )
+            self.recipes.append(recipe)
+
+    def _lines(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], NDJSON)
+        self.assertTrue(response.streaming)
+        chunks = list(response.streaming_content)
+        return chunks, [json.loads(line) for line in b''.join(chunks).splitlines()]
+
+    @override_settings(NDJSON_EXPORT_CHUNK_SIZE=3)
+    def test_list_streams_all_recipes(self):
+        """페이지 없이 필터를 적용한 전체 목록, chunk_size줄씩 전송"""
+        chunks, rows = self._lines(self.client.get(self.url, {'limit': 2}, HTTP_ACCEPT=NDJSON))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual([row['recipe_sno'] for row in rows], [f'R{i:03d}' for i in reversed(range(7))])
+        self.assertEqual(rows[0]['id'], self.recipes[-1].id)
+
+        _, rows = self._lines(self.client.get(self.url, {'difficulty': '중급'}, HTTP_ACCEPT=NDJSON))
+        self.assertEqual(len(rows), 4)
+
+    def test_search_streams_all_matches(self):
+        """검색 결과 전체 (limit 무시), 카드 필드 순서"""
+        _, rows = self._lines(self.client.get(
+            f'{self.url}/search', {'ingredients': '돼지고기', 'limit': 1}, HTTP_ACCEPT=NDJSON
+        ))
+        self.assertEqual([row['recipe_sno'] for row in rows], [f'R{i:03d}' for i in reversed(range(5))])
+        self.assertEqual(tuple(rows[0]), CARD_FIELDS)
+
+        _, rows = self._lines(self.client.get(f'{self.url}/search', {'ingredients': '없는재료'}, HTTP_ACCEPT=NDJSON))
+        self.assertEqual(rows, [])
+
+    def test_json_without_accept(self):
+        """Accept 헤더가 없으면 기존 JSON 응답"""
+        response = self.client.get(self.url, {'limit': 2})
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.json()['recipes']), 2)
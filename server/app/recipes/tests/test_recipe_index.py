@@ -0,0 +1,312 @@
+"""
+레시피 추천 인덱스 테스트
+"""
+
+from django.test import SimpleTestCase
+import numpy as np
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.recipe_index import RecipeIndex, get_recipe_index, normalize_facets
+from recipes.services.data_version import get_data_version
+from .base import CategoryTestCase
+
+
+class RecipeIndexTest(CategoryTestCase):
+    """인메모리 역색인 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 준비"""
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.tofu = NormalizedIngredient.objects.create(name='두부', category=self.etc_norm_category)
+        self.salt = NormalizedIngredient.objects.create(
+            name='소금', category=self.seasoning_norm_category, is_common_seasoning=True
+        )
+
+        # 제육볶음: 돼지고기, 양파, 소금
+        self.recipe1 = self._create_recipe('R001', '제육볶음', [self.pork, self.onion, self.salt])
+        # 두부조림: 두부, 소금
+        self.recipe2 = self._create_recipe('R002', '두부조림', [self.tofu, self.salt])
+        # 양파볶음: 양파 (동일 재료 중복 등록)
+        self.recipe3 = self._create_recipe('R003', '양파볶음', [self.onion, self.onion])
+        # 정규화되지 않은 재료만 있는 레시피
+        self.recipe4 = self._create_recipe('R004', '미정규화', [])
+        Ingredient.objects.create(recipe=self.recipe4, original_name='알수없음', normalized_name='알수없음')
+
+    def _create_recipe(self, recipe_sno, name, normalized_ingredients):
+        recipe = Recipe.objects.create(
+            recipe_sno=recipe_sno, name=name, title=name,
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in normalized_ingredients:
+            Ingredient.objects.create(
+                recipe=recipe,
+                original_name=normalized.name,
+                normalized_name=normalized.name,
+                normalized_ingredient=normalized
+            )
+        return recipe
+
+    def _total(self, index, recipe, exclude_seasonings):
+        """인덱스의 레시피별 재료 수"""
+        row = list(index.recipe_ids).index(recipe.id)
+        return int(index.totals[exclude_seasonings][row])
+
+    def _brute_force(self, user_ids, exclude_seasonings, min_match_rate):
+        """기존 전체 스캔 방식의 결과"""
+        matches = []
+        for recipe in Recipe.objects.prefetch_related('ingredients__normalized_ingredient'):
+            recipe_ids = {
+                ing.normalized_ingredient_id for ing in recipe.ingredients.all()
+                if ing.normalized_ingredient_id
+                and not (exclude_seasonings and ing.normalized_ingredient.is_common_seasoning)
+            }
+            if not recipe_ids:
+                continue
+            matched = len(user_ids & recipe_ids)
+            score = matched / len(recipe_ids)
+            if score >= min_match_rate:
+                matches.append((recipe.id, score, matched, len(recipe_ids)))
+        matches.sort(key=lambda m: (m[1], m[2]), reverse=True)
+        return matches
+
+    def test_match_equals_full_scan(self):
+        """후보 기반 매칭 결과가 전체 스캔 결과와 동일"""
+        index = get_recipe_index()
+        cases = [
+            {self.pork.id},
+            {self.onion.id, self.salt.id},
+            {self.pork.id, self.onion.id, self.tofu.id, self.salt.id},
+        ]
+        for user_ids in cases:
+            for exclude_seasonings in (True, False):
+                for min_match_rate in (0.0, 0.3, 1.0):
+                    expected = self._brute_force(user_ids, exclude_seasonings, min_match_rate)
+                    result = index.match(user_ids, exclude_seasonings, min_match_rate)
+                    self.assertEqual([tuple(m) for m in result.matches], expected)
+                    self.assertEqual(result.total, len(expected))
+
+    def test_limit_keeps_full_ordering(self):
+        """limit 적용 시 전체 정렬 결과의 앞부분과 동일, total은 전체 개수"""
+        index = get_recipe_index()
+        user_ids = {self.pork.id, self.onion.id, self.tofu.id, self.salt.id}
+        expected = self._brute_force(user_ids, False, 0.0)
+        for limit in range(1, len(expected) + 1):
+            result = index.match(user_ids, False, 0.0, limit=limit)
+            self.assertEqual([tuple(m) for m in result.matches], expected[:limit])
+            self.assertEqual(result.total, len(expected))
+
+    def test_totals_with_and_without_seasonings(self):
+        """조미료 포함/제외 재료 수"""
+        index = get_recipe_index()
+        self.assertEqual(self._total(index, self.recipe1, False), 3)
+        self.assertEqual(self._total(index, self.recipe1, True), 2)
+        # 중복 재료는 1개로 계산
+        self.assertEqual(self._total(index, self.recipe3, False), 1)
+        # 정규화 재료가 없는 레시피는 0개
+        self.assertEqual(self._total(index, self.recipe4, False), 0)
+
+    def test_only_candidates_scored(self):
+        """사용자 재료를 포함하지 않는 레시피는 결과에 없음"""
+        result = get_recipe_index().match({self.tofu.id}, True, 0.3)
+        self.assertEqual([m.recipe_id for m in result.matches], [self.recipe2.id])
+
+    def test_rebuild_on_data_change(self):
+        """데이터 변경 시 인덱스 재구축"""
+        index = get_recipe_index()
+        self.assertIs(get_recipe_index(), index)
+
+        version = get_data_version()
+        Ingredient.objects.create(
+            recipe=self.recipe2,
+            original_name='양파',
+            normalized_name='양파',
+            normalized_ingredient=self.onion
+        )
+        self.assertNotEqual(get_data_version(), version)
+
+        rebuilt = get_recipe_index()
+        self.assertIsNot(rebuilt, index)
+        self.assertEqual(self._total(rebuilt, self.recipe2, True), 2)
+
+    def test_build_from_rows(self):
+        """행 목록으로 직접 구축"""
+        index = RecipeIndex('v1', [10, 20], [(10, 1, False), (10, 2, True), (20, 1, False), (30, 1, False)])
+        self.assertEqual(list(index.ingredient_ids), [1, 2])
+        # 레시피×재료 CSR / 재료별 posting
+        self.assertEqual(list(index.indptr), [0, 2, 3])
+        self.assertEqual(list(index.indices), [0, 1, 0])
+        self.assertEqual(list(index.posting_rows[index.posting_ptr[0]:index.posting_ptr[1]]), [0, 1])
+        self.assertEqual(list(index.is_seasoning), [False, True])
+        # 레시피 목록에 없는 행은 무시
+        self.assertEqual(list(index.totals[False]), [2, 1])
+        self.assertEqual(list(index.totals[True]), [1, 1])
+
+    def test_empty_index(self):
+        """데이터가 없을 때 빈 결과"""
+        index = RecipeIndex('v1', [], [])
+        result = index.match({1, 2}, False, 0.0, limit=10)
+        self.assertEqual(result.matches, [])
+        self.assertEqual(result.total, 0)
+
+
+class PrunedMatchTest(SimpleTestCase):
+    """점수 상한 기반 가지치기 테스트"""
+
+    def setUp(self):
+        """무작위 레시피 300개 (재료 1~12개, 재료 60종 중 0~9번은 조미료)"""
+        rng = np.random.default_rng(7)
+        rows = []
+        for recipe_id in range(1, 301):
+            size = int(rng.integers(1, 13))
+            for ingredient_id in rng.choice(60, size=size, replace=False):
+                rows.append((recipe_id, int(ingredient_id), ingredient_id < 10))
+        self.index = RecipeIndex('v1', list(range(1, 301)), rows)
+        self.rng = rng
+
+    def test_same_matches_as_full_scoring(self):
+        """가지치기 결과 목록은 전체 계산과 동일, total이 정확하다고 표시되면 전체 개수와 동일"""
+        for _ in range(40):
+            user_ids = set(int(i) for i in self.rng.choice(60, size=int(self.rng.integers(1, 25)), replace=False))
+            for algorithm in ('coverage', 'jaccard', 'cosine'):
+                for exclude_seasonings in (True, False):
+                    for min_match_rate, limit in ((0.3, 5), (0.3, 20), (0.6, 10), (1.0, 3)):
+                        args = (user_ids, exclude_seasonings, min_match_rate)
+                        kwargs = {'limit': limit, 'algorithm': algorithm}
+                        expected = self.index.match(*args, **kwargs)
+                        pruned = self.index.match(*args, exact_total=False, **kwargs)
+                        self.assertEqual(pruned.matches, expected.matches)
+                        if pruned.total_is_exact:
+                            self.assertEqual(pruned.total, expected.total)
+
+    def test_skips_recipes(self):
+        """상위 k개가 모두 만점이면 재료 수가 많은 레시피는 건너뛰고 total은 추정값"""
+        index = RecipeIndex(
+            'v1', list(range(1, 7)),
+            [(1, 1, False), (2, 1, False), (3, 2, False)]
+            + [(4, 1, False), (4, 3, False), (4, 6, False), (5, 1, False), (5, 4, False), (5, 7, False)]
+            + [(6, 2, False), (6, 5, False), (6, 8, False)]
+        )
+        result = index.match({1, 2}, True, 0.3, limit=2, exact_total=False)
+        self.assertEqual([m.recipe_id for m in result.matches], [1, 2])
+        self.assertFalse(result.total_is_exact)
+
+        exact = index.match({1, 2}, True, 0.3, limit=2)
+        self.assertEqual(exact.matches, result.matches)
+        self.assertTrue(exact.total_is_exact)
+        self.assertEqual(exact.total, 6)
+
+
+class MatchBatchTest(SimpleTestCase):
+    """여러 재료 조합 일괄 매칭 테스트"""
+
+    def setUp(self):
+        """무작위 레시피 300개 (재료 1~12개, 재료 60종 중 0~9번은 조미료)"""
+        rng = np.random.default_rng(3)
+        rows = []
+        for recipe_id in range(1, 301):
+            for ingredient_id in rng.choice(60, size=int(rng.integers(1, 13)), replace=False):
+                rows.append((recipe_id, int(ingredient_id), ingredient_id < 10))
+        self.index = RecipeIndex('v1', list(range(1, 301)), rows)
+        self.user_id_sets = [
+            set(int(i) for i in rng.choice(60, size=int(rng.integers(1, 25)), replace=False))
+            for _ in range(20)
+        ] + [set(), {999}, set(range(10))]
+
+    def test_same_as_individual_match(self):
+        """조합별 match() 결과와 동일"""
+        for algorithm in ('coverage', 'jaccard', 'cosine', 'seasoning_bonus'):
+            for exclude_seasonings in (True, False):
+                for min_match_rate, limit in ((0.3, 10), (0.6, None), (0.0, 5)):
+                    for rank_by_matched_count in (True, False):
+                        args = (exclude_seasonings, min_match_rate, limit, rank_by_matched_count, algorithm)
+                        results = self.index.match_batch(self.user_id_sets, *args)
+                        self.assertEqual(results, [self.index.match(user_ids, *args) for user_ids in self.user_id_sets])
+
+    def test_empty_batch(self):
+        """조합이 없으면 빈 목록"""
+        self.assertEqual(self.index.match_batch([], True, 0.3, limit=10), [])
+
+
+class FacetTest(SimpleTestCase):
+    """패싯 비트맵 필터/집계 테스트"""
+
+    def setUp(self):
+        """무작위 레시피 300개 (재료 1~10개, 재료 40종 중 0~5번은 조미료, 패싯 값 무작위)"""
+        rng = np.random.default_rng(11)
+        rows = []
+        for recipe_id in range(1, 301):
+            for ingredient_id in rng.choice(40, size=int(rng.integers(1, 11)), replace=False):
+                rows.append((recipe_id, int(ingredient_id), ingredient_id < 6))
+        self.facets = {
+            'method': [str(v) for v in rng.choice(['볶음', '끓이기', '굽기', ''], size=300)],
+            'recipe_type': [str(v) for v in rng.choice(['국/탕', '반찬', '찌개'], size=300)],
+            'difficulty': [str(v) for v in rng.choice(['아무나', '초급', '중급'], size=300)],
+        }
+        self.index = RecipeIndex('v1', list(range(1, 301)), rows, facets=self.facets)
+        self.user_id_sets = [
+            set(int(i) for i in rng.choice(40, size=int(rng.integers(1, 15)), replace=False))
+            for _ in range(10)
+        ]
+
+    def _allowed(self, facets):
+        """패싯 조건을 만족하는 레시피 ID (직접 계산)"""
+        return {
+            recipe_id for row, recipe_id in enumerate(range(1, 301))
+            if all(self.facets.get(field, [''] * 300)[row] in values for field, values in facets.items())
+        }
+
+    def test_normalize_facets(self):
+        """쿼리 파라미터/커서 공용 패싯 검증: FACET_FIELDS 순서, 값 정렬/중복·공백 제거, 없는 필드는 ValueError"""
+        self.assertEqual(
+            normalize_facets({'difficulty': ['초급'], 'method': [' 볶음', '굽기', '볶음', ' ']}),
+            {'method': ['굽기', '볶음'], 'difficulty': ['초급']}
+        )
+        self.assertIsNone(normalize_facets({'method': ['']}))
+        self.assertIsNone(normalize_facets(None))
+        with self.assertRaises(ValueError):
+            normalize_facets({'id': ['1']})
+
+    def test_mask_equals_brute_force(self):
+        """같은 필드는 OR, 필드 간은 AND, 없는 값은 일치 없음"""
+        for facets in (
+            {'method': ['볶음']},
+            {'method': ['볶음', '굽기'], 'recipe_type': ['국/탕']},
+            {'recipe_type': ['찌개'], 'difficulty': ['아무나', '중급']},
+            {'method': ['없는값']},
+        ):
+            mask = self.index.facet_mask(facets)
+            self.assertEqual(set(self.index.recipe_ids[mask].tolist()), self._allowed(facets), facets)
+        self.assertIsNone(self.index.facet_mask({'method': []}))
+
+    def test_match_with_facets_equals_filtered_match(self):
+        """패싯 조건 매칭 = 전체 매칭 후 조건 필터, 패싯 개수 = 조건을 만족한 전체 레시피 기준"""
+        facets = {'method': ['볶음', '끓이기'], 'difficulty': ['아무나']}
+        allowed = self._allowed(facets)
+        for user_ids in self.user_id_sets:
+            for algorithm in ('coverage', 'jaccard', 'seasoning_bonus'):
+                full = self.index.match(user_ids, True, 0.2, algorithm=algorithm)
+                expected = [m for m in full.matches if m.recipe_id in allowed]
+
+                result = self.index.match(
+                    user_ids, True, 0.2, limit=5, algorithm=algorithm, exact_total=False,
+                    facets=facets, count_facets=True
+                )
+                self.assertEqual(result.matches, expected[:5])
+                self.assertEqual(result.total, len(expected))
+                self.assertTrue(result.total_is_exact)
+
+                rows = {recipe_id - 1 for recipe_id in (m.recipe_id for m in expected)}
+                for field, counts in result.facet_counts.items():
+                    values = self.facets.get(field, [''] * 300)
+                    brute = {}
+                    for row in rows:
+                        if values[row]:
+                            brute[values[row]] = brute.get(values[row], 0) + 1
+                    self.assertEqual(counts, brute, field)
+                    self.assertEqual(list(counts.values()), sorted(counts.values(), reverse=True))
+
+    def test_facet_values(self):
+        """패싯 값은 정렬된 고유 값 (빈 값과 없는 필드는 제외)"""
+        self.assertEqual(self.index.facet_values['method'], ['굽기', '끓이기', '볶음'])
+        self.assertEqual(self.index.facet_values['situation'], [])
+        self.assertEqual(self.index.facet_counts(np.arange(300))['situation'], {})
@@ -0,0 +1,92 @@
+"""
+재료 AND 검색 키셋 페이지네이션 테스트
+"""
+
+from django.test import Client
+from django.utils import timezone
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.recipe_search import (
+    SearchCursor, decode_search_cursor, encode_search_cursor, search_recipes_by_ingredients
+)
+from .base import CategoryTestCase
+
+
+class RecipeSearchTest(CategoryTestCase):
+    """GET /recipes/search 페이지네이션 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes/search'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+
+        # 돼지고기+양파 레시피 25개 (5개씩 같은 생성 시각 → id로 정렬), 돼지고기만 5개
+        self.both = [self._create_recipe(f'R{i:03d}', [self.pork, self.onion]) for i in range(25)]
+        self.pork_only = [self._create_recipe(f'P{i:03d}', [self.pork]) for i in range(5)]
+        created_at = timezone.now()
+        for i in range(0, 25, 5):
+            Recipe.objects.filter(id__in=[r.id for r in self.both[i:i + 5]]).update(
+                created_at=created_at - timezone.timedelta(minutes=i)
+            )
+
+    def _create_recipe(self, recipe_sno, normalized_ingredients):
+        recipe = Recipe.objects.create(
+            recipe_sno=recipe_sno, name=recipe_sno, title=recipe_sno,
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in normalized_ingredients:
+            Ingredient.objects.create(
+                recipe=recipe, original_name=normalized.name,
+                normalized_name=normalized.name, normalized_ingredient=normalized
+            )
+        return recipe
+
+    def test_keyset_pages(self):
+        """페이지를 이어 붙이면 (-created_at, -id) 순 전체 결과, total은 모든 페이지에서 동일"""
+        expected = list(
+            Recipe.objects.filter(id__in=[r.id for r in self.both])
+            .order_by('-created_at', '-id').values_list('recipe_sno', flat=True)
+        )
+        params = {'ingredients': '돼지고기,양파', 'limit': 10}
+
+        collected, cursor, pages = [], None, 0
+        while True:
+            response = self.client.get(self.url, {**params, **({'cursor': cursor} if cursor else {})})
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertEqual(data['total'], 25)
+            collected.extend(r['recipe_sno'] for r in data['recipes'])
+            pages += 1
+            cursor = data['next_cursor']
+            if cursor is None:
+                break
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(collected, expected)
+
+    def test_single_query(self):
+        """페이지 + 전체 개수를 쿼리 1회로 조회"""
+        ids = sorted([self.pork.id, self.onion.id])
+        with self.assertNumQueries(1):
+            page = search_recipes_by_ingredients(ids, 10)
+        self.assertEqual((len(page.recipe_ids), page.total), (10, 25))
+        with self.assertNumQueries(1):
+            last = search_recipes_by_ingredients(ids, 20, page.next_cursor)
+        self.assertEqual((len(last.recipe_ids), last.total, last.next_cursor), (15, 25, None))
+
+        page = search_recipes_by_ingredients([self.pork.id], 100)
+        self.assertEqual((len(page.recipe_ids), page.total, page.next_cursor), (30, 30, None))
+
+    def test_invalid_cursor(self):
+        """잘못된 커서, 다른 재료 조합의 커서는 400"""
+        response = self.client.get(self.url, {'ingredients': '돼지고기', 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'InvalidCursor')
+
+        first = self.client.get(self.url, {'ingredients': '돼지고기,양파', 'limit': 5}).json()
+        response = self.client.get(self.url, {'ingredients': '돼지고기', 'cursor': first['next_cursor']})
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_round_trip(self):
+        cursor = SearchCursor([1, 2], timezone.now(), 10, 20)
+        self.assertEqual(decode_search_cursor(encode_search_cursor(cursor), [1, 2]), cursor)
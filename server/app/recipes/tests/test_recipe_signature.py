@@ -0,0 +1,88 @@
+"""
+레시피 재료 시그니처 테스트
+"""
+
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.recipe_signature import refresh_recipe_signatures
+from .base import CategoryTestCase
+
+
+class RecipeSignatureTest(CategoryTestCase):
+    """재료 시그니처 유지 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 준비"""
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.salt = NormalizedIngredient.objects.create(
+            name='소금', category=self.seasoning_norm_category, is_common_seasoning=True
+        )
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='제육볶음', title='제육볶음',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        for normalized in (self.onion, self.pork, self.salt, self.pork):
+            self._add(normalized)
+
+    def _add(self, normalized):
+        return Ingredient.objects.create(
+            recipe=self.recipe,
+            original_name=normalized.name,
+            normalized_name=normalized.name,
+            normalized_ingredient=normalized
+        )
+
+    def _signatures(self):
+        self.recipe.refresh_from_db()
+        return self.recipe.ingredient_signature, self.recipe.essential_signature
+
+    def test_maintained_on_ingredient_change(self):
+        """재료 추가/삭제 시 시그니처 갱신 (중복 제거, 오름차순)"""
+        self.assertEqual(self._signatures(), (
+            sorted([self.pork.id, self.onion.id, self.salt.id]),
+            sorted([self.pork.id, self.onion.id]),
+        ))
+
+        Ingredient.objects.filter(normalized_ingredient=self.onion).get().delete()
+        self.assertEqual(self._signatures(), (
+            sorted([self.pork.id, self.salt.id]),
+            [self.pork.id],
+        ))
+
+    def test_maintained_on_seasoning_flag_change(self):
+        """범용 조미료 여부 변경 시 필수 재료 시그니처 갱신"""
+        self.onion.is_common_seasoning = True
+        self.onion.save()
+        self.assertEqual(self._signatures()[1], [self.pork.id])
+
+        self.salt.is_common_seasoning = False
+        self.salt.save()
+        self.assertEqual(self._signatures()[1], sorted([self.pork.id, self.salt.id]))
+
+    def test_maintained_on_normalized_ingredient_delete(self):
+        """정규화 재료 삭제 시 시그니처에서 제거"""
+        self.onion.delete()
+        self.assertEqual(self._signatures()[0], sorted([self.pork.id, self.salt.id]))
+
+    def test_refresh_after_bulk_update(self):
+        """update()로 변경한 경우 직접 재계산"""
+        Ingredient.objects.filter(normalized_ingredient=self.salt).update(normalized_ingredient=None)
+        self.assertIn(self.salt.id, self._signatures()[0])
+
+        self.assertEqual(refresh_recipe_signatures(), 1)
+        self.assertEqual(self._signatures()[0], sorted([self.pork.id, self.onion.id]))
+
+    def test_search_uses_signature(self):
+        """재료 검색은 시그니처 포함 검색 결과와 동일"""
+        Recipe.objects.create(
+            recipe_sno='R002', name='빈레시피', title='빈레시피',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        response = self.client.get('/fridge2fork/v1/recipes/search', {
+            'ingredients': '돼지고기,양파,없는재료'
+        })
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['total'], 1)
+        self.assertEqual(data['recipes'][0]['name'], '제육볶음')
+        self.assertEqual(data['matched_ingredients'], ['돼지고기', '양파'])
@@ -0,0 +1,118 @@
+"""
+레시피 추천 커서 페이지네이션 테스트
+"""
+
+from unittest import mock
+from recipes.models import Recipe, Ingredient, NormalizedIngredient
+from recipes.services.data_version import get_data_version
+from recipes.services.recipe_index import MatchResult, RecipeMatch
+from recipes.services.recommendation_snapshot import CursorState, decode_cursor, encode_cursor
+from .base import CategoryTestCase
+
+
+class RecommendationCursorTest(CategoryTestCase):
+    """커서 기반 다음 페이지 조회 테스트"""
+
+    def setUp(self):
+        """돼지고기를 포함한 레시피 7개 (재료 수 1~7개 → coverage 점수 모두 다름)"""
+        self.url = '/fridge2fork/v1/recipes/recommendations'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        extras = [
+            NormalizedIngredient.objects.create(name=f'재료{i}', category=self.etc_norm_category)
+            for i in range(6)
+        ]
+        for size in range(1, 8):
+            recipe = Recipe.objects.create(
+                recipe_sno=f'R{size}', name=f'레시피{size}', title=f'레시피{size}',
+                servings='2.0', difficulty='아무나', cooking_time='20.0'
+            )
+            for normalized in [self.pork] + extras[:size - 1]:
+                Ingredient.objects.create(
+                    recipe=recipe,
+                    original_name=normalized.name,
+                    normalized_name=normalized.name,
+                    normalized_ingredient=normalized
+                )
+        self.params = {
+            'ingredients': '돼지고기', 'algorithm': 'coverage', 'min_match_rate': 0.1,
+            'limit': 3, 'exact_total': 'true'
+        }
+
+    def _names(self, data):
+        return [recipe['name'] for recipe in data['recipes']]
+
+    def test_pages_follow_full_ranking(self):
+        """커서로 이어 받은 페이지는 전체 순위와 동일"""
+        first = self.client.get(self.url, self.params).json()
+        self.assertEqual(self._names(first), ['레시피1', '레시피2', '레시피3'])
+        self.assertEqual(first['total'], 7)
+
+        second = self.client.get(self.url, {**self.params, 'cursor': first['next_cursor']}).json()
+        self.assertEqual(self._names(second), ['레시피4', '레시피5', '레시피6'])
+        self.assertEqual(second['total'], 7)
+
+        third = self.client.get(self.url, {**self.params, 'cursor': second['next_cursor']}).json()
+        self.assertEqual(self._names(third), ['레시피7'])
+        self.assertIsNone(third['next_cursor'])
+
+    def test_later_pages_served_from_snapshot(self):
+        """스냅샷이 생성된 뒤에는 점수를 다시 계산하지 않음"""
+        first = self.client.get(self.url, self.params).json()
+        second = self.client.get(self.url, {**self.params, 'cursor': first['next_cursor']}).json()
+
+        with mock.patch('recipes.api._match_recommendations') as match:
+            again = self.client.get(self.url, {**self.params, 'cursor': first['next_cursor']}).json()
+            third = self.client.get(self.url, {**self.params, 'cursor': second['next_cursor']}).json()
+        match.assert_not_called()
+        self.assertEqual(again, second)
+        self.assertEqual(self._names(third), ['레시피7'])
+
+    def test_last_page_has_no_cursor(self):
+        """결과가 limit 이하이면 커서 없음"""
+        data = self.client.get(self.url, {**self.params, 'limit': 10}).json()
+        self.assertEqual(len(data['recipes']), 7)
+        self.assertIsNone(data['next_cursor'])
+
+    def test_cursor_when_estimated_total_fits_in_page(self):
+        """가지치기한 total(추정값)이 limit 이하여도 한 페이지가 꽉 찼으면 커서 발급"""
+        matches = [RecipeMatch(recipe.id, 1.0, 1, 1) for recipe in Recipe.objects.all()[:3]]
+        params = {**self.params, 'exact_total': 'false'}
+        with mock.patch('recipes.api._match_recommendations', return_value=MatchResult(matches, 3, False)):
+            data = self.client.get(self.url, params).json()
+        self.assertEqual(len(data['recipes']), 3)
+        self.assertEqual(decode_cursor(data['next_cursor']).version, get_data_version())
+
+        with mock.patch('recipes.api._match_recommendations', return_value=MatchResult(matches[:2], 2, False)):
+            data = self.client.get(self.url, {**params, 'limit': 4}).json()
+        self.assertIsNone(data['next_cursor'])
+
+    def test_expired_cursor_after_data_change(self):
+        """스냅샷이 없고 데이터가 바뀌었으면 첫 페이지부터 다시 요청"""
+        first = self.client.get(self.url, self.params).json()
+        NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+
+        response = self.client.get(self.url, {**self.params, 'cursor': first['next_cursor']})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'InvalidCursor')
+
+    def test_malformed_cursor(self):
+        """잘못된 커서"""
+        response = self.client.get(self.url, {**self.params, 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'InvalidCursor')
+
+    def test_tampered_facet_field(self):
+        """FACET_FIELDS에 없는 패싯 필드가 들어간 커서는 400"""
+        state = decode_cursor(self.client.get(self.url, self.params).json()['next_cursor'])
+        tampered = encode_cursor(state._replace(facets={'id': ['1']}))
+        with self.assertRaises(ValueError):
+            decode_cursor(tampered)
+
+        response = self.client.get(self.url, {**self.params, 'cursor': tampered})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'InvalidCursor')
+
+    def test_cursor_round_trip(self):
+        """커서 인코딩/디코딩"""
+        state = CursorState('v1', [1, 2], 'jaccard', True, 0.3, False, 20)
+        self.assertEqual(decode_cursor(encode_cursor(state)), state)
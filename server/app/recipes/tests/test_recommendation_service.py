@@ -8,6 +8,7 @@ from recipes.models import (
     Fridge, FridgeIngredient
 )
 from recipes.services import RecommendationService
+from recipes.services.recipe_index import get_recipe_index
 from .base import CategoryTestCase
 
 User = get_user_model()
@@ -311,3 +312,89 @@ class RecommendationServiceTest(CategoryTestCase):
         # Recipe1 (20분)만 반환, Recipe2 (40분) 제외
         self.assertEqual(len(recommendations), 1)
         self.assertEqual(recommendations[0]['recipe'].cooking_time, '20.0')
+
+    def test_max_time_filter_compares_minutes(self):
+        """조리 시간은 문자열이 아닌 분 단위 숫자로 비교 ('120.0' < '30' 이지만 120분은 제외)"""
+        FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=self.돼지고기)
+        FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=self.양파)
+        self.recipe1.cooking_time = '120.0'
+        self.recipe1.save()
+        self.recipe2.cooking_time = '5.0'
+        self.recipe2.save()
+
+        recommendations = self.service.recommend_with_filters(self.fridge, max_time=30, limit=10)
+        self.assertEqual([r['recipe'].id for r in recommendations], [self.recipe2.id])
+
+    def test_batch_equals_per_recipe_calculation(self):
+        """일괄 추천 결과가 레시피별 계산(calculate_match_score, get_missing_ingredients)과 동일"""
+        FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=self.돼지고기)
+        FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=self.소금)
+        fridge_ingredients = self.fridge.get_normalized_ingredients()
+
+        expected = []
+        for recipe in Recipe.objects.all():
+            score = self.service.calculate_match_score(recipe, fridge_ingredients)
+            missing = self.service.get_missing_ingredients(recipe, fridge_ingredients)
+            expected.append((recipe.id, score, missing, len(missing)))
+        expected.sort(key=lambda x: x[1], reverse=True)
+
+        recommendations = self.service.recommend_recipes(self.fridge, limit=10, min_score=0)
+        self.assertEqual(
+            [(r['recipe'].id, r['score'], r['missing_ingredients'], r['missing_count']) for r in recommendations],
+            expected
+        )
+
+    def test_constant_query_count(self):
+        """레시피 수와 무관하게 고정된 쿼리 수"""
+        FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=self.돼지고기)
+
+        with self.assertNumQueries(5):
+            self.service.recommend_recipes(self.fridge, limit=10, min_score=0)
+
+        for i in range(5):
+            recipe = Recipe.objects.create(
+                recipe_sno=f'R1{i}', name=f'레시피{i}', title=f'레시피{i}',
+                servings='2.0', difficulty='아무나', cooking_time='10.0'
+            )
+            Ingredient.objects.create(
+                recipe=recipe,
+                original_name='돼지고기',
+                normalized_name='돼지고기',
+                normalized_ingredient=self.돼지고기
+            )
+
+        # 매칭 수 벡터 경로: 냉장고 재료, 필터, 상위 레시피, 부족한 재료 (인덱스는 미리 구축)
+        get_recipe_index()
+        with self.assertNumQueries(4):
+            self.service.recommend_with_filters(self.fridge, difficulty='아무나', limit=10)
+
+    def test_fridge_vector_equals_per_recipe_calculation(self):
+        """재료 추가/삭제 후에도 매칭 수 벡터 경로 결과가 레시피별 계산과 동일"""
+
+        def expected_for(min_score):
+            fridge_ingredients = self.fridge.get_normalized_ingredients()
+            expected = []
+            for recipe in Recipe.objects.all():
+                score = self.service.calculate_match_score(recipe, fridge_ingredients)
+                if score >= min_score:
+                    missing = self.service.get_missing_ingredients(recipe, fridge_ingredients)
+                    expected.append((recipe.id, score, missing, len(missing)))
+            expected.sort(key=lambda x: x[1], reverse=True)
+            return expected
+
+        steps = [
+            ('add', self.돼지고기), ('add', self.소금), ('add', self.당근),
+            ('remove', self.돼지고기), ('add', self.양파), ('remove', self.소금),
+        ]
+        for action, ingredient in steps:
+            if action == 'add':
+                FridgeIngredient.objects.create(fridge=self.fridge, normalized_ingredient=ingredient)
+            else:
+                FridgeIngredient.objects.filter(fridge=self.fridge, normalized_ingredient=ingredient).delete()
+
+            recommendations = self.service.recommend_recipes(self.fridge, limit=10, min_score=1)
+            self.assertEqual(
+                [(r['recipe'].id, r['score'], r['missing_ingredients'], r['missing_count'])
+                 for r in recommendations],
+                expected_for(1)
+            )
@@ -157,16 +157,16 @@ class RecipeRecommendationsAPITest(CategoryTestCase):
 
     def test_cosine_similarity_calculation(self):
         """
-        TC-2: 매칭률 계산 (algorithm 파라미터는 호환성용, 실제로는 Jaccard 매칭률 사용)
+        TC-2: Cosine 유사도 계산
 
         사용자 재료: [돼지고기, 배추]
         레시피1(김치찌개): [돼지고기, 배추, 김치]
 
-        매칭률 = 보유 재료 수 / 레시피 전체 재료 수 = 2/3 ≈ 0.667
+        Cosine = 2 / (√2 × √3) ≈ 0.816
         """
         response = self.client.get(self.url, {
             'ingredients': '돼지고기,배추',
-            'algorithm': 'cosine'  # 호환성용 파라미터, 실제로는 무시됨
+            'algorithm': 'cosine'
         })
 
         self.assertEqual(response.status_code, 200)
@@ -175,10 +175,54 @@ class RecipeRecommendationsAPITest(CategoryTestCase):
         recipe1_result = next((r for r in data['recipes'] if r['recipe_sno'] == 'RCP700'), None)
         self.assertIsNotNone(recipe1_result)
 
-        # 매칭률 = 2/3 ≈ 0.667
-        expected_score = 2.0 / 3.0
+        expected_score = 2.0 / (math.sqrt(2) * math.sqrt(3))
         self.assertAlmostEqual(recipe1_result['match_score'], expected_score, places=2)
 
+    def test_jaccard_penalizes_extra_user_ingredients(self):
+        """
+        Jaccard는 사용자 재료가 많으면 점수가 낮아지고, coverage는 유지됨
+
+        사용자 재료: [돼지고기, 배추, 두부]
+        레시피2(제육볶음): [돼지고기, 배추]
+        Jaccard = 2/3, coverage = 2/2
+        """
+        params = {'ingredients': '돼지고기,배추,두부', 'min_match_rate': 0.0}
+
+        jaccard = self.client.get(self.url, {**params, 'algorithm': 'jaccard'}).json()
+        coverage = self.client.get(self.url, {**params, 'algorithm': 'coverage'}).json()
+
+        jaccard_recipe2 = next(r for r in jaccard['recipes'] if r['recipe_sno'] == 'RCP701')
+        coverage_recipe2 = next(r for r in coverage['recipes'] if r['recipe_sno'] == 'RCP701')
+        self.assertAlmostEqual(jaccard_recipe2['match_score'], 2.0 / 3.0, places=2)
+        self.assertEqual(coverage_recipe2['match_score'], 1.0)
+        self.assertEqual(coverage['algorithm'], 'coverage')
+
+    def test_seasoning_bonus_algorithm(self):
+        """
+        조미료 보너스: 필수 재료 매칭률 + 조미료 매칭률 × 0.05
+
+        레시피3(된장찌개): 필수 [두부, 된장], 조미료 [소금]
+        """
+        response = self.client.get(self.url, {
+            'ingredients': '두부,된장,소금',
+            'algorithm': 'seasoning_bonus',
+            'exclude_seasonings': 'false'
+        })
+
+        self.assertEqual(response.status_code, 200)
+        recipe3_result = next(r for r in response.json()['recipes'] if r['recipe_sno'] == 'RCP702')
+        self.assertAlmostEqual(recipe3_result['match_score'], 1.05, places=3)
+
+    def test_invalid_algorithm(self):
+        """등록되지 않은 알고리즘은 400"""
+        response = self.client.get(self.url, {
+            'ingredients': '돼지고기',
+            'algorithm': 'unknown'
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'InvalidAlgorithm')
+
     def test_limit_parameter(self):
         """
         TC-3: limit 파라미터
@@ -285,9 +329,9 @@ class RecipeRecommendationsAPITest(CategoryTestCase):
         self.assertIn('algorithm', data)
         self.assertEqual(data['algorithm'], 'cosine')
 
-    def test_default_algorithm_is_jaccard(self):
+    def test_default_algorithm_is_coverage(self):
         """
-        기본 알고리즘은 jaccard
+        기본 알고리즘은 coverage (사용자 재료 수와 무관한 레시피 기준 매칭률)
         """
         response = self.client.get(self.url, {
             'ingredients': '돼지고기'
@@ -296,7 +340,7 @@ class RecipeRecommendationsAPITest(CategoryTestCase):
         self.assertEqual(response.status_code, 200)
         data = response.json()
 
-        self.assertEqual(data['algorithm'], 'jaccard')
+        self.assertEqual(data['algorithm'], 'coverage')
 
     def test_limit_range_validation(self):
         """
@@ -329,3 +373,64 @@ class RecipeRecommendationsAPITest(CategoryTestCase):
         recipe2_result = next((r for r in data['recipes'] if r['recipe_sno'] == 'RCP701'), None)
         self.assertIsNotNone(recipe2_result)
         self.assertEqual(recipe2_result['match_score'], 1.0)
+
+    def test_exact_total_option(self):
+        """
+        exact_total=false(기본)이면 상위 limit개에 들 수 없는 레시피를 건너뛰고 total은 추정값
+        """
+        params = {'ingredients': '돼지고기,배추', 'algorithm': 'coverage', 'limit': 1}
+
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([r['recipe_sno'] for r in data['recipes']], ['RCP701'])
+        self.assertFalse(data['total_is_exact'])
+
+        response = self.client.get(self.url, {**params, 'exact_total': 'true'})
+        data = response.json()
+        self.assertEqual([r['recipe_sno'] for r in data['recipes']], ['RCP701'])
+        self.assertTrue(data['total_is_exact'])
+        self.assertEqual(data['total'], 2)
+
+    def test_facet_filters_and_counts(self):
+        """패싯 필터(같은 필드 OR, 필드 간 AND)와 조건을 만족한 전체 레시피의 패싯 개수"""
+        for recipe, recipe_type, method in (
+            (self.recipe1, '찌개', '끓이기'), (self.recipe2, '반찬', '볶음'), (self.recipe3, '찌개', '끓이기')
+        ):
+            recipe.recipe_type = recipe_type
+            recipe.method = method
+            recipe.save()
+        params = {'ingredients': '돼지고기,배추,두부', 'algorithm': 'coverage', 'min_match_rate': 0.3}
+
+        response = self.client.get(self.url, {**params, 'facet_counts': 'true'})
+        data = response.json()
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['facets']['recipe_type'], {'찌개': 2, '반찬': 1})
+        self.assertEqual(data['facets']['difficulty'], {'아무나': 2, '초보환영': 1})
+
+        response = self.client.get(self.url, {**params, 'recipe_type': '찌개', 'facet_counts': 'true'})
+        data = response.json()
+        self.assertEqual({r['recipe_sno'] for r in data['recipes']}, {'RCP700', 'RCP702'})
+        self.assertEqual(data['facets']['recipe_type'], {'찌개': 2})
+        self.assertEqual(data['facets']['method'], {'끓이기': 2})
+
+        response = self.client.get(self.url, {**params, 'recipe_type': '찌개,반찬', 'method': '볶음'})
+        data = response.json()
+        self.assertEqual([r['recipe_sno'] for r in data['recipes']], ['RCP701'])
+        self.assertIsNone(data['facets'])
+
+    def test_facet_filters_with_cursor(self):
+        """다음 페이지 커서에도 패싯 조건 유지"""
+        for recipe in (self.recipe1, self.recipe3):
+            recipe.recipe_type = '찌개'
+            recipe.save()
+        params = {'ingredients': '돼지고기,배추,두부', 'algorithm': 'coverage', 'min_match_rate': 0.3, 'limit': 1}
+
+        first = self.client.get(self.url, {**params, 'recipe_type': '찌개'}).json()
+        self.assertIsNotNone(first['next_cursor'])
+        second = self.client.get(self.url, {'ingredients': '돼지고기', 'cursor': first['next_cursor'], 'limit': 1}).json()
+        self.assertEqual(
+            {first['recipes'][0]['recipe_sno'], second['recipes'][0]['recipe_sno']},
+            {'RCP700', 'RCP702'}
+        )
+        self.assertIsNone(second['next_cursor'])
@@ -0,0 +1,105 @@
+"""
+레시피 추천 결과 캐시 테스트
+"""
+
+from unittest import mock
+from django.test import SimpleTestCase
+from recipes.models import Recipe, Ingredient, NormalizedIngredient, RecommendationSettings
+from recipes.services.data_version import get_data_version
+from recipes.services.recipe_index import get_recipe_index
+from recipes.services.result_cache import RecommendationCache, recommendation_cache
+from .base import CategoryTestCase
+
+
+class RecommendationCacheTest(SimpleTestCase):
+    """LRU 캐시 단위 테스트"""
+
+    def test_lru_eviction(self):
+        """최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = RecommendationCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)  # a가 최근 사용
+        cache.set('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats(), {
+            'entries': 2, 'max_entries': 2, 'hits': 3, 'misses': 1, 'evictions': 1, 'hit_rate': 0.75,
+        })
+
+    def test_disabled(self):
+        """max_entries가 0이면 저장하지 않음"""
+        cache = RecommendationCache(max_entries=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.stats()['entries'], 0)
+
+    @mock.patch('recipes.services.result_cache.get_data_version', return_value='v1')
+    def test_key_is_canonical(self, _):
+        """재료 순서/중복과 무관한 키"""
+        self.assertEqual(
+            RecommendationCache.make_key('recommendations', [3, 1, 3], 20),
+            RecommendationCache.make_key('recommendations', {1, 3}, 20),
+        )
+        self.assertEqual(RecommendationCache.make_key('recommendations', [1], 20, version='v2')[0], 'v2')
+
+
+class RecommendationCacheAPITest(CategoryTestCase):
+    """추천 API 결과 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 데이터 준비"""
+        self.url = '/fridge2fork/v1/recipes/recommendations'
+        self.pork = NormalizedIngredient.objects.create(name='돼지고기', category=self.meat_category)
+        self.onion = NormalizedIngredient.objects.create(name='양파', category=self.vegetable_category)
+        self.recipe = Recipe.objects.create(
+            recipe_sno='R001', name='제육볶음', title='제육볶음',
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+        self._add(self.recipe, self.pork)
+        recommendation_cache.clear()
+
+    def _add(self, recipe, normalized):
+        Ingredient.objects.create(
+            recipe=recipe,
+            original_name=normalized.name,
+            normalized_name=normalized.name,
+            normalized_ingredient=normalized
+        )
+
+    def test_hit_for_same_ingredient_set(self):
+        """같은 재료 조합은 입력 순서가 달라도 캐시 적중"""
+        first = self.client.get(self.url, {'ingredients': '돼지고기,양파'}).json()
+        second = self.client.get(self.url, {'ingredients': '양파,돼지고기'}).json()
+
+        self.assertEqual(first, second)
+        stats = recommendation_cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_invalidated_on_data_change(self):
+        """레시피 데이터가 바뀌면 이전 결과를 사용하지 않음"""
+        params = {'ingredients': '양파', 'min_match_rate': 0.1}
+        self.assertEqual(self.client.get(self.url, params).json()['total'], 0)
+
+        self._add(self.recipe, self.onion)
+        self.assertEqual(self.client.get(self.url, params).json()['total'], 1)
+        self.assertEqual(recommendation_cache.stats()['hits'], 0)
+
+    def test_settings_change_keeps_data_caches(self):
+        """추천 설정 저장은 데이터 버전을 바꾸지 않음, 바뀐 기본값은 다른 키로 반영"""
+        self.client.get(self.url, {'ingredients': '돼지고기'})
+        index, version = get_recipe_index(), get_data_version()
+
+        settings = RecommendationSettings.get_settings()
+        settings.default_algorithm = 'cosine'
+        settings.save()
+        self.assertEqual(get_data_version(), version)
+        self.assertIs(get_recipe_index(), index)
+
+        self.assertEqual(self.client.get(self.url, {'ingredients': '돼지고기'}).json()['algorithm'], 'cosine')
+        self.assertEqual(recommendation_cache.stats()['hits'], 0)
+        # 이전 기본값(coverage)을 명시한 요청은 기존 결과 재사용
+        self.client.get(self.url, {'ingredients': '돼지고기', 'algorithm': 'coverage'})
+        self.assertEqual(recommendation_cache.stats()['hits'], 1)
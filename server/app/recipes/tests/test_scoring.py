@@ -0,0 +1,66 @@
+"""
+추천 점수 알고리즘 레지스트리 테스트
+"""
+
+from django.test import SimpleTestCase
+import numpy as np
+from recipes.models import RecommendationSettings
+from recipes.services.recipe_index import RecipeIndex
+from recipes.services.scoring import SCORERS, Scorer, ScoreInputs, get_scorer, register_scorer
+
+
+class ScorerRegistryTest(SimpleTestCase):
+    """점수 알고리즘 레지스트리 테스트"""
+
+    def setUp(self):
+        """레시피 2개: [1, 2, 3(조미료)], [1, 4]"""
+        self.index = RecipeIndex(
+            'v1', [10, 20],
+            [(10, 1, False), (10, 2, False), (10, 3, True), (20, 1, False), (20, 4, False)]
+        )
+
+    def test_all_setting_choices_registered(self):
+        """관리자 설정의 알고리즘 선택지는 모두 레지스트리에 등록됨"""
+        for value, _ in RecommendationSettings.ALGORITHM_CHOICES:
+            self.assertIn(value, SCORERS)
+
+    def test_scores(self):
+        """알고리즘별 점수 계산"""
+        user_ids = {1, 2, 3}
+
+        def score_of(algorithm, exclude_seasonings):
+            result = self.index.match(user_ids, exclude_seasonings, 0.0, algorithm=algorithm)
+            return {m.recipe_id: m.match_score for m in result.matches}
+
+        # coverage: 레시피10 2/2, 레시피20 1/2 (조미료 제외)
+        self.assertEqual(score_of('coverage', True), {10: 1.0, 20: 0.5})
+        # jaccard: 레시피20 = 1 / |{1,2} ∪ {1,4}| = 1/3
+        self.assertAlmostEqual(score_of('jaccard', True)[20], 1 / 3)
+        # cosine: 레시피10 (조미료 포함) = 3 / (√3 × √3)
+        self.assertAlmostEqual(score_of('cosine', False)[10], 1.0)
+        self.assertAlmostEqual(score_of('cosine', False)[20], 1 / (np.sqrt(3) * np.sqrt(2)))
+        # seasoning_bonus: 레시피10 = 2/2 + 1/1 × 0.05
+        self.assertAlmostEqual(score_of('seasoning_bonus', False)[10], 1.05)
+        self.assertAlmostEqual(score_of('seasoning_bonus', True)[20], 0.5)
+
+    def test_register_new_scorer(self):
+        """새 알고리즘은 등록만으로 인덱스에서 사용 가능"""
+
+        @register_scorer
+        class MatchedCountScorer(Scorer):
+            name = 'test_matched_count'
+
+            def score(self, inputs: ScoreInputs):
+                return inputs.matched.astype(float)
+
+        try:
+            self.assertIsInstance(get_scorer('test_matched_count'), MatchedCountScorer)
+            result = self.index.match({1, 4}, True, 0.0, algorithm='test_matched_count')
+            self.assertEqual([(m.recipe_id, m.match_score) for m in result.matches], [(20, 2.0), (10, 1.0)])
+        finally:
+            SCORERS.pop('test_matched_count')
+
+    def test_unknown_scorer(self):
+        """등록되지 않은 알고리즘"""
+        with self.assertRaises(KeyError):
+            self.index.match({1}, True, 0.0, algorithm='unknown')
@@ -0,0 +1,81 @@
+"""
+레시피 n-gram 전문 검색 테스트
+"""
+
+from django.contrib import admin
+from django.test import Client, SimpleTestCase
+from recipes.models import Recipe
+from recipes.text_search import ngram_query, ngram_tokens
+from .base import CategoryTestCase
+
+
+class NgramTokenTest(SimpleTestCase):
+    """토큰/검색어 변환 테스트"""
+
+    def test_tokens(self):
+        self.assertEqual(ngram_tokens('김치찌개'), '김:1 치:1 찌:1 개:1 김치:1 치찌:1 찌개:1')
+        self.assertEqual(ngram_tokens('Egg_밥', None, ''), 'e:1 g:1 eg:1 gg:1 밥:2')
+        self.assertIn('찌개:1,2', ngram_tokens('찌개', '김치찌개!').split())
+        self.assertEqual(ngram_tokens('', None), '')
+
+    def test_query(self):
+        self.assertIsNone(ngram_query(''))
+        self.assertIsNone(ngram_query('  !?  '))
+        self.assertEqual(ngram_query('김치찌개').source_expressions[0].value, '김치 & 치찌 & 찌개')
+        self.assertEqual(ngram_query('국 끓이기').source_expressions[0].value, '국 & 끓이 & 이기')
+
+
+class RecipeTextSearchTest(CategoryTestCase):
+    """목록/관리자 검색 테스트"""
+
+    def setUp(self):
+        self.client = Client()
+        self.url = '/fridge2fork/v1/recipes'
+        self.stew = self._recipe('R001', '김치찌개', '얼큰한 김치찌개 끓이는 법', '돼지고기를 넣은 찌개')
+        self.fried_rice = self._recipe('R002', '김치볶음밥', '김치볶음밥', '남은 김치찌개 국물로 만드는 볶음밥')
+        self.soup = self._recipe('R003', '된장국', '구수한 된장국', '')
+
+    def _recipe(self, recipe_sno, name, title, introduction):
+        return Recipe.objects.create(
+            recipe_sno=recipe_sno, name=name, title=title, introduction=introduction,
+            servings='2.0', difficulty='아무나', cooking_time='20.0'
+        )
+
+    def _search(self, search):
+        response = self.client.get(self.url, {'search': search})
+        self.assertEqual(response.status_code, 200)
+        return [recipe['recipe_sno'] for recipe in response.json()['recipes']]
+
+    def test_tokens_maintained_on_save(self):
+        self.soup.title = '시원한 콩나물국'
+        self.soup.save(update_fields=['title'])
+        self.assertEqual(self._search('콩나물'), ['R003'])
+
+    def test_partial_word_and_introduction(self):
+        """단어 일부/소개 문구로 검색, 제목/이름 일치가 더 많은 레시피가 먼저"""
+        self.assertEqual(self._search('찌개'), ['R001', 'R002'])
+        self.assertEqual(self._search('구수한 된장'), ['R003'])
+        self.assertEqual(self._search('국물'), ['R002'])
+        self.assertEqual(self._search('고추장'), [])
+
+    def test_search_without_terms(self):
+        """단어가 없는 검색어는 빈 결과 (전체 목록이 아님), 공백만 있으면 검색 조건 없음"""
+        response = self.client.get(self.url, {'search': '!!!'})
+        self.assertEqual(response.json()['recipes'], [])
+        self.assertEqual(response.json()['total'], 0)
+        self.assertEqual(len(self._search('   ')), 3)
+
+    def test_search_with_paging_total(self):
+        response = self.client.get(self.url, {'search': '김치', 'limit': 1})
+        data = response.json()
+        self.assertEqual(data['total'], 2)
+        self.assertEqual(len(data['recipes']), 1)
+
+    def test_admin_search(self):
+        model_admin = admin.site._registry[Recipe]
+        queryset, may_have_duplicates = model_admin.get_search_results(None, Recipe.objects.all(), '볶음밥')
+        self.assertFalse(may_have_duplicates)
+        self.assertEqual(list(queryset.values_list('recipe_sno', flat=True)), ['R002'])
+
+        queryset, _ = model_admin.get_search_results(None, Recipe.objects.all(), 'R003')
+        self.assertEqual(list(queryset.values_list('recipe_sno', flat=True)), ['R003'])
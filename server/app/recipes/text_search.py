@@ -0,0 +1,68 @@
+"""
+한국어 n-gram 전문 검색
+
+PostgreSQL 기본 텍스트 검색 설정에는 한국어 형태소 분석이 없으므로
+단어를 음절 unigram + bigram 토큰으로 나눠 tsvector로 색인
+(예: "김치찌개" → 김 치 찌 개 김치 치찌 찌개)
+
+검색어도 같은 방식으로 나눠 단어별 bigram을 모두 포함(AND)하는 tsquery로 변환
+(1음절 단어는 unigram) → 띄어쓰기/조사와 무관하게 부분 문자열 검색과 비슷한 결과를
+GIN 인덱스로 찾고 ts_rank로 정렬
+
+토큰 분리는 Python에서 하고 DB에는 tsvector/tsquery 리터럴로 전달
+(to_tsvector 파서는 DB 로케일에 따라 한글을 단어로 인식하지 못함)
+"""
+
+import re
+from typing import Dict, List, Optional
+from django.contrib.postgres.search import SearchQuery
+
+# tsvector 위치 최댓값 (PostgreSQL 제한)
+_MAX_POSITION = 16383
+
+# 밑줄을 제외한 문자/숫자 연속 구간 (리터럴에 따옴표/특수문자가 들어가지 않도록)
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_PATTERN.findall((text or '').lower())
+
+
+def ngram_tokens(*texts: str) -> str:
+    """
+    텍스트들의 unigram + bigram 토큰 → tsvector 리터럴 ('토큰:위치,위치 ...')
+
+    단어 위치를 모두 기록하므로 여러 번 등장한 토큰은 ts_rank 점수가 높음
+    """
+    positions: Dict[str, List[int]] = {}
+    position = 0
+    for text in texts:
+        for word in _words(text):
+            position = min(position + 1, _MAX_POSITION)
+            for size in (1, 2):
+                for start in range(len(word) - size + 1):
+                    token_positions = positions.setdefault(word[start:start + size], [])
+                    if not token_positions or token_positions[-1] != position:
+                        token_positions.append(position)
+    return ' '.join(
+        f"{token}:{','.join(map(str, token_positions))}"
+        for token, token_positions in positions.items()
+    )
+
+
+class NgramSearchQuery(SearchQuery):
+    """tsquery 리터럴을 파서 없이 그대로 사용하는 검색어"""
+    template = '%(expressions)s::tsquery'
+
+
+def ngram_query(text: str) -> Optional[NgramSearchQuery]:
+    """검색어 → 모든 단어의 bigram(1음절 단어는 unigram)을 포함하는 tsquery (검색어가 비었으면 None)"""
+    terms = {}
+    for word in _words(text):
+        if len(word) == 1:
+            terms[word] = None
+        for start in range(len(word) - 1):
+            terms[word[start:start + 2]] = None
+    if not terms:
+        return None
+    return NgramSearchQuery(' & '.join(terms))
@@ -49,6 +49,7 @@ SYSTEM_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = []
@@ -108,6 +109,25 @@ DATABASES = {
 }
 
 
+# Cache
+# 데이터 버전/추천 커서 스냅샷은 모든 워커(gunicorn --workers)와 파드가 공유해야 하므로
+# 프로세스 로컬 캐시(LocMemCache 등)는 사용 불가 (기동 시 ImproperlyConfigured)
+# 기본은 PostgreSQL 캐시 테이블 (manage.py createcachetable, entrypoint에서 생성)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': os.getenv('CACHE_TABLE', 'django_cache'),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.getenv('CACHE_MAX_ENTRIES', '10000')),
+        },
+    }
+}
+
+# 데이터 버전 재확인 간격 (초, 다른 워커/파드의 데이터 변경이 반영되기까지 최대 지연)
+DATA_VERSION_CHECK_INTERVAL = float(os.getenv('DATA_VERSION_CHECK_INTERVAL', '1.0'))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -165,6 +185,42 @@ STATICFILES_FINDERS = [
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# 레시피 추천 결과 캐시 (프로세스별 LRU 최대 항목 수, 0이면 비활성화)
+RECOMMENDATION_CACHE_MAX_ENTRIES = int(os.getenv('RECOMMENDATION_CACHE_MAX_ENTRIES', '1024'))
+
+# 레시피 추천 커서 페이지네이션 스냅샷 (순위 결과 최대 개수, 캐시 유지 시간(초))
+RECOMMENDATION_SNAPSHOT_MAX_RESULTS = int(os.getenv('RECOMMENDATION_SNAPSHOT_MAX_RESULTS', '1000'))
+RECOMMENDATION_SNAPSHOT_TTL = int(os.getenv('RECOMMENDATION_SNAPSHOT_TTL', '600'))
+
+# 추천 인덱스 mmap 스냅샷 경로 (빈 값이면 사용 안 함, manage.py write_recipe_index_snapshot으로 생성)
+# 워커는 공유 캐시(CACHES)의 데이터 버전과 스냅샷 버전이 같을 때만 사용
+# 설정하면 entrypoint.sh가 컨테이너마다 스냅샷 빌더(--watch)를 백그라운드로 실행
+RECIPE_INDEX_SNAPSHOT_PATH = os.getenv('RECIPE_INDEX_SNAPSHOT_PATH', '')
+# 스냅샷 빌더(write_recipe_index_snapshot --watch)의 데이터 버전 확인 주기 (초)
+RECIPE_INDEX_SNAPSHOT_INTERVAL = float(os.getenv('RECIPE_INDEX_SNAPSHOT_INTERVAL', '1'))
+# 데이터 버전이 바뀐 뒤 워커가 새 스냅샷을 기다리는 최대 시간 (초, 지나면 DB에서 직접 구축)
+RECIPE_INDEX_SNAPSHOT_WAIT = float(os.getenv('RECIPE_INDEX_SNAPSHOT_WAIT', '3'))
+# DB에서 구축한 인덱스를 새 스냅샷으로 교체할 수 있는지 확인하는 주기 (초)
+RECIPE_INDEX_SNAPSHOT_RECHECK_INTERVAL = float(os.getenv('RECIPE_INDEX_SNAPSHOT_RECHECK_INTERVAL', '1'))
+
+# 일괄 레시피 추천 (요청당 최대 재료 조합 수)
+RECOMMENDATION_BATCH_MAX_SETS = int(os.getenv('RECOMMENDATION_BATCH_MAX_SETS', '50'))
+
+# 레시피 카드 직렬화 캐시 (프로세스별 LRU 최대 레시피 수, 0이면 비활성화)
+RECIPE_CARD_CACHE_MAX_ENTRIES = int(os.getenv('RECIPE_CARD_CACHE_MAX_ENTRIES', '20000'))
+
+# NDJSON 스트리밍 내보내기 (서버 사이드 커서에서 한 번에 가져올 행 수)
+NDJSON_EXPORT_CHUNK_SIZE = int(os.getenv('NDJSON_EXPORT_CHUNK_SIZE', '2000'))
+
+# 냉장고별 레시피 매칭 수 벡터 (프로세스당 유지할 최대 냉장고 수)
+FRIDGE_SCORE_CACHE_MAX_ENTRIES = int(os.getenv('FRIDGE_SCORE_CACHE_MAX_ENTRIES', '1024'))
+
+# 재료명 유사도 매칭 (pg_trgm similarity 최솟값, 조회 시 pg_trgm.similarity_threshold를 이 값으로 설정)
+INGREDIENT_FUZZY_THRESHOLD = float(os.getenv('INGREDIENT_FUZZY_THRESHOLD', '0.3'))
+
+# 카탈로그 API(카테고리/재료 목록/레시피 상세/광고 설정) Cache-Control max-age (초, 이후 ETag로 재검증)
+CATALOG_CACHE_MAX_AGE = int(os.getenv('CATALOG_CACHE_MAX_AGE', '60'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -4,8 +4,9 @@
 
 from ninja import Router
 from django.conf import settings
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from asgiref.sync import sync_to_async
+from core.http_cache import make_etag, not_modified, set_cache_headers
 from .schemas import (
     SystemVersionResponseSchema,
     HealthCheckResponseSchema,
@@ -15,6 +16,7 @@ from .schemas import (
     VersionCheckResponseSchema
 )
 from .models import Feedback, FeedbackType, AdConfig, AppVersion, Platform, AdType
+from .data_version import get_ad_config_version
 from users.auth import decode_access_token
 from django.contrib.auth import get_user_model
 
@@ -162,7 +164,7 @@ def version_name_to_code(version_name: str) -> int:
 
 
 @router.get("/ads/config", response=AdConfigResponseSchema)
-async def get_ads_config(request, platform: str):
+async def get_ads_config(request, response: HttpResponse, platform: str):
     """
     광고 설정 조회 (Flutter용)
 
@@ -178,6 +180,8 @@ async def get_ads_config(request, platform: str):
             native_1: 네이티브 광고 1 ID,
             native_2: 네이티브 광고 2 ID
         }
+
+    ETag(광고 설정 버전 기반)가 If-None-Match와 일치하면 DB 조회 없이 304
     """
     # 플랫폼 검증
     platform_upper = platform.upper()
@@ -190,6 +194,12 @@ async def get_ads_config(request, platform: str):
             status=400
         )
 
+    etag = make_etag('system:ads_config', await sync_to_async(get_ad_config_version)(), platform_upper)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    set_cache_headers(response, etag)
+
     # 활성화된 광고 설정 조회
     ad_configs = await sync_to_async(list)(
         AdConfig.objects.filter(platform=platform_upper, is_active=True)
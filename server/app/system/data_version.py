@@ -0,0 +1,22 @@
+"""
+광고 설정 데이터 버전 관리
+
+광고 설정(AdConfig)이 변경될 때마다 버전 토큰을 갱신하여
+광고 설정 API의 ETag가 DB 조회 없이 바뀔 수 있도록 함
+"""
+
+from core.data_version import DataVersion
+
+AD_CONFIG_VERSION_CACHE_KEY = 'system:ad_config_version'
+
+_ad_config_version = DataVersion(AD_CONFIG_VERSION_CACHE_KEY)
+
+
+def get_ad_config_version() -> str:
+    """현재 광고 설정 버전 조회"""
+    return _ad_config_version.get()
+
+
+def bump_ad_config_version():
+    """광고 설정 버전 갱신 (즉시 한 번, 트랜잭션 커밋 후 한 번 더)"""
+    _ad_config_version.bump()
@@ -0,0 +1,20 @@
+"""
+시스템 데이터 변경 시그널
+
+광고 설정이 변경되면 광고 설정 버전을 갱신하여 광고 설정 API의 ETag를 바꿈
+
+주의: QuerySet.update() / bulk_create()는 시그널을 발생시키지 않으므로
+호출하는 쪽에서 bump_ad_config_version()을 직접 호출해야 함
+"""
+
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import AdConfig
+from .data_version import bump_ad_config_version
+
+
+@receiver(post_save, sender=AdConfig)
+@receiver(post_delete, sender=AdConfig)
+def on_ad_config_changed(sender, **kwargs):
+    """광고 설정 변경 시 광고 설정 버전 갱신"""
+    bump_ad_config_version()
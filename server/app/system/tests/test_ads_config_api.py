@@ -0,0 +1,48 @@
+"""
+광고 설정 API 테스트
+"""
+
+from django.test import TestCase, Client, override_settings
+from system.models import AdConfig, AdType, Platform
+
+
+@override_settings(DATA_VERSION_CHECK_INTERVAL=3600)
+class AdsConfigAPITest(TestCase):
+    """광고 설정 API 테스트"""
+
+    def setUp(self):
+        """테스트용 클라이언트/광고 설정 생성"""
+        self.client = Client()
+        self.url = "/fridge2fork/v1/system/ads/config"
+        self.banner = AdConfig.objects.create(
+            ad_type=AdType.BANNER_TOP, platform=Platform.ANDROID, ad_unit_id='ca-app-pub-1/1'
+        )
+
+    def test_get_ads_config(self):
+        """플랫폼별 활성 광고 ID, 잘못된 플랫폼은 400"""
+        response = self.client.get(self.url, {'platform': 'android'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['banner_top'], 'ca-app-pub-1/1')
+        self.assertIsNone(response.json()['native_1'])
+
+        self.assertEqual(self.client.get(self.url, {'platform': 'web'}).status_code, 400)
+
+    def test_not_modified(self):
+        """ETag가 일치하면 DB 조회 없이 304, 플랫폼별로 다른 ETag"""
+        etag = self.client.get(self.url, {'platform': 'ANDROID'})['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'platform': 'android'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.assertNotEqual(self.client.get(self.url, {'platform': 'IOS'})['ETag'], etag)
+
+    def test_etag_changes_with_ad_config(self):
+        """광고 설정 변경 시 새 ETag로 전체 응답"""
+        etag = self.client.get(self.url, {'platform': 'ANDROID'})['ETag']
+        self.banner.ad_unit_id = 'ca-app-pub-1/2'
+        self.banner.save()
+
+        response = self.client.get(self.url, {'platform': 'ANDROID'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.json()['banner_top'], 'ca-app-pub-1/2')
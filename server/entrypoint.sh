@@ -48,6 +48,13 @@ if [ "${RUN_MIGRATIONS:-true}" = "true" ]; then
     }
 
     echo "✅ Migrations completed successfully"
+
+    # 데이터 버전 공유 캐시 테이블 (CACHES, 이미 있으면 건너뜀)
+    echo "🔧 Creating cache table..."
+    uv run --frozen python manage.py createcachetable || {
+        echo "❌ createcachetable failed!"
+        exit 1
+    }
     cd /app
 fi
 
@@ -82,6 +89,14 @@ EOF
     cd /app
 fi
 
+# 추천 인덱스 스냅샷 빌더 (데이터 버전이 바뀔 때마다 스냅샷 재생성, 워커들이 mmap으로 공유)
+if [ -n "$RECIPE_INDEX_SNAPSHOT_PATH" ] && [ "${RUN_SNAPSHOT_BUILDER:-true}" = "true" ]; then
+    echo "🗂️  Starting recipe index snapshot builder..."
+    cd /app/app
+    uv run --frozen python manage.py write_recipe_index_snapshot --watch &
+    cd /app
+fi
+
 echo "🎉 Entrypoint script completed!"
 echo "🚀 Starting application..."
 